@@ -40,156 +40,214 @@ import subprocess
 import time
 import platform
 import logging
-import requests
-import tempfile
-import traceback
-from packaging import version
+import threading
 from datetime import datetime
 
 from PyQt6.QtWidgets import (
 	QApplication, QWidget, QVBoxLayout, QPushButton, QFileDialog, QLabel, 
-	QMessageBox, QCheckBox, QProgressBar, QComboBox, QTextEdit, QSizePolicy, QDialog, QProgressDialog, QHBoxLayout
+	QMessageBox, QCheckBox, QProgressBar, QComboBox, QTextEdit, QSizePolicy, QDialog, QProgressDialog, QHBoxLayout,
+	QListWidget, QSpinBox, QInputDialog
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
 from PyQt6.QtGui import QPixmap, QGuiApplication
 
-if platform.system() == "Windows":
-	import win32file
+from relocator.scanner import scan_tree
+from relocator.fastcopy import CLONE_SUPPORTED
+from relocator.journal import TransferJournal, find_resumable_journal
+from relocator.mover import MoveEngine, get_native_thread_count
+from relocator.symlinker import SymlinkScan, build_exclusions, create_symlink, remove_source
+from relocator.batch import BatchRunner, destination_for, expand_sources, plan_jobs
+from relocator.devices import list_drives
+from relocator.telemetry import ProgressThrottle, format_rate
 
 APP_VERSION = "3.1.3"
 
-def check_for_updates():
-	try:
-		logging.info("Checking for updates...")
-		logging.info(f"Current version: {APP_VERSION}")
-		api_url = "https://api.github.com/repos/ScriptedBits/GameVault-Relocator/releases/latest"
-		response = requests.get(api_url)
-		response.raise_for_status()
-
-		release_data = response.json()
-		latest_version = release_data["tag_name"].lstrip("v")
-		release_date_str = release_data["published_at"]
-		release_date = datetime.strptime(release_date_str, "%Y-%m-%dT%H:%M:%SZ")
-
-		asset_url = None
-		for asset in release_data.get("assets", []):
-			if asset["name"].endswith(".exe"):
-				asset_url = asset["browser_download_url"]
-				break
-
-		logging.info(f"Latest GitHub release version: {latest_version}")
-
-		if version.parse(latest_version) > version.parse(APP_VERSION) and asset_url:
-			logging.info(f"Update available: {APP_VERSION} → {latest_version}")
-			if getattr(sys, 'frozen', False):
-				app_version_date = datetime.fromtimestamp(os.path.getmtime(sys.executable))
+_http_session = None
+
+def get_http_session():
+	"""The requests.Session shared by the update check and the download, created on first use"""
+	global _http_session
+	if _http_session is None:
+		from relocator.download import make_session
+		_http_session = make_session(f"GameVault-Relocator/{APP_VERSION}")
+	return _http_session
+
+def fetch_latest_release():
+	"""(latest version, .exe asset url or None, its SHA-256 or None, release date) of the newest GitHub release"""
+	from relocator.download import parse_digest
+
+	api_url = "https://api.github.com/repos/ScriptedBits/GameVault-Relocator/releases/latest"
+	response = get_http_session().get(api_url, timeout=15)
+	response.raise_for_status()
+
+	release_data = response.json()
+	latest_version = release_data["tag_name"].lstrip("v")
+	release_date = datetime.strptime(release_data["published_at"], "%Y-%m-%dT%H:%M:%SZ")
+
+	asset_url = None
+	asset_sha256 = None
+	for asset in release_data.get("assets", []):
+		if asset["name"].endswith(".exe"):
+			asset_url = asset["browser_download_url"]
+			asset_sha256 = parse_digest(asset.get("digest"))
+			break
+	return latest_version, asset_url, asset_sha256, release_date
+
+class UpdateCheckThread(QThread):
+	"""Asks GitHub for the latest release off the UI thread, so a slow network doesn't hold up the window"""
+	update_available = pyqtSignal(str, str, str, int)	# latest version, .exe url, its SHA-256 or "", days newer than this build
+	failed = pyqtSignal(str, str)						# dialog title, message
+
+	def run(self):
+		try:
+			from packaging import version
+			import requests
+
+			logging.info("Checking for updates...")
+			logging.info(f"Current version: {APP_VERSION}")
+			try:
+				latest_version, asset_url, asset_sha256, release_date = fetch_latest_release()
+			except requests.RequestException as e:
+				logging.error(f"Update check failed: {e}")
+				self.failed.emit("Update Check Failed", f"An error occurred while checking for updates:\n{e}")
+				return
+
+			logging.info(f"Latest GitHub release version: {latest_version}")
+
+			if version.parse(latest_version) > version.parse(APP_VERSION) and asset_url:
+				logging.info(f"Update available: {APP_VERSION} → {latest_version}")
+				if getattr(sys, 'frozen', False):
+					app_version_date = datetime.fromtimestamp(os.path.getmtime(sys.executable))
+				else:
+					app_version_date = datetime.fromtimestamp(os.path.getmtime(__file__))
+				self.update_available.emit(
+					latest_version, asset_url, asset_sha256 or "", (release_date - app_version_date).days
+				)
+
+			elif not asset_url:
+				logging.warning("Update found, but no .exe asset available.")
+				self.failed.emit("Update Check", "A new version is available but no .exe was found.")
 			else:
-				app_version_date = datetime.fromtimestamp(os.path.getmtime(__file__))
-			days_between = (release_date - app_version_date).days
+				logging.info("No update available.")
 
-			reply = QMessageBox.question(
-				None,
-				"Update Available",
-				f"A new version of GameVault-Relocator is available!\n\n"
-				f"Current version: {APP_VERSION}\n"
-				f"Latest version: {latest_version}\n"
-				f"Released {days_between} days after your current version.\n\n"
-				"Would you like to download and install the update now?",
-				QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-			)
+		except Exception as e:
+			logging.exception("Unexpected error during update check.")
+			self.failed.emit("Update Error", f"Unexpected error:\n{str(e)}")
 
-			if reply == QMessageBox.StandardButton.Yes:
-				temp_dir = tempfile.gettempdir()
-				new_exe_path = os.path.join(temp_dir, f"GameVault-Relocator-{latest_version}.exe")
-				logging.info(f"Downloading update to temp path: {new_exe_path}")
-				logging.info(f"Downloading from: {asset_url}")
-
-				response = requests.get(asset_url, stream=True)
-				response.raise_for_status()
-
-				total_size = int(response.headers.get("content-length", 0))
-				block_size = 1024 * 1024
-
-				progress_dialog = QProgressDialog("Downloading update...", "Cancel", 0, 100)
-				progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
-				progress_dialog.setWindowTitle("Updating GameVault-Relocator")
-				progress_dialog.setMinimumWidth(400)
-				progress_dialog.setAutoClose(True)
-				progress_dialog.show()
-
-				downloaded = 0
-				with open(new_exe_path, 'wb') as f:
-					for chunk in response.iter_content(chunk_size=block_size):
-						if chunk:
-							f.write(chunk)
-							downloaded += len(chunk)
-							percent = int(downloaded * 100 / total_size)
-							progress_dialog.setValue(percent)
-							QApplication.processEvents()
-							if progress_dialog.wasCanceled():
-								logging.info("User cancelled update download.")
-								QMessageBox.information(None, "Update Cancelled", "The update has been cancelled.")
-								return
-
-				logging.info("Download complete. Launching updater script.")
-				run_updater_script(new_exe_path)
-
-		elif not asset_url:
-			logging.warning("Update found, but no .exe asset available.")
-			QMessageBox.warning(None, "Update Check", "A new version is available but no .exe was found.")
-		else:
-			logging.info("No update available.")
+class UpdateDownloadThread(QThread):
+	"""Downloads a release with relocator.download.download_file off the UI thread"""
+	progress = pyqtSignal(int)			# percent, or -1 while the size is unknown
+	progress_summary = pyqtSignal(str)
+	finished = pyqtSignal(str)			# the downloaded file, or "" if stopped
+	failed = pyqtSignal(str)
 
-	except requests.RequestException as e:
-		logging.error(f"Update check failed: {e}")
-		QMessageBox.warning(None, "Update Check Failed", f"An error occurred while checking for updates:\n{e}")
-	except Exception as e:
-		logging.exception("Unexpected error during update check.")
-		QMessageBox.critical(None, "Update Error", f"Unexpected error:\n{str(e)}")
+	def __init__(self, url, path, sha256=None):
+		super().__init__()
+		self.url = url
+		self.path = path
+		self.sha256 = sha256
+		self._stop_event = threading.Event()
+		self._latest = (0, 0)
+		self.progress_throttle = ProgressThrottle(self.send_progress, UI_REFRESH_INTERVAL)
 
-def download_and_replace_exe(asset_url, latest_version, parent=None):
-	try:
-		temp_dir = tempfile.gettempdir()
-		new_exe_path = os.path.join(temp_dir, f"GameVault-Relocator-{latest_version}.exe")
-		logging.info(f"Downloading update to: {new_exe_path}")
-
-		response = requests.get(asset_url, stream=True)
-		response.raise_for_status()
-
-		total_size = int(response.headers.get("content-length", 0))
-		block_size = 1024 * 1024
-
-		progress_dialog = QProgressDialog("Downloading update...", "Cancel", 0, 100, parent)
-		progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
-		progress_dialog.setWindowTitle("Updating GameVault-Relocator")
-		progress_dialog.setMinimumWidth(400)
-		progress_dialog.show()
-
-		downloaded = 0
-		with open(new_exe_path, 'wb') as f:
-			for chunk in response.iter_content(chunk_size=block_size):
-				if chunk:
-					f.write(chunk)
-					downloaded += len(chunk)
-					percent = int((downloaded * 100) / total_size) if total_size > 0 else 0
-					progress_dialog.setValue(percent)
-					QApplication.processEvents()
-					if progress_dialog.wasCanceled():
-						logging.info("User cancelled update download.")
-						QMessageBox.information(parent, "Update Cancelled", "The update has been cancelled.")
-						return
-
-		logging.info("Download complete. Launching updater...")
-		
-		# Small delay before launching updater
-		QTimer.singleShot(300, lambda: run_updater_script(new_exe_path))
-		QApplication.quit()
+	def send_progress(self):
+		downloaded, total = self._latest
+		self.progress.emit(int(downloaded * 100 / total) if total else -1)
+		size = f"{downloaded / (1024 ** 2):.1f} / {total / (1024 ** 2):.1f} MB" if total else f"{downloaded / (1024 ** 2):.1f} MB"
+		self.progress_summary.emit(f"Downloading update... {size}")
 
-	except Exception as e:
-		logging.error(f"Download or install failed: {e}")
-		QMessageBox.warning(parent, "Update Failed", f"Failed to download or install the update:\n{e}")
+	def on_progress(self, downloaded, total):
+		self._latest = (downloaded, total)
+		self.progress_throttle.update()
+
+	def run(self):
+		from relocator.download import download_file
+
+		try:
+			logging.info(f"Downloading update from {self.url} to {self.path}")
+			digest = download_file(
+				self.url, self.path, session=get_http_session(), expected_sha256=self.sha256,
+				progress_callback=self.on_progress, stop_event=self._stop_event
+			)
+			self.progress_throttle.flush()
+			self.finished.emit(self.path if digest else "")
+		except Exception as e:
+			logging.error(f"Update download failed: {e}")
+			self.failed.emit(str(e))
+
+	def stop(self):
+		self._stop_event.set()
+
+def offer_update(latest_version, asset_url, sha256, days_between, parent=None):
+	"""Ask whether to install latest_version and, if so, download it and hand over to the updater"""
+	reply = QMessageBox.question(
+		parent,
+		"Update Available",
+		f"A new version of GameVault-Relocator is available!\n\n"
+		f"Current version: {APP_VERSION}\n"
+		f"Latest version: {latest_version}\n"
+		f"Released {days_between} days after your current version.\n\n"
+		"Would you like to download and install the update now?",
+		QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+	)
+	if reply == QMessageBox.StandardButton.Yes:
+		download_and_replace_exe(asset_url, latest_version, sha256, parent)
+
+def download_and_replace_exe(asset_url, latest_version, sha256=None, parent=None):
+	"""
+	Download the update on an UpdateDownloadThread behind a progress dialog, then launch the
+	updater. A canceled or broken download is resumed from its .part file next time.
+	"""
+	import tempfile
+
+	new_exe_path = os.path.join(tempfile.gettempdir(), f"GameVault-Relocator-{latest_version}.exe")
+
+	progress_dialog = QProgressDialog("Downloading update...", "Cancel", 0, 100, parent)
+	progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+	progress_dialog.setWindowTitle("Updating GameVault-Relocator")
+	progress_dialog.setMinimumWidth(400)
+	progress_dialog.setAutoClose(False)
+	progress_dialog.setAutoReset(False)
+
+	worker = UpdateDownloadThread(asset_url, new_exe_path, sha256 or None)
+
+	def on_progress(percent):
+		if percent < 0:
+			progress_dialog.setRange(0, 0)		# no Content-Length: a busy indicator instead of a percentage
+		else:
+			progress_dialog.setRange(0, 100)
+			progress_dialog.setValue(percent)
+
+	def on_finished(path):
+		progress_dialog.close()
+		if path:
+			logging.info("Download complete. Launching updater...")
+			run_updater_script(path)
+		else:
+			logging.info("User cancelled update download.")
+			QMessageBox.information(parent, "Update Cancelled", "The update has been cancelled.")
+
+	def on_failed(message):
+		progress_dialog.close()
+		QMessageBox.warning(parent, "Update Failed", f"Failed to download or install the update:\n{message}")
+
+	worker.progress.connect(on_progress)
+	worker.progress_summary.connect(progress_dialog.setLabelText)
+	worker.finished.connect(on_finished)
+	worker.failed.connect(on_failed)
+	progress_dialog.canceled.connect(worker.stop)
+
+	# Keep both alive while the download runs; closeEvent stops the worker
+	if parent is not None:
+		parent.update_worker = worker
+		parent.update_dialog = progress_dialog
+	progress_dialog.show()
+	worker.start()
+	return worker
 
 def run_updater_script(new_exe_path):
+	import tempfile
+
 	current_exe = sys.executable
 	updater_filename = "updater.exe"
 	temp_dir = tempfile.gettempdir()
@@ -218,7 +276,8 @@ def run_updater_script(new_exe_path):
 		)
 
 		logging.info("Updater launched successfully. Exiting main application.")
-		sys.exit(0)
+		# Called from a signal handler now, so leave through the event loop rather than sys.exit()
+		QApplication.quit()
 
 	except Exception as e:
 		logging.exception("Failed to launch updater.")
@@ -230,6 +289,8 @@ def run_updater_script(new_exe_path):
 		)
 
 LOG_FILE = "GameVault-Relocator.log"
+SYMLINK_INDEX_FILE = os.path.join(os.path.dirname(os.path.abspath(LOG_FILE)), "GameVault-Relocator.symlinks")
+EXCLUSIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(LOG_FILE)), "GameVault-Relocator.exclusions.txt")
 logging.basicConfig(
 	filename=LOG_FILE,
 	level=logging.INFO,
@@ -240,6 +301,9 @@ IS_WINDOWS = platform.system() == "Windows"
 IS_LINUX = platform.system() == "Linux"
 IS_MAC = platform.system() == "Darwin"
 
+UI_REFRESH_INTERVAL = 0.1	# worker threads send progress to the GUI at most 10 times a second
+PREVIEW_SCAN_MAX_AGE = 600	# seconds a preview's scan is reused by the move started after it
+
 def is_admin():
 	if IS_WINDOWS:
 		try:
@@ -266,507 +330,401 @@ if not is_admin():
 
 	sys.exit()
 
-def get_robocopy_thread_count():
-	try:
-		return min(os.cpu_count() or 4, 32)
-	except:
-		return 4
+def get_log_dir():
+	"""Folder for per-move logs and journals: next to the .exe when frozen, else the working dir"""
+	if getattr(sys, 'frozen', False):
+		return os.path.dirname(sys.executable)
+	return os.path.abspath(".")
 
-def get_available_drives(exclude_scan=False):
-	drives = [] if exclude_scan else ["Scan drive"]
-	
-	if IS_WINDOWS:
-		for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-			drive = f"{letter}:/"
-			try:
-				drive_type = win32file.GetDriveType(drive)
-				if os.path.exists(drive):
-					if drive_type == win32file.DRIVE_REMOTE:
-						drives.append(f"{drive} (Network)")
-					elif drive_type == win32file.DRIVE_FIXED:
-						drives.append(drive)
-					else:
-						drives.append(drive)
-			except Exception as e:
-				logging.warning(f"Skipping drive {drive}: {e}")
-	else:
+class DriveListThread(QThread):
+	"""Lists drives with relocator.devices.list_drives off the UI thread; sleeping disks can take seconds"""
+	finished = pyqtSignal(list)
+
+	def run(self):
 		try:
-			import psutil
-			partitions = psutil.disk_partitions(all=False)
-			for p in partitions:
-				if os.path.ismount(p.mountpoint) and p.fstype:
-					drives.append(p.mountpoint)
+			drives = list_drives()
 		except Exception as e:
-			logging.warning(f"Fallback: Could not list drives with psutil: {e}")
-			for base in ["/mnt", "/media", "/Volumes"]:
-				if os.path.exists(base):
-					for item in os.listdir(base):
-						full_path = os.path.join(base, item)
-						if os.path.ismount(full_path):
-							drives.append(full_path)
-	return drives
+			logging.warning(f"Could not list drives: {e}")
+			drives = []
+		self.finished.emit(drives)
 
 class MoveThread(QThread):
+	"""Runs a relocator.mover.MoveEngine off the UI thread and relays its progress as signals"""
 	progress = pyqtSignal(int)
 	finished = pyqtSignal(str)
 	progress_summary = pyqtSignal(str)
+	telemetry = pyqtSignal(dict)	# TransferTelemetry.snapshot(), every MoveEngine.TELEMETRY_INTERVAL seconds
 
-	def __init__(self, source, destination, use_robocopy, preview_mode=False, 
-				 total_files=0, total_bytes=0):
+	def __init__(self, source, destination, use_robocopy, preview_mode=False, **options):
 		super().__init__()
-		self.source = source
-		self.destination = destination
-		self.use_robocopy = use_robocopy
-		self.preview_mode = preview_mode
-		self.total_files = total_files
-		self.total_bytes = total_bytes
-		self._stop_requested = False
-		self.robocopy_process = None
-		self.rsync_process = None
-
-	def count_total_files(self, path):
-		"""Fallback if total_files was not provided"""
-		if hasattr(self, 'total_files') and self.total_files > 0:
-			return self.total_files
-		total_files = sum(len(files) for _, _, files in os.walk(path))
-		return total_files
-
-	def move_with_retries(self, src, dest, retries=5, delay=2):
-		for attempt in range(1, retries + 1):
-			try:
-				shutil.move(src, dest)
-				logging.info(f"Moved: {src} -> {dest}")
-				return True
-			except PermissionError:
-				logging.warning(f"Attempt {attempt}: File in use - {src}")
-				time.sleep(delay)
-			except Exception as e:
-				logging.error(f"Error moving file {src}: {e}")
-				return False
-		return False
-
-	def remove_empty_dirs(self, path, retries=3, delay=2):
-		for attempt in range(1, retries + 1):
-			try:
-				for root, dirs, _ in os.walk(path, topdown=False):
-					for dir in dirs:
-						dir_path = os.path.join(root, dir)
-						if not os.listdir(dir_path):
-							os.rmdir(dir_path)
-							logging.info(f"Removed empty dir: {dir_path}")
-				return True
-			except Exception as e:
-				logging.warning(f"Attempt {attempt}: Failed to remove empty dirs in {path}: {e}")
-				time.sleep(delay)
-		logging.error(f"Final attempt failed: Could not remove {path}")
-		return False
+		self.engine = MoveEngine(
+			source, destination, use_robocopy, preview_mode,
+			log_dir=get_log_dir(),
+			progress_interval=UI_REFRESH_INTERVAL,
+			on_progress=self.progress.emit,
+			on_summary=self.progress_summary.emit,
+			on_telemetry=self.telemetry.emit,
+			**options
+		)
 
 	def run(self):
-		try:
-			# Use pre-counted value if available
-			if self.total_files > 0:
-				total_files = self.total_files
-			else:
-				total_files = self.count_total_files(self.source)
-
-			if total_files == 0:
-				self.progress.emit(100)
-				self.finished.emit("No files found in source directory.")
-				return
+		self.finished.emit(self.engine.run())
 
-			moved_files = 0
-			moved_bytes = 0
-			start_time = time.time()
-			log_file = None
-
-			if getattr(sys, 'frozen', False):
-				log_dir = os.path.dirname(sys.executable)
-			else:
-				log_dir = os.path.abspath(".")
-
-			os.makedirs(log_dir, exist_ok=True)
-			timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-
-			if self.preview_mode:
-				total_files = self.total_files if self.total_files > 0 else 0
-				total_size_gb = self.total_bytes / (1024 ** 3) if getattr(self, 'total_bytes', 0) > 0 else 0
-				
-				logging.info(f"Preview mode - Using total_bytes = {self.total_bytes:,} → {total_size_gb:.2f} GB")
-
-				self.finished.emit(
-					f"[PREVIEW MODE - No files were moved]\n\n"
-					f"Would move {total_files:,} files from:\n"
-					f"{self.source}\n"
-					f"to\n"
-					f"{self.destination}\n\n"
-					f"Total size: {total_size_gb:.2f} GB"
-				)
-				return
-
-			# ====================== ROBOCOPY (Primary Path) ======================
-			if IS_WINDOWS and self.use_robocopy:
-				log_file = os.path.join(log_dir, f"robocopy_{timestamp}.log")
-				thread_count = get_robocopy_thread_count()
-				logging.info(f"Using Robocopy with {thread_count} threads")
-
-				robocopy_command = [
-					"robocopy", self.source, self.destination,
-					"/E", "/MOVE", "/NP", "/R:3", "/W:2",
-					f"/MT:{thread_count}",
-					f"/LOG:{log_file}"
-				]
-
-				si = subprocess.STARTUPINFO()
-				si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-				si.wShowWindow = subprocess.SW_HIDE
-
-				self.robocopy_process = subprocess.Popen(
-					robocopy_command,
-					stdout=subprocess.DEVNULL,
-					stderr=subprocess.DEVNULL,
-					startupinfo=si
-				)
-
-				time.sleep(1.0)
-
-				while self.robocopy_process.poll() is None:
-					if self._stop_requested:
-						self.robocopy_process.terminate()
-						self.finished.emit("Transfer canceled by user.")
-						return
-
-					moved_files = 0
-					try:
-						if os.path.exists(log_file):
-							with open(log_file, "r", encoding="mbcs", errors="replace") as f:
-								content = f.read()
-								moved_files = content.count("New File")
-					except Exception:
-						pass
-
-					progress = min(99, int((moved_files / total_files) * 100)) if total_files > 0 else 0
-					
-					# Show remaining size
-					remaining_gb = ((total_files - moved_files) / total_files * self.total_bytes) / (1024**3) if total_files > 0 else 0
-
-					self.progress.emit(progress)
-					self.progress_summary.emit(
-						f"Remaining: {total_files - moved_files:,} files | {remaining_gb:.2f} GB"
-					)
-
-					time.sleep(0.7)
-
-				self.robocopy_process.wait()
-				time.sleep(0.5)	 # Give Robocopy time to finish writing the log
-
-				if self._stop_requested:
-					self.finished.emit("Transfer canceled by user.")
-					return
-
-				# Clean up source if empty (Robocopy specific)
-				if os.path.exists(self.source):
-					try:
-						remaining = any(os.path.isfile(os.path.join(r, f)) 
-										for r, _, fs in os.walk(self.source) for f in fs)
-						if not remaining:
-							os.system(f'rmdir /S /Q "{self.source}"')
-							logging.info(f"Source directory removed: {self.source}")
-					except Exception as e:
-						logging.warning(f"Could not remove source: {e}")
-
-			# ====================== NATIVE PYTHON MOVE (Fallback) ======================
-			else:
-				log_file = os.path.join(log_dir, f"move_{timestamp}.log")
-				moved_files = 0
-				moved_bytes = 0
-
-				for root, dirs, files in os.walk(self.source, topdown=False):
-					if self._stop_requested:
-						self.finished.emit("Transfer canceled by user.")
-						return
-
-					for file in files:
-						src_file = os.path.join(root, file)
-						dest_file = src_file.replace(self.source, self.destination, 1)
-						os.makedirs(os.path.dirname(dest_file), exist_ok=True)
-
-						try:
-							file_size = os.path.getsize(src_file) if os.path.exists(src_file) else 0
-							if self.move_with_retries(src_file, dest_file):
-								moved_files += 1
-								moved_bytes += file_size
-						except Exception as e:
-							logging.error(f"Error moving {src_file}: {e}")
-
-						progress = int((moved_files / total_files) * 100)
-						remaining_gb = (self.total_bytes - moved_bytes) / (1024**3)
-
-						self.progress_summary.emit(
-							f"Remaining: {total_files - moved_files:,} files | {remaining_gb:.2f} GB"
-						)
-						self.progress.emit(progress)
-
-				if not self.remove_empty_dirs(self.source):
-					logging.error(f"Could not remove empty directories in {self.source}")
-
-			# ====================== FINAL SUMMARY ======================
-			elapsed_time = time.time() - start_time
-
-			# Improved final file count for Robocopy
-			if IS_WINDOWS and self.use_robocopy and log_file and os.path.exists(log_file):
-				try:
-					with open(log_file, "r", encoding="mbcs", errors="replace") as f:
-						content = f.read()
-					moved_files = content.count("New File")
-				except Exception:
-					moved_files = moved_files  # fallback to what we have
-
-			# Calculate accurate total size from destination
-			try:
-				total_bytes_moved = sum(
-					os.path.getsize(os.path.join(root, f))
-					for root, _, files in os.walk(self.destination)
-					for f in files
-				)
-			except Exception:
-				total_bytes_moved = 0
-
-			moved_gb = total_bytes_moved / (1024 ** 3)
-
-			self.progress.emit(100)
-
-			# Nice final message
-			if moved_files == total_files:
-				status_msg = "All files successfully transferred ✅"
-			else:
-				status_msg = f"Files moved: {moved_files} / {total_files}"
-
-			self.finished.emit(
-				f"Move completed successfully to:\n{self.destination}\n\n"
-				f"{status_msg}\n"
-				f"Total size  : {moved_gb:.2f} GB\n"
-				f"Time taken  : {elapsed_time:.2f} seconds\n"
-				f"Log file	  : {log_file}"
-			)
-
-		except Exception as e:
-			logging.exception("Error in MoveThread.run()")
-			self.finished.emit(f"Unexpected error during transfer:\n{str(e)}")
-			
 	def stop(self):
-		self._stop_requested = True
-		if self.robocopy_process and self.robocopy_process.poll() is None:
-			self.robocopy_process.terminate()
-		if self.rsync_process and self.rsync_process.poll() is None:
-			self.rsync_process.terminate()
+		self.engine.stop()
 
 class CountFilesThread(QThread):
+	"""Runs relocator.scanner.scan_tree off the UI thread and relays its progress as signals"""
 	progress = pyqtSignal(str)
 	finished = pyqtSignal(int, float)	# total_files, total_gb
 
-	def __init__(self, path):
+	def __init__(self, path, scan_threads=None):
 		super().__init__()
 		self.path = path
+		self.scan_threads = scan_threads
+		self.manifest = None
 
 	def run(self):
 		total_files = 0
 		total_bytes = 0
-		last_update_time = time.time()
 
-		skip_dirs = {'$recycle.bin', 'system volume information', 'windowsapps', 
-					'temporary internet files', 'inetcache'}
+		def send_progress(files_so_far, bytes_so_far):
+			size_gb = bytes_so_far / (1024 ** 3)
+			self.progress.emit(f"Counting... {files_so_far:,} files ({size_gb:.2f} GB)")
 
-		try:
-			logging.info(f"Starting count on: {self.path}")
-
-			for root, dirs, files in os.walk(self.path, followlinks=False, topdown=True):
-				dirs[:] = [d for d in dirs if d.lower() not in skip_dirs]
-
-				for file in files:
-					total_files += 1
-					filepath = os.path.join(root, file)
-					try:
-						total_bytes += os.path.getsize(filepath)
-					except:
-						pass
-
-					# Live progress
-					current_time = time.time()
-					if (total_files < 10000) or (current_time - last_update_time > 0.25):
-						size_gb = total_bytes / (1024 ** 3)
-						self.progress.emit(f"Counting... {total_files:,} files ({size_gb:.2f} GB)")
-						last_update_time = current_time
-						time.sleep(0.005)
+		# Live progress, coalesced to the UI refresh rate
+		on_file = ProgressThrottle(send_progress, UI_REFRESH_INTERVAL).update
 
+		try:
+			# Always a fresh scan: this manifest decides what the move copies and deletes
+			self.manifest = scan_tree(self.path, self.scan_threads, progress_callback=on_file)
+			total_files = self.manifest.total_files
+			total_bytes = self.manifest.total_bytes
 			final_gb = total_bytes / (1024 ** 3)
-			logging.info(f"Counting finished - Files: {total_files:,} | Size: {final_gb:.2f} GB")
-
 			self.progress.emit(f"✅ Complete — {total_files:,} files ({final_gb:.2f} GB)")
 
 		except Exception as e:
 			logging.error(f"Critical counting error: {e}")
 			self.progress.emit("Counting interrupted due to error.")
+			final_gb = total_bytes / (1024 ** 3)
 
 		self.finished.emit(total_files, final_gb)
 
+class BatchMoveThread(QThread):
+	"""Runs a relocator.batch.BatchRunner off the UI thread and relays job updates as signals"""
+	job_status = pyqtSignal(int, str, str)	# job index, status, short message
+	progress = pyqtSignal(int)
+	progress_summary = pyqtSignal(str)
+	finished = pyqtSignal(str)
+
+	def __init__(self, jobs, use_robocopy=False, preview_mode=False, clone=False, precopy=False, per_device=1):
+		super().__init__()
+		self.jobs = jobs
+		self.preview_mode = preview_mode
+		self.precopy = precopy
+		self.runner = BatchRunner(
+			jobs, per_device,
+			log_dir=get_log_dir(),
+			progress_interval=UI_REFRESH_INTERVAL,
+			on_update=self.on_job_update,
+			on_job_progress=self.on_job_progress,
+			use_robocopy=use_robocopy,
+			preview_mode=preview_mode,
+			clone=clone,
+			precopy=precopy
+		)
+		self.progress_throttle = ProgressThrottle(self.send_progress, UI_REFRESH_INTERVAL)
+
+	def send_progress(self):
+		percent, finished, running = self.runner.overall_progress()
+		self.progress.emit(percent)
+		self.progress_summary.emit(f"Jobs: {finished:,} / {len(self.jobs):,} finished | {running} running")
+
+	def on_job_update(self, index, job):
+		self.job_status.emit(index, job.status, job.message)
+		self.progress_throttle.update(force=job.status != "running")
+
+	def on_job_progress(self, index, value):
+		self.progress_throttle.update()
+
+	def run(self):
+		try:
+			start_time = time.time()
+			self.runner.run()
+			self.progress_throttle.update(force=True)
+
+			counts = {}
+			for job in self.jobs:
+				counts[job.status] = counts.get(job.status, 0) + 1
+			summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+			logging.info(f"Batch finished in {time.time() - start_time:.1f} s: {summary}")
+			self.finished.emit(
+				f"Batch finished in {time.time() - start_time:.1f} seconds.\n\n"
+				f"Jobs: {summary}"
+			)
+		except Exception as e:
+			logging.exception("Error in BatchMoveThread.run()")
+			self.finished.emit(f"Unexpected error during batch:\n{str(e)}")
+
+	def stop(self):
+		self.runner.stop()
+
 class SymlinkCheckerThread(QThread):
-	progress = pyqtSignal(str)
+	"""Runs a relocator.symlinker.SymlinkScan off the UI thread and relays what it finds as signals"""
+	progress = pyqtSignal(str)	# newly found entries only, one per line, to append to the results
 	status = pyqtSignal(str)
-	finished = pyqtSignal(str)
+	finished = pyqtSignal(str)	# a summary once entries were sent, else the full message
 
 	def __init__(self, path):
 		super().__init__()
 		self.path = path
-		self.excluded_dirs = {
-			# Legacy / compatibility junctions
-			'documents and settings', 'all users', 'default user',
-			'application data', 'local settings', 'my documents',
-			'nethood', 'printhood', 'recent', 'sendto', 'start menu', 'templates',
-
-			# AppData legacy redirects
-			'appdata/local/application data',
-			'appdata/local/history',
-			'appdata/local/temporary internet files',
-			'appdata/local/microsoft/windows/inetcache',
-			'appdata/local/microsoft/windows/inetcookies',
-
-			# Shell folder redirects
-			'my music', 'my pictures', 'my videos',
-
-			# ProgramData public folders
-			'programdata/desktop',
-			'programdata/documents',
-
-			# Internet Explorer / legacy
-			'cookies',
-			'content.ie5',
-			'low/content.ie5',
-
-			# Office / ClickToRun
-			'clicktorun',
-			'vfs/programfiles',
-			'vfs/programfilescommonx64',
-			'vfs/programfilesx86',
-			'appvisvsubsystems',
-			'c2r32.dll',
-			'c2r64.dll',
-
-			# NVIDIA
-			'nvcontainer/plugins',
-
-			# System protected
-			'$recycle.bin',
-			'system volume information',
-
-			# WindowsApps
-			'windowsapps',
-
-			# Unix-like
-			'proc', 'sys', 'dev', 'tmp',
-
-			# New additions for remaining noise
-			'nethood',
-			'printhood',
-			
-			'temporary internet files',
-			'inetcache',  # broader catch for INetCache redirects
-		}
+		# User additions, one per line, in GameVault-Relocator.exclusions.txt next to the log
+		self.scan = SymlinkScan(
+			path, build_exclusions(EXCLUSIONS_FILE),
+			index_file=SYMLINK_INDEX_FILE,
+			workers=get_native_thread_count()
+		)
+
 	def run(self):
 		try:
-			output_lines = []
-			logging.info(f"Starting symlink scan on path: {self.path}")
-
-			if IS_WINDOWS:
-				path_clean = self.path.rstrip('\\/')
-				path_quoted = f'"{path_clean}\\"'
-				cmd = f'dir {path_quoted} /AL /S /B'
-				process = subprocess.Popen(
-					cmd,
-					shell=True,
-					stdout=subprocess.PIPE,
-					stderr=subprocess.PIPE,
-					text=True,
-					encoding='utf-8',
-					errors='ignore'
-				)
+			new_lines = []
 
-				for line in process.stdout:
-					line = line.strip()
-					if not line:
-						continue
-
-					# Normalize line: lowercase + forward slashes + no trailing slash
-					norm_line = line.lower().replace('\\', '/').rstrip('/')
-
-					# Normalize exclusions on-the-fly and check
-					if any(
-						excl.lower().replace('\\', '/') in norm_line
-						for excl in self.excluded_dirs
-					):
-						continue
-
-					# Skip WindowsApps
-					if '/microsoft/windowsapps' in norm_line:
-						continue
-
-					# Build info
-					symlink_info = f"{line} → (processing error)"
-
-					try:
-						target = os.readlink(line)
-						if target.startswith(r"\\?\\") or target.startswith("\\\\?\\"):
-							target = target[4:]
-						symlink_info = f"{line} → {target}"
-					except ValueError:
-						symlink_info = f"{line} → (Windows junction or reparse point)"
-					except OSError as e:
-						symlink_info = f"{line} → (broken or inaccessible: {e})"
-					except Exception as e:
-						symlink_info = f"{line} → (unexpected error: {str(e)})"
-
-					# Deduplicate + log + update UI **only if new**
-					if symlink_info not in output_lines:
-						output_lines.append(symlink_info)
-						logging.info(f"Found symlink: {symlink_info}")
-						self.progress.emit("\n".join(output_lines))
-
-				stderr = process.stderr.read()
-				process.wait()
-
-				if process.returncode != 0:
-					stderr_clean = stderr.strip()
-					if "File Not Found" in stderr_clean or not stderr_clean:
-						logging.info("No symlinks or junctions found on this drive.")
-						self.finished.emit("No symlinks or junctions found.")
-						return
-					else:
-						logging.error(f"Symlink scan error (exit code {process.returncode}): {stderr_clean}")
-						self.finished.emit(f"Error scanning symlinks:\n\n{stderr_clean}")
-						return
-
-			# Fallback
-			if output_lines:
-				result = "\n".join(output_lines) or "No symlinks or junctions found."
-				self.finished.emit(result)
-				return
+			def send_new_lines():
+				if new_lines:
+					self.progress.emit("\n".join(new_lines))
+					new_lines.clear()
 
-			logging.info("No results from system command — falling back to Python os.walk scan")
-			for root, dirs, files in os.walk(self.path, followlinks=False, topdown=True):
-				if any(excluded_dir.lower() in root.lower() for excluded_dir in self.excluded_dirs):
-					continue
-
-			result = "\n".join(output_lines) or "No symlinks or junctions found."
-			self.finished.emit(result)
+			# New entries go out in batches at the UI refresh rate, so a drive with
+			# 100k reparse points doesn't resend the whole list for every find
+			progress = ProgressThrottle(send_new_lines, UI_REFRESH_INTERVAL)
+			try:
+				for link in self.scan:
+					new_lines.append(str(link))
+					progress.update()
+			finally:
+				progress.flush()
+			self.finished.emit(self.scan.summary())
 
 		except Exception as e:
+			import traceback
 			error_msg = f"Unexpected error in symlink checker: {str(e)}\n{traceback.format_exc()}"
 			logging.error(error_msg)
 			self.finished.emit(f"Error during scan:\n{str(e)}")
 
 	def stop(self):
-		self._stop_requested = True
+		self.scan.stop()
 		self.terminate()
 
+class BatchQueueDialog(QDialog):
+	"""Queue of source folders moved with the main window's destination and options"""
+	STATUS_ICONS = {"queued": "⏳", "running": "🚚", "done": "✅", "failed": "❌", "canceled": "⏹️"}
+
+	def __init__(self, app):
+		super().__init__(app)
+		self.app = app
+		self.sources = []
+		self.moved = set()		# normcase'd sources a real (not preview or pre-copy) run already moved
+		self.jobs = []
+		self.job_rows = []		# list row of each job in self.jobs
+		self.real_run = False
+		self.worker = None
+		self.setWindowTitle("Batch Relocation Queue")
+		self.resize(760, 520)
+
+		layout = QVBoxLayout(self)
+		layout.addWidget(QLabel(
+			"Each folder is moved and replaced by a symlink as soon as its own move finishes. "
+			"Moves to different drives run at the same time."
+		))
+
+		self.job_list = QListWidget()
+		layout.addWidget(self.job_list)
+
+		edit_layout = QHBoxLayout()
+		self.add_folder_btn = QPushButton("📁 Add Folder...")
+		self.add_folder_btn.clicked.connect(self.add_folder)
+		self.add_pattern_btn = QPushButton("✳️ Add Pattern...")
+		self.add_pattern_btn.setToolTip("Add every folder matching a wildcard, e.g. D:/Emulation/*")
+		self.add_pattern_btn.clicked.connect(self.add_pattern)
+		self.remove_btn = QPushButton("Remove")
+		self.remove_btn.clicked.connect(self.remove_selected)
+		self.clear_btn = QPushButton("Clear")
+		self.clear_btn.clicked.connect(self.clear_queue)
+		for btn in (self.add_folder_btn, self.add_pattern_btn, self.remove_btn, self.clear_btn):
+			edit_layout.addWidget(btn)
+		layout.addLayout(edit_layout)
+
+		per_device_layout = QHBoxLayout()
+		per_device_layout.addWidget(QLabel("Moves at a time per destination drive:"))
+		self.per_device_spin = QSpinBox()
+		self.per_device_spin.setRange(1, 8)
+		self.per_device_spin.setValue(1)
+		self.per_device_spin.setToolTip("Keep 1 for hard drives; SSDs and NVMe drives can take 2-4")
+		per_device_layout.addWidget(self.per_device_spin)
+		per_device_layout.addStretch()
+		layout.addLayout(per_device_layout)
+
+		self.policy_label = QLabel("")
+		self.policy_label.setWordWrap(True)
+		layout.addWidget(self.policy_label)
+
+		self.progress_bar = QProgressBar()
+		layout.addWidget(self.progress_bar)
+		self.summary_label = QLabel("")
+		self.summary_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+		layout.addWidget(self.summary_label)
+
+		action_layout = QHBoxLayout()
+		self.start_btn = QPushButton("🚀 Start Batch")
+		self.start_btn.setMinimumHeight(38)
+		self.start_btn.clicked.connect(self.start_batch)
+		self.cancel_btn = QPushButton("⏹️ Cancel Batch")
+		self.cancel_btn.setMinimumHeight(38)
+		self.cancel_btn.clicked.connect(self.cancel_batch)
+		self.cancel_btn.hide()
+		self.close_btn = QPushButton("Close")
+		self.close_btn.setMinimumHeight(38)
+		self.close_btn.clicked.connect(self.close)
+		action_layout.addWidget(self.start_btn, stretch=1)
+		action_layout.addWidget(self.cancel_btn, stretch=1)
+		action_layout.addWidget(self.close_btn)
+		layout.addLayout(action_layout)
+
+		self.update_policy_label()
+
+	def update_policy_label(self):
+		destination = self.app.destination_path or "Not Selected"
+		if self.app.preserve_structure_cb.isChecked():
+			policy = f"Destination Root: {destination} (original folder structure preserved)"
+		else:
+			policy = f"Destination Folder: {destination} (each folder moved inside it)"
+		if self.app.preview_checkbox.isChecked():
+			policy += "<br><span style='color:#ff9800;'>Preview Only: nothing will be moved.</span>"
+		self.policy_label.setText(policy)
+
+	def add_sources(self, sources):
+		known = {os.path.normcase(source) for source in self.sources}
+		for source in sources:
+			if os.path.normcase(source) not in known:
+				known.add(os.path.normcase(source))
+				self.sources.append(source)
+				self.job_list.addItem(f"{self.STATUS_ICONS['queued']} {source}")
+
+	def add_folder(self):
+		folder = QFileDialog.getExistingDirectory(self, "Add Source Folder")
+		if folder:
+			self.add_sources(expand_sources([folder]))
+
+	def add_pattern(self):
+		pattern, ok = QInputDialog.getText(
+			self, "Add Folders by Pattern", "Folders to add (wildcards allowed, e.g. D:/Emulation/*):"
+		)
+		if not ok or not pattern.strip():
+			return
+		sources = expand_sources([pattern.strip()])
+		if not sources:
+			QMessageBox.information(self, "No Folders", f"No folders match:\n{pattern}")
+			return
+		self.add_sources(sources)
+
+	def remove_selected(self):
+		for item in self.job_list.selectedItems():
+			row = self.job_list.row(item)
+			self.job_list.takeItem(row)
+			self.moved.discard(os.path.normcase(self.sources.pop(row)))
+
+	def clear_queue(self):
+		self.sources = []
+		self.moved.clear()
+		self.job_list.clear()
+
+	def set_editing_enabled(self, enabled):
+		for widget in (self.add_folder_btn, self.add_pattern_btn, self.remove_btn,
+					   self.clear_btn, self.per_device_spin, self.start_btn, self.close_btn):
+			widget.setEnabled(enabled)
+
+	def start_batch(self):
+		self.update_policy_label()
+		if not self.sources:
+			QMessageBox.warning(self, "Empty Queue", "Add at least one source folder first.")
+			return
+		if not self.app.destination_path:
+			QMessageBox.warning(self, "Error", "Please select a destination in the main window first.")
+			return
+
+		# Folders an earlier run moved are symlinks now; leave their rows as they are
+		pending = [row for row, source in enumerate(self.sources) if os.path.normcase(source) not in self.moved]
+		if not pending:
+			QMessageBox.information(self, "Nothing to Move", "Every folder in the queue has already been moved.")
+			return
+
+		preview = self.app.preview_checkbox.isChecked()
+		precopy = self.app.precopy_checkbox.isChecked()
+		if not preview and not precopy:
+			reply = QMessageBox.warning(
+				self,
+				"Confirm Batch Move",
+				f"{len(pending)} folders will be moved, and each source folder will be "
+				"DELETED and replaced by a symlink once its files are moved.\n\nContinue?",
+				QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+				QMessageBox.StandardButton.No
+			)
+			if reply != QMessageBox.StandardButton.Yes:
+				return
+
+		self.real_run = not preview and not precopy
+		self.job_rows = pending
+		self.jobs = plan_jobs([self.sources[row] for row in pending], self.app.destination_path,
+							  self.app.preserve_structure_cb.isChecked())
+		for index, job in enumerate(self.jobs):
+			self.on_job_status(index, job.status, "")
+
+		self.worker = BatchMoveThread(
+			self.jobs,
+			use_robocopy=self.app.use_robocopy_checkbox.isChecked() if IS_WINDOWS else False,
+			preview_mode=preview,
+			clone=self.app.clone_checkbox.isChecked() if CLONE_SUPPORTED else False,
+			precopy=precopy,
+			per_device=self.per_device_spin.value()
+		)
+		self.worker.job_status.connect(self.on_job_status)
+		self.worker.progress.connect(self.progress_bar.setValue)
+		self.worker.progress_summary.connect(self.summary_label.setText)
+		self.worker.finished.connect(self.on_batch_finished)
+
+		self.progress_bar.setValue(0)
+		self.set_editing_enabled(False)
+		self.cancel_btn.setEnabled(True)
+		self.cancel_btn.show()
+		self.worker.start()
+
+	def on_job_status(self, index, status, message):
+		job = self.jobs[index]
+		if status == "done" and self.real_run:
+			self.moved.add(os.path.normcase(job.source))
+		text = f"{self.STATUS_ICONS.get(status, '')} {job.source} → {job.destination}"
+		if message:
+			text += f"  ({message})"
+		self.job_list.item(self.job_rows[index]).setText(text)
+
+	def cancel_batch(self):
+		if self.worker is not None and self.worker.isRunning():
+			self.cancel_btn.setEnabled(False)
+			self.summary_label.setText("Cancelling...")
+			self.worker.stop()
+
+	def on_batch_finished(self, message):
+		self.cancel_btn.hide()
+		self.set_editing_enabled(True)
+		QMessageBox.information(self, "Batch Complete", message)
+
+	def closeEvent(self, event):
+		if self.worker is not None and self.worker.isRunning():
+			QMessageBox.information(self, "Batch Running", "Cancel the batch before closing this window.")
+			event.ignore()
+			return
+		event.accept()
+
 class SymlinkMoverApp(QWidget):
 	def __init__(self):
 		super().__init__()
@@ -774,6 +732,8 @@ class SymlinkMoverApp(QWidget):
 			"Select a drive/folder and click <b>Check for Symlinks</b> to scan."
 		)
 		self.transfer_canceled = False
+		self.preview_scan = None	# (source, time.monotonic(), ScanManifest) of the last finished preview
+		self.move_manifest = None
 		self.source_path = None
 		self.destination_path = None
 
@@ -821,7 +781,7 @@ class SymlinkMoverApp(QWidget):
 		main_layout.addWidget(self.drive_label)
 
 		self.drive_combo = QComboBox()
-		self.drive_combo.addItems(get_available_drives(exclude_scan=True))
+		self.drive_combo.setPlaceholderText("Looking for drives...")
 		self.drive_combo.currentTextChanged.connect(self.on_drive_selected)
 		main_layout.addWidget(self.drive_combo)
 
@@ -843,6 +803,18 @@ class SymlinkMoverApp(QWidget):
 			self.use_robocopy_checkbox.setChecked(True)
 			options_layout.addWidget(self.use_robocopy_checkbox)
 
+		if CLONE_SUPPORTED:
+			self.clone_checkbox = QCheckBox("Clone when possible (btrfs/XFS)")
+			self.clone_checkbox.setToolTip("Share file extents with a reflink instead of copying data, when the filesystem supports it")
+			options_layout.addWidget(self.clone_checkbox)
+
+		self.precopy_checkbox = QCheckBox("Pre-copy only (keep source, sync later)")
+		self.precopy_checkbox.setToolTip(
+			"Copy everything now while the games stay playable. Run again without this option "
+			"to move only the files changed since, then create the symlink."
+		)
+		options_layout.addWidget(self.precopy_checkbox)
+
 		self.preview_checkbox = QCheckBox("Preview Only (Dry Run)")
 		self.preview_checkbox.stateChanged.connect(self.update_button_states)
 		options_layout.addWidget(self.preview_checkbox)
@@ -886,6 +858,12 @@ class SymlinkMoverApp(QWidget):
 
 		main_layout.addLayout(action_layout)
 
+		self.batch_btn = QPushButton("🗂️ Batch Queue (many folders)...")
+		self.batch_btn.setMinimumHeight(36)
+		self.batch_btn.setToolTip("Move many folders in one run, each replaced by a symlink when its move finishes")
+		self.batch_btn.clicked.connect(self.show_batch_queue)
+		main_layout.addWidget(self.batch_btn)
+
 		self.stop_btn = QPushButton("⏹️ Cancel Transfer")
 		self.stop_btn.setMinimumHeight(36)
 		self.stop_btn.setStyleSheet(
@@ -913,7 +891,7 @@ class SymlinkMoverApp(QWidget):
 		scan_layout = QHBoxLayout()
 		
 		self.drive_selection = QComboBox()
-		self.drive_selection.addItems(["Scan Specific Folder..."] + get_available_drives(exclude_scan=True))
+		self.drive_selection.addItems(["Scan Specific Folder..."])
 		scan_layout.addWidget(self.drive_selection, stretch=1)
 
 		self.check_symlinks_btn = QPushButton("🔍 Scan for Symlinks")
@@ -964,6 +942,11 @@ class SymlinkMoverApp(QWidget):
 
 		self.update_destination_label()
 		self.toggle_destination_selector(Qt.CheckState.Checked.value)
+
+		# Both drive lists fill in once the enumeration finishes
+		self.drive_thread = DriveListThread()
+		self.drive_thread.finished.connect(self.on_drives_listed)
+		self.drive_thread.start()
 		
 		# Initialize button states
 		self.update_button_states(self.preview_checkbox.checkState())
@@ -1021,6 +1004,25 @@ class SymlinkMoverApp(QWidget):
 			self.select_destination_btn.setText("Select Exact Destination Folder")
 			self.destination_label.setText("Exact Destination Folder: Not Selected")
 
+	def on_drives_listed(self, drives):
+		logging.info(f"Drives found: {', '.join(drives) or 'none'}")
+		self.drive_combo.blockSignals(True)
+		self.drive_combo.addItems(drives)
+		self.drive_combo.blockSignals(False)
+		self.drive_selection.addItems(drives)
+
+		# Same default as before the list was asynchronous: the first drive as destination root
+		if drives and self.preserve_structure_cb.isChecked() and not getattr(self, 'destination_path', None):
+			self.on_drive_selected(self.drive_combo.currentText())
+
+	def start_update_check(self):
+		self.update_thread = UpdateCheckThread()
+		self.update_thread.update_available.connect(
+			lambda latest_version, asset_url, sha256, days: offer_update(latest_version, asset_url, sha256, days, self)
+		)
+		self.update_thread.failed.connect(lambda title, message: QMessageBox.warning(self, title, message))
+		self.update_thread.start()
+
 	def on_drive_selected(self, text):
 		if self.preserve_structure_cb.isChecked():
 			parts = text.split()
@@ -1057,17 +1059,54 @@ class SymlinkMoverApp(QWidget):
 			self.source_label.setText(f"Source Directory: {folder}")
 
 
+	def get_destination_final_path(self):
+		return destination_for(self.source_path, self.destination_path, self.preserve_structure_cb.isChecked())
+
 	def start_process(self):
 		if not self.source_path or not self.destination_path:
 			QMessageBox.warning(self, "Error", "Please select both source and destination.")
 			return
 
+		# An earlier pre-copy turns this run into a delta pass (or extends the pre-copy)
+		self.precopy_journal = find_resumable_journal(
+			get_log_dir(), self.source_path, self.get_destination_final_path(), kind="precopy"
+		)
+		if self.precopy_journal:
+			logging.info(f"Found pre-copy journal, syncing changes only: {self.precopy_journal}")
+
+		# Offer to pick up an interrupted native move from its journal
+		self.resume_journal = None
+		use_robocopy = IS_WINDOWS and self.use_robocopy_checkbox.isChecked()
+		if not self.preview_checkbox.isChecked() and not self.precopy_checkbox.isChecked() and not use_robocopy:
+			journal_path = find_resumable_journal(get_log_dir(), self.source_path, self.get_destination_final_path())
+			if journal_path:
+				_, completed, _ = TransferJournal.load(journal_path)
+				reply = QMessageBox.question(
+					self,
+					"Resume Interrupted Move",
+					f"An unfinished move of this folder was found:\n\n{journal_path}\n\n"
+					f"{len(completed):,} files were already moved.\n\n"
+					"Resume it? Choose No to start a fresh move.",
+					QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+				)
+				if reply == QMessageBox.StandardButton.Yes:
+					self.resume_journal = journal_path
+					logging.info(f"User chose to resume move from journal: {journal_path}")
+
 		# Disable UI elements during preparation
 		self.start_btn.setEnabled(False)
 		self.select_source_btn.setEnabled(False)
 		self.select_destination_btn.setEnabled(False)
 		self.preview_checkbox.setEnabled(False)
 
+		# A move started right after previewing the same folder runs on the preview's scan
+		manifest = self.take_preview_scan()
+		if manifest is not None:
+			logging.info(f"Reusing the preview's scan of {self.source_path}: {manifest.total_files:,} files")
+			self.move_manifest = manifest
+			self.prepare_move(manifest.total_files, manifest.total_bytes / (1024 ** 3))
+			return
+
 		# Show counting dialog immediately
 		self.count_dialog = QProgressDialog(
 			"Scanning directory for files...\nThis may take a while on large folders.", 
@@ -1085,9 +1124,24 @@ class SymlinkMoverApp(QWidget):
 		self.count_thread.finished.connect(self.on_count_finished)
 		self.count_thread.start()
 
+	def take_preview_scan(self):
+		"""The manifest of a recent preview of this source, for a real move; None otherwise. Used once"""
+		preview_scan, self.preview_scan = self.preview_scan, None
+		if preview_scan is None or self.preview_checkbox.isChecked():
+			return None
+		source, finished_at, manifest = preview_scan
+		if os.path.normcase(source) != os.path.normcase(self.source_path) or manifest is None:
+			return None
+		if time.monotonic() - finished_at > PREVIEW_SCAN_MAX_AGE:
+			return None
+		return manifest
+
 	def on_count_finished(self, total_files, total_gb):
 		self.count_dialog.close()
-		
+		self.move_manifest = self.count_thread.manifest
+		self.prepare_move(total_files, total_gb)
+
+	def prepare_move(self, total_files, total_gb):
 		# Re-enable buttons
 		self.reset_buttons_after_prepare()
 
@@ -1112,13 +1166,7 @@ class SymlinkMoverApp(QWidget):
 
 	def start_actual_move(self, total_files, total_gb):
 		"""Start the actual file move (or preview) after counting"""
-		source_basename = os.path.basename(self.source_path)
-		
-		if self.preserve_structure_cb.isChecked():
-			source_rel = os.path.splitdrive(self.source_path)[1].lstrip(os.sep)
-			destination_final_path = os.path.join(self.destination_path, source_rel)
-		else:
-			destination_final_path = os.path.join(self.destination_path, source_basename)
+		destination_final_path = self.get_destination_final_path()
 
 		# Only create destination folder if NOT in preview mode
 		if not self.preview_checkbox.isChecked():
@@ -1128,24 +1176,51 @@ class SymlinkMoverApp(QWidget):
 		
 		logging.info(f"Passing to MoveThread - Files: {total_files:,} | GB: {total_gb:.2f}")
 
+		manifest = self.move_manifest
+		if manifest is not None:
+			total_bytes = manifest.total_bytes
+		else:
+			total_bytes = int(total_gb * (1024 ** 3))	  # Convert GB back to bytes
+
 		self.worker = MoveThread(
 			self.source_path,
 			destination_final_path,
 			self.use_robocopy_checkbox.isChecked() if IS_WINDOWS else False,
 			self.preview_checkbox.isChecked(),
 			total_files=total_files,
-			total_bytes=int(total_gb * (1024 ** 3))	  # Convert GB back to bytes
+			total_bytes=total_bytes,
+			manifest=manifest,
+			clone=self.clone_checkbox.isChecked() if CLONE_SUPPORTED else False,
+			resume_journal=getattr(self, 'resume_journal', None),
+			precopy=self.precopy_checkbox.isChecked(),
+			precopy_journal=getattr(self, 'precopy_journal', None)
 		)
 
+		self.progress_summary_text = ""
+		self.telemetry_text = ""
+
 		self.worker.progress.connect(self.progress_bar.setValue)
 		self.worker.finished.connect(self.on_move_finished)
-		self.worker.progress_summary.connect(self.progress_summary_label.setText)
+		self.worker.progress_summary.connect(self.on_progress_summary)
+		self.worker.telemetry.connect(self.on_move_telemetry)
 
 		self.worker.start()
 		self.stop_btn.show()
 		self.stop_btn.setEnabled(True)
 		self.preview_checkbox.setEnabled(False)
 		
+	def on_progress_summary(self, text):
+		self.progress_summary_text = text
+		self.update_progress_summary_label()
+
+	def on_move_telemetry(self, stats):
+		self.telemetry_text = format_rate(stats)
+		self.update_progress_summary_label()
+
+	def update_progress_summary_label(self):
+		lines = [line for line in (self.progress_summary_text, self.telemetry_text) if line]
+		self.progress_summary_label.setText("\n".join(lines))
+
 	def reset_buttons_after_prepare(self):
 		self.start_btn.setEnabled(True)
 		self.select_source_btn.setEnabled(True)
@@ -1181,6 +1256,34 @@ class SymlinkMoverApp(QWidget):
 				except:
 					pass
 
+		# Stop a running batch; each job's MoveThread stops with it
+		batch_dialog = getattr(self, 'batch_dialog', None)
+		if batch_dialog is not None and batch_dialog.worker is not None and batch_dialog.worker.isRunning():
+			try:
+				batch_dialog.worker.stop()
+				batch_dialog.worker.wait(5000)
+			except:
+				pass
+
+		# An update download keeps its .part file and resumes next time
+		update_worker = getattr(self, 'update_worker', None)
+		if update_worker is not None and update_worker.isRunning():
+			try:
+				update_worker.stop()
+				update_worker.wait(2000)
+			except:
+				pass
+
+		# Startup helpers still waiting on a slow network or drive
+		for name in ('update_thread', 'drive_thread'):
+			thread = getattr(self, name, None)
+			if thread is not None and thread.isRunning():
+				try:
+					thread.terminate()
+					thread.wait(1000)
+				except:
+					pass
+
 		# Extra safety - in case 'worker' was overwritten
 		if hasattr(self, 'worker') and hasattr(self.worker, 'isRunning') and self.worker.isRunning():
 			try:
@@ -1204,74 +1307,59 @@ class SymlinkMoverApp(QWidget):
 		
 		QMessageBox.information(self, "Process Complete", message)
 		
-		if self.transfer_canceled:
+		canceled, self.transfer_canceled = self.transfer_canceled, False
+		if canceled and not (self.worker.engine.completed and not self.preview_checkbox.isChecked()):
 			logging.info("Transfer was canceled. Skipping symlink creation.")
-			self.transfer_canceled = False
 			return
 
 		if self.preview_checkbox.isChecked():
 			logging.info("Preview mode enabled — skipping symlink creation.")
+			self.preview_scan = (self.source_path, time.monotonic(), self.worker.engine.manifest)
 			return
 
-		source_drive, source_rel = os.path.splitdrive(self.source_path)
-		source_basename = os.path.basename(self.source_path)
-		if self.preserve_structure_cb.isChecked():
-			source_relative_path = source_rel.lstrip(os.sep)
-			destination_final_path = os.path.join(self.destination_path, source_relative_path)
-		else:
-			destination_final_path = os.path.join(self.destination_path, source_basename)
-
-		logging.info(f"Attempting to create symlink: {self.source_path} -> {destination_final_path}")
+		if self.precopy_checkbox.isChecked():
+			logging.info("Pre-copy finished — source kept, skipping symlink creation.")
+			return
 
-		if os.path.exists(self.source_path):
-			logging.info(f"Source directory still exists, attempting to remove: {self.source_path}")
-			
-			try:
-				shutil.rmtree(self.source_path)
-				logging.info(f"Successfully removed source directory: {self.source_path}")
-			except Exception as e:
-				logging.error(f"Failed to remove source directory: {e}")
-				QMessageBox.critical(
-					self, "Error Removing Source Directory",
-					f"Could not remove the source directory:\n{self.source_path}\n\n"
-					"Please check if it's open in another program and try again."
-				)
-				return
+		if not self.worker.engine.completed:
+			# Some files are still only in the source; deleting it now would lose them
+			logging.warning("Not every file reached the destination — source kept, skipping symlink creation.")
+			QMessageBox.warning(
+				self, "Move Incomplete",
+				f"Not every file was moved, so the source was kept and no symlink was created:\n\n"
+				f"{self.source_path}\n\n"
+				"Check the log, then start the move again to finish it."
+			)
+			return
 
-		if IS_WINDOWS:
-			symlink_command = f'mklink /D "{self.source_path}" "{destination_final_path}"'
-		else:
-			symlink_command = f'ln -s "{destination_final_path}" "{self.source_path}"'
+		destination_final_path = self.get_destination_final_path()
+		logging.info(f"Attempting to create symlink: {self.source_path} -> {destination_final_path}")
 
 		try:
-			result = subprocess.run(symlink_command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-
-			if result.returncode == 0:
-				logging.info(f"Symlink successfully created: {self.source_path} -> {destination_final_path}")
-				if os.path.islink(self.source_path):
-					logging.info("Symlink verified.")
-				else:
-					logging.warning("Symlink creation reported success but was not verified.")
-					
-				QMessageBox.information(
-					self, "Symlink Created",
-					f"A symbolic link has been successfully created:\n\n"
-					f"Source: {self.source_path}\n"
-					f"Destination: {destination_final_path}"
-				)
-			else:
-				logging.error(f"Symlink creation failed: {result.stderr}")
-				QMessageBox.critical(
-					self, "Symlink Creation Failed",
-					f"Error creating symlink:\n\n{result.stderr}\n\n"
-					"Please check if you have the necessary permissions."
-				)
+			remove_source(self.source_path)
+		except OSError as e:
+			logging.error(f"Failed to remove source directory: {e}")
+			QMessageBox.critical(
+				self, "Error Removing Source Directory",
+				f"Could not remove the source directory:\n{self.source_path}\n\n{e}\n\n"
+				"Please check if it's open in another program and try again."
+			)
+			return
 
-		except Exception as e:
-			logging.error(f"Exception creating symlink: {str(e)}")
+		try:
+			create_symlink(self.source_path, destination_final_path)
+			QMessageBox.information(
+				self, "Symlink Created",
+				f"A symbolic link has been successfully created:\n\n"
+				f"Source: {self.source_path}\n"
+				f"Destination: {destination_final_path}"
+			)
+		except OSError as e:		# SymlinkFailed, or the shell could not be started
+			logging.error(f"Symlink creation failed: {e}")
 			QMessageBox.critical(
-				self, "Symlink Creation Error",
-				f"An unexpected error occurred while creating the symlink:\n\n{str(e)}"
+				self, "Symlink Creation Failed",
+				f"Error creating symlink:\n\n{e}\n\n"
+				"Please check if you have the necessary permissions."
 			)
 	
 
@@ -1280,13 +1368,7 @@ class SymlinkMoverApp(QWidget):
 			QMessageBox.warning(self, "Missing Paths", "Please select both source and destination first.")
 			return
 
-		source_drive, source_rel = os.path.splitdrive(self.source_path)
-		source_basename = os.path.basename(self.source_path)
-		if self.preserve_structure_cb.isChecked():
-			source_relative_path = source_rel.lstrip(os.sep)
-			destination_final_path = os.path.join(self.destination_path, source_relative_path)
-		else:
-			destination_final_path = os.path.join(self.destination_path, source_basename)
+		destination_final_path = self.get_destination_final_path()
 
 		# Confirm the user has already moved their files and understands the source will be deleted
 		reply = QMessageBox.warning(
@@ -1327,37 +1409,32 @@ class SymlinkMoverApp(QWidget):
 				return
 
 		try:
-			if IS_WINDOWS:
-				cmd = f'mklink /D "{self.source_path}" "{destination_final_path}"'
-			else:
-				cmd = f'ln -s "{destination_final_path}" "{self.source_path}"'
-
-			result = subprocess.run(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-
-			if result.returncode == 0:
-				logging.info(f"Symlink (only) created: {self.source_path} → {destination_final_path}")
-				QMessageBox.information(self, "Symlink Created", f"Symlink created:\n\n{self.source_path} → {destination_final_path}")
-			else:
-				raise RuntimeError(result.stderr)
-
+			create_symlink(self.source_path, destination_final_path)
+			QMessageBox.information(self, "Symlink Created", f"Symlink created:\n\n{self.source_path} → {destination_final_path}")
 		except Exception as e:
 			logging.error(f"Symlink-only creation failed: {e}")
 			QMessageBox.critical(self, "Symlink Error", f"Could not create symlink:\n{e}")
 
 
+	def show_batch_queue(self):
+		if getattr(self, 'batch_dialog', None) is None:
+			self.batch_dialog = BatchQueueDialog(self)
+		self.batch_dialog.update_policy_label()
+		self.batch_dialog.show()
+		self.batch_dialog.raise_()
+
 	def cancel_transfer(self):
 		if hasattr(self, 'worker') and self.worker.isRunning():
 			self.transfer_canceled = True
-			self.worker._stop_requested = True
 			self.stop_btn.setEnabled(False)
 			self.stop_btn.setText("Cancelling...")
 
-			if hasattr(self.worker, 'robocopy_process') and self.worker.robocopy_process:
-				try:
-					self.worker.robocopy_process.terminate()
-					logging.info("Robocopy process terminated by user.")
-				except Exception as e:
-					logging.warning(f"Failed to terminate Robocopy: {e}")
+			# Also terminates a running Robocopy
+			try:
+				self.worker.stop()
+				logging.info("Transfer canceled by user.")
+			except Exception as e:
+				logging.warning(f"Failed to stop the transfer: {e}")
 
 	def start_symlink_check(self):
 		selected_item = self.drive_selection.currentText()
@@ -1385,8 +1462,9 @@ class SymlinkMoverApp(QWidget):
 		self.scan_progress.show()
 
 		try:
+			self.symlink_results_streamed = False
 			self.worker = SymlinkCheckerThread(selected_path)
-			self.worker.progress.connect(self.symlink_results.setText)
+			self.worker.progress.connect(self.on_symlinks_found)
 			self.worker.finished.connect(self.on_symlink_check_finished)
 			self.worker.start()
 		except Exception as e:
@@ -1394,6 +1472,14 @@ class SymlinkMoverApp(QWidget):
 			self.check_symlinks_btn.setEnabled(True)
 			self.scan_progress.hide()
 
+	def on_symlinks_found(self, lines):
+		# Append each batch instead of replacing the whole text, so long scans stay linear
+		if self.symlink_results_streamed:
+			self.symlink_results.append(lines)
+		else:
+			self.symlink_results.setPlainText(lines)
+			self.symlink_results_streamed = True
+
 	def on_symlink_check_finished(self, result):
 		selected_item = self.drive_selection.currentText()
 		display_path = selected_item if selected_item != "Scan by Folder" else self.worker.path
@@ -1402,7 +1488,10 @@ class SymlinkMoverApp(QWidget):
 			f"<br><br><span style='color: #28a745; font-weight: bold;'>✔ Scan complete for {display_path}</span>"
 		)
 
-		self.symlink_results.setText(result)
+		if self.symlink_results_streamed:
+			self.symlink_results.append(f"\n{result}")
+		else:
+			self.symlink_results.setText(result)
 		self.scan_progress.hide()
 		self.check_symlinks_btn.setEnabled(True)
 
@@ -1423,6 +1512,9 @@ class SymlinkMoverApp(QWidget):
 			<li><b>Start Move + Create Symlink:</b><br>
 				Moves your files using Robocopy (recommended on Windows) or native move, then automatically creates a symlink back to the original location.</li><br>
 			
+			<li><b>Pre-copy (keep source, sync later):</b><br>
+				Copies everything to the destination while your games stay playable from the source. Later, run the move again with the option unchecked: only files changed since the pre-copy are moved, then the symlink is created.</li><br>
+			
 			<li><b>Create Symlink Only:</b><br>
 				Use this if you have already moved the files manually. It will delete the source folder and create the symlink.<br>
 				<span style='color:#ff9800;'>Disabled in Preview mode.</span></li><br>
@@ -1431,6 +1523,9 @@ class SymlinkMoverApp(QWidget):
 				During transfer you will see real-time updates:<br>
 				<b>Remaining: 12,458 files | 145.67 GB</b></li><br>
 			
+			<li><b>Batch Queue:</b><br>
+				Add many folders (or a wildcard like <b>D:/Emulation/*</b>) and move them all in one run with the destination and options above. Each folder gets its symlink as soon as its own move finishes, and moves to different drives run at the same time.</li><br>
+			
 			<li><b>Check for Symlinks:</b><br>
 				Scan any drive or folder for existing symbolic links and junctions.</li><br>
 			
@@ -1647,5 +1742,9 @@ if __name__ == "__main__":
 	window = SymlinkMoverApp()
 	window.show()
 	logging.info("GameVault-Relocator GUI initialized and ready.")
-	check_for_updates()
+	if os.environ.get("GVR_STARTUP_BENCHMARK"):
+		# benchmarks/bench_startup.py: quit as soon as the first window has been painted
+		QTimer.singleShot(0, app.quit)
+	else:
+		window.start_update_check()
 	sys.exit(app.exec())
\ No newline at end of file
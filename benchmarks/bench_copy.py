@@ -0,0 +1,89 @@
+"""
+	GameVault-Relocator - cross-filesystem move benchmark
+
+	Moves a set of files from --src-dir to --dst-dir with shutil.move and with
+	relocator.fastcopy.move_file, and prints MB/s for each. Point the two
+	directories at different filesystems to measure the copy path, e.g. tmpfs
+	to ext4, or two loop-mounted images:
+
+		truncate -s 4G /tmp/a.img && mkfs.ext4 -q /tmp/a.img && mount -o loop /tmp/a.img /mnt/a
+		python benchmarks/bench_copy.py --src-dir /dev/shm/bench --dst-dir /mnt/a/bench
+
+	--clone adds a run with reflinks enabled. Reflinks only work within one CoW
+	filesystem, e.g. between two subvolumes of a loop-mounted btrfs image:
+
+		truncate -s 4G /tmp/b.img && mkfs.btrfs -q /tmp/b.img && mount -o loop /tmp/b.img /mnt/b
+		btrfs subvolume create /mnt/b/src && btrfs subvolume create /mnt/b/dst
+		python benchmarks/bench_copy.py --src-dir /mnt/b/src/bench --dst-dir /mnt/b/dst/bench --clone
+
+	Usage: python benchmarks/bench_copy.py --src-dir DIR --dst-dir DIR [--files 20] [--size-mb 100] [--clone]
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from relocator.fastcopy import move_file
+
+def sync():
+	# Flush dirty pages so each run is timed to the disk, not to the page cache
+	if hasattr(os, 'sync'):
+		os.sync()
+
+def make_files(directory, count, size):
+	os.makedirs(directory, exist_ok=True)
+	block = os.urandom(1024 * 1024)
+	paths = []
+	for i in range(count):
+		path = os.path.join(directory, f"disc{i:03d}.iso")
+		with open(path, "wb") as f:
+			remaining = size
+			while remaining > 0:
+				f.write(block[:min(len(block), remaining)])
+				remaining -= len(block)
+		paths.append(path)
+	return paths
+
+def run(name, func, src_dir, dst_dir, count, size):
+	paths = make_files(src_dir, count, size)
+	os.makedirs(dst_dir, exist_ok=True)
+	sync()
+
+	methods = {}
+	start = time.perf_counter()
+	for path in paths:
+		method = func(path, os.path.join(dst_dir, os.path.basename(path)))
+		methods[method] = methods.get(method, 0) + 1
+	sync()
+	elapsed = time.perf_counter() - start
+
+	total_mb = count * size / (1024 * 1024)
+	used = ", ".join(f"{m}: {n}" for m, n in methods.items())
+	print(f"{name:<22} {total_mb:>8,.0f} MB  {elapsed:7.2f} s  {total_mb / elapsed:>9,.1f} MB/s  ({used})")
+	shutil.rmtree(dst_dir, ignore_errors=True)
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--src-dir", required=True)
+	parser.add_argument("--dst-dir", required=True)
+	parser.add_argument("--files", type=int, default=20)
+	parser.add_argument("--size-mb", type=int, default=100)
+	parser.add_argument("--clone", action="store_true", help="Also run move_file with reflinks enabled")
+	args = parser.parse_args()
+
+	logging.basicConfig(level=logging.WARNING)
+	size = args.size_mb * 1024 * 1024
+
+	run("shutil.move", lambda s, d: shutil.move(s, d) and "shutil", args.src_dir, args.dst_dir, args.files, size)
+	run("fastcopy.move_file", move_file, args.src_dir, args.dst_dir, args.files, size)
+	if args.clone:
+		run("fastcopy (clone)", lambda s, d: move_file(s, d, clone=True), args.src_dir, args.dst_dir, args.files, size)
+	shutil.rmtree(args.src_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+	main()
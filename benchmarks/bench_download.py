@@ -0,0 +1,145 @@
+"""
+	GameVault-Relocator - update download benchmark
+
+	Serves a random file from a local HTTP server that stands in for the GitHub
+	release CDN (Range requests, 206/416 answers, optional dropped connections)
+	and runs relocator.download.download_file against it:
+
+		full       one clean download, timed, with the SHA-256 checked
+		dropped    the server cuts the connection twice mid-file; the download
+		           has to reconnect with Range requests and still verify
+		resumed    stopped half way through, then started again from the .part
+		no-range   a server that ignores Range; the .part is discarded
+		mismatch   a wrong expected SHA-256 must raise ChecksumMismatch
+
+	Usage: python benchmarks/bench_download.py [--size-mb 64]
+"""
+
+import os
+import sys
+import time
+import socket
+import hashlib
+import argparse
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from relocator.download import ChecksumMismatch, download_file, make_session
+
+class ReleaseServer(ThreadingHTTPServer):
+	daemon_threads = True
+
+	def __init__(self, payload):
+		super().__init__(("127.0.0.1", 0), ReleaseHandler)
+		self.payload = payload
+		self.drops = 0				# connections to cut mid-body
+		self.support_ranges = True
+		self.requests = []			# Range header of each request, "" for none
+
+	def handle_error(self, request, client_address):
+		if not isinstance(sys.exc_info()[1], ConnectionError):		# a stopped client hanging up is expected
+			super().handle_error(request, client_address)
+
+	@property
+	def url(self):
+		return f"http://127.0.0.1:{self.server_address[1]}/GameVault-Relocator.exe"
+
+class ReleaseHandler(BaseHTTPRequestHandler):
+	protocol_version = "HTTP/1.1"
+
+	def log_message(self, format, *args):
+		pass
+
+	def do_GET(self):
+		payload = self.server.payload
+		range_header = self.headers.get("Range", "")
+		self.server.requests.append(range_header)
+
+		start = 0
+		if range_header.startswith("bytes=") and self.server.support_ranges:
+			start = int(range_header[6:].split("-")[0])
+			if start >= len(payload):
+				self.send_response(416)
+				self.send_header("Content-Range", f"bytes */{len(payload)}")
+				self.send_header("Content-Length", "0")
+				self.end_headers()
+				return
+			self.send_response(206)
+			self.send_header("Content-Range", f"bytes {start}-{len(payload) - 1}/{len(payload)}")
+		else:
+			self.send_response(200)
+		self.send_header("Content-Length", str(len(payload) - start))
+		self.send_header("Accept-Ranges", "bytes")
+		self.end_headers()
+
+		body = memoryview(payload)[start:]
+		if self.server.drops > 0:
+			self.server.drops -= 1
+			self.wfile.write(body[:len(body) // 3])
+			self.wfile.flush()
+			self.connection.shutdown(socket.SHUT_RDWR)		# the client sees a short body
+			self.close_connection = True
+			return
+		self.wfile.write(body)
+
+def run(name, server, path, expected, **kwargs):
+	server.requests.clear()
+	start = time.perf_counter()
+	try:
+		digest = download_file(server.url, path, session=kwargs.pop("session", None), expected_sha256=expected, **kwargs)
+		outcome = "ok" if digest == expected else f"returned {digest}"
+	except ChecksumMismatch:
+		outcome = "ChecksumMismatch"
+	elapsed = time.perf_counter() - start
+	mb = len(server.payload) / (1024 ** 2)
+	print(f"{name:<10} {outcome:<17} {elapsed:6.2f} s  {mb / elapsed:8.1f} MB/s  requests: {server.requests}")
+	return outcome
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--size-mb", type=int, default=64)
+	args = parser.parse_args()
+
+	payload = os.urandom(args.size_mb * 1024 * 1024)
+	expected = hashlib.sha256(payload).hexdigest()
+	server = ReleaseServer(payload)
+	threading.Thread(target=server.serve_forever, daemon=True).start()
+	session = make_session()
+
+	with tempfile.TemporaryDirectory(prefix="gvr-download-") as temp_dir:
+		path = os.path.join(temp_dir, "GameVault-Relocator-new.exe")
+		results = []
+
+		results.append(run("full", server, path, expected, session=session) == "ok")
+
+		server.drops = 2
+		results.append(run("dropped", server, path, expected, session=session) == "ok")
+
+		stop_event = threading.Event()
+		half = len(payload) // 2
+		first = run("stopped", server, path, expected, session=session, stop_event=stop_event,
+					progress_callback=lambda done, total: done >= half and stop_event.set())
+		part_size = os.path.getsize(path + ".part") if os.path.exists(path + ".part") else 0
+		results.append(first.startswith("returned None") and part_size > 0)
+		results.append(run("resumed", server, path, expected, session=session) == "ok"
+					   and server.requests[0] == f"bytes={part_size}-")
+
+		stop_event.clear()
+		run("stopped", server, path, expected, session=session, stop_event=stop_event,
+			progress_callback=lambda done, total: done >= half and stop_event.set())
+		server.support_ranges = False
+		results.append(run("no-range", server, path, expected, session=session) == "ok")
+		server.support_ranges = True
+
+		results.append(run("mismatch", server, path, "0" * 64, session=session) == "ChecksumMismatch"
+					   and not os.path.exists(path + ".part"))
+
+	server.shutdown()
+	print("OK" if all(results) else f"FAIL: {results}")
+	return 0 if all(results) else 1
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+	GameVault-Relocator - symlink exclusion matching benchmark
+
+	Runs the symlink scanner's exclusion check over the entries of a synthetic
+	Windows-style tree, the way iter_symlinks visits them (nothing below an
+	excluded folder is listed), once with the old loop (normalize the path and
+	every exclusion, then a substring test per exclusion) and once with
+	relocator.symlinks.ExclusionMatcher.prunes, and prints entries/sec for
+	each. Both must skip the same entries.
+
+	Usage: python benchmarks/bench_exclusions.py [--entries 3000000] [--excluded-pct 5]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from relocator.symlinks import DEFAULT_EXCLUSIONS, ExclusionMatcher
+
+PARTS = ["Users", "Public", "Games", "SteamLibrary", "steamapps", "common", "Emulation", "roms",
+		 "snes", "psx", "Program Files", "Epic Games", "Saves", "Mods", "Config", "Shaders"]
+
+def make_entries(count, excluded_pct, seed=1, max_depth=8):
+	"""
+	(path, name) for each entry a walk checks, parents before children. excluded_pct of
+	them are named after an exclusion and get no children, since the scan prunes them;
+	exclusions with a slash are placed under the folders they name.
+	"""
+	rng = random.Random(seed)
+	exclusions = sorted(DEFAULT_EXCLUSIONS)
+	folders = [("C:", 0)]
+	entries = []
+	for i in range(count):
+		parent, depth = rng.choice(folders)
+		excluded = rng.random() * 100 < excluded_pct
+		if excluded:
+			*prefix, name = rng.choice(exclusions).title().split("/")
+			parent = "\\".join([parent] + prefix)
+		else:
+			name = f"{rng.choice(PARTS)} {i}"
+		path = f"{parent}\\{name}"
+		entries.append((path, name))
+		if depth < max_depth and not excluded:
+			folders.append((path, depth + 1))
+	return entries
+
+def legacy_prunes(excluded_dirs):
+	def prunes(path, name):
+		norm_line = path.lower().replace('\\', '/')
+		return any(
+			excl.lower().replace('\\', '/') in norm_line
+			for excl in excluded_dirs
+		)
+	return prunes
+
+def run(name, prunes, entries):
+	start = time.perf_counter()
+	hits = [prunes(path, entry_name) for path, entry_name in entries]
+	elapsed = time.perf_counter() - start
+	print(f"{name:<22} {len(entries):>10,} entries  {elapsed:8.2f} s  {len(entries) / elapsed:>12,.0f} entries/s  ({sum(hits):,} pruned)")
+	return elapsed, hits
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--entries", type=int, default=3_000_000)
+	parser.add_argument("--excluded-pct", type=float, default=5)
+	args = parser.parse_args()
+
+	print(f"Generating {args.entries:,} entries ...")
+	entries = make_entries(args.entries, args.excluded_pct)
+
+	legacy_time, legacy_hits = run("per-exclusion loop", legacy_prunes(DEFAULT_EXCLUSIONS), entries)
+	matcher_time, matcher_hits = run("ExclusionMatcher", ExclusionMatcher(DEFAULT_EXCLUSIONS).prunes, entries)
+	if legacy_hits != matcher_hits:
+		print("MISMATCH: the matcher disagrees with the old loop")
+		sys.exit(1)
+	print(f"Speedup: {legacy_time / matcher_time:.2f}x")
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,88 @@
+"""
+	GameVault-Relocator - startup benchmark
+
+	Starts GameVault-Relocator.py with GVR_STARTUP_BENCHMARK=1, which makes it quit
+	as soon as the main window has been painted, and reports the time to first
+	window (process start to exit) against --target. The last run is repeated
+	under python -X importtime to list the most expensive top-level imports and
+	to check that the modules the app only loads on demand (requests, packaging,
+	psutil, ...) stayed out of startup.
+	The app asks for admin rights on start, so run this from an elevated prompt
+	or as root. On a headless box add --offscreen:
+
+		sudo python benchmarks/bench_startup.py --offscreen
+
+	Exits 1 if the median run misses the target.
+
+	Usage: python benchmarks/bench_startup.py [--runs 5] [--target 1.5] [--top 15] [--offscreen]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "GameVault-Relocator.py")
+
+# Loaded on demand by the app; importing any of these at startup is a regression
+LAZY_MODULES = ("requests", "packaging", "psutil", "tempfile")
+
+def launch(env, importtime=False):
+	command = [sys.executable] + (["-X", "importtime"] if importtime else []) + [SCRIPT]
+	start = time.perf_counter()
+	result = subprocess.run(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+	elapsed = time.perf_counter() - start
+	if result.returncode != 0:
+		sys.exit(f"GameVault-Relocator exited with {result.returncode}:\n{result.stderr[-2000:]}")
+	return elapsed, result.stderr
+
+def parse_importtime(stderr):
+	"""(cumulative us, module, depth) for every line python -X importtime printed"""
+	imports = []
+	for line in stderr.splitlines():
+		if not line.startswith("import time:") or "cumulative" in line:
+			continue
+		_, cumulative, name = line[len("import time:"):].split("|")
+		depth = (len(name) - len(name.lstrip()) - 1) // 2	# one space after the bar, then two per level
+		imports.append((int(cumulative), name.strip(), depth))
+	return imports
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--runs", type=int, default=5)
+	parser.add_argument("--target", type=float, default=1.5, help="time to first window to stay under, in seconds")
+	parser.add_argument("--top", type=int, default=15)
+	parser.add_argument("--offscreen", action="store_true", help="use Qt's offscreen platform, for machines without a display")
+	args = parser.parse_args()
+
+	env = dict(os.environ, GVR_STARTUP_BENCHMARK="1")
+	if args.offscreen:
+		env["QT_QPA_PLATFORM"] = "offscreen"
+
+	launch(env)		# warm the disk cache and __pycache__ first
+	times = [launch(env)[0] for _ in range(args.runs)]
+	for i, elapsed in enumerate(times, 1):
+		print(f"run {i}: {elapsed:.3f} s")
+	median = statistics.median(times)
+	print(f"time to first window: median {median:.3f} s, best {min(times):.3f} s, target {args.target:.3f} s")
+
+	_, stderr = launch(env, importtime=True)
+	imports = parse_importtime(stderr)
+	print("\nSlowest top-level imports (cumulative):")
+	for cumulative, name, _ in sorted((i for i in imports if i[2] == 0), reverse=True)[:args.top]:
+		print(f"{cumulative / 1000:9.1f} ms  {name}")
+
+	eager = sorted({name for _, name, _ in imports if name.split(".")[0] in LAZY_MODULES})
+	print(f"\nOn-demand modules imported at startup: {', '.join(eager) if eager else 'none'}")
+
+	if median > args.target:
+		print(f"FAIL: {median:.3f} s is over the {args.target:.3f} s target")
+		return 1
+	print("OK")
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,10 @@
+"""
+	GameVault-Relocator core
+	Copyright (C) 2026 ScriptedBits
+
+	Qt-free building blocks shared by the GameVault-Relocator GUI and python -m relocator:
+	scanner.scan_tree counts a source, mover.MoveEngine moves it and symlinker links it
+	back or scans for links. Progress is reported through plain callbacks, which the GUI
+	threads turn into signals.
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
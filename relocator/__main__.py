@@ -0,0 +1,12 @@
+"""
+	GameVault-Relocator - python -m relocator
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import sys
+
+from relocator.cli import main
+
+sys.exit(main())
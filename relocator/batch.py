@@ -0,0 +1,311 @@
+"""
+	GameVault-Relocator - batch relocation queue
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import os
+import glob
+import shutil
+import logging
+import threading
+from collections import deque
+
+from relocator.devices import nearest_existing
+from relocator.journal import find_resumable_journal
+from relocator.mover import MoveEngine
+from relocator.scanner import scan_directory
+from relocator.symlinker import SymlinkFailed, replace_with_symlink
+
+class NotEnoughSpace(OSError):
+	"""The destination device can't hold a job next to what its other running jobs still write"""
+
+class RelocationJob:
+	"""One source folder of a batch and where it goes"""
+	__slots__ = ('source', 'destination', 'device', 'status', 'message', 'error')
+
+	def __init__(self, source, destination, device=None):
+		self.source = source
+		self.destination = destination
+		self.device = device
+		self.status = "queued"	# queued, running, done, failed, canceled
+		self.message = ""
+		self.error = None		# the exception a failed job raised
+
+	def __str__(self):
+		return f"{self.source} -> {self.destination} [{self.status}]"
+
+def expand_sources(patterns):
+	"""
+	Source folders for a batch, in order and without duplicates. A pattern with wildcards
+	(D:/Emulation/*) adds every matching folder, skipping ones that are already symlinks.
+	"""
+	sources = []
+	seen = set()
+	for pattern in patterns:
+		if glob.has_magic(pattern):
+			matches = sorted(
+				path for path in glob.glob(pattern)
+				if os.path.isdir(path) and not os.path.islink(path)
+			)
+		else:
+			matches = [pattern]
+		for path in matches:
+			path = os.path.normpath(path)
+			key = os.path.normcase(path)
+			if key not in seen:
+				seen.add(key)
+				sources.append(path)
+	return sources
+
+def destination_for(source, destination, preserve_structure):
+	"""The folder source moves to: its full path below a destination root, or just its name inside a folder"""
+	if preserve_structure:
+		source_rel = os.path.splitdrive(source)[1].lstrip(os.sep).lstrip('/')
+		return os.path.join(destination, source_rel)
+	return os.path.join(destination, os.path.basename(os.path.normpath(source)))
+
+def device_id(path):
+	"""st_dev of the filesystem path is or will be on"""
+	path = nearest_existing(path)
+	try:
+		return os.stat(path).st_dev
+	except OSError as e:
+		logging.warning(f"Could not determine the device of {path}: {e}")
+		return path
+
+def plan_jobs(sources, destination, preserve_structure):
+	jobs = []
+	for source in sources:
+		target = destination_for(source, destination, preserve_structure)
+		jobs.append(RelocationJob(source, target, device_id(target)))
+	return jobs
+
+class JobScheduler:
+	"""
+	Runs relocation jobs with at most per_device of them writing to each destination device.
+
+	Every device gets its own queue and workers, so jobs for different disks overlap while
+	jobs for the same disk wait their turn instead of fighting over its heads. run_job(job)
+	does the work and returns (status, message). Setting stop_event stops handing out jobs;
+	the ones still queued end up "canceled".
+	"""
+	def __init__(self, jobs, run_job, per_device=1, stop_event=None, on_update=None):
+		self.jobs = jobs
+		self.run_job = run_job
+		self.per_device = max(1, per_device)
+		self.stop_event = stop_event or threading.Event()
+		self.on_update = on_update	# called with the job after each status change
+		self._queues = {}
+		for job in jobs:
+			self._queues.setdefault(job.device, deque()).append(job)
+		self._lock = threading.Lock()
+
+	def _set_status(self, job, status, message=""):
+		job.status = status
+		job.message = message
+		if self.on_update is not None:
+			self.on_update(job)
+
+	def _next_job(self, device):
+		with self._lock:
+			jobs = self._queues[device]
+			return jobs.popleft() if jobs else None
+
+	def _worker(self, device):
+		while not self.stop_event.is_set():
+			job = self._next_job(device)
+			if job is None:
+				return
+			self._set_status(job, "running")
+			try:
+				status, message = self.run_job(job)
+			except Exception as e:
+				if not isinstance(e, (NotEnoughSpace, SymlinkFailed)):
+					logging.exception(f"Relocation job failed: {job.source}")
+				job.error = e
+				status, message = "failed", str(e)
+			self._set_status(job, status, message)
+
+	def run(self):
+		"""Block until every job has finished or was canceled; returns the jobs"""
+		threads = []
+		for device, jobs in self._queues.items():
+			for _ in range(min(self.per_device, len(jobs))):
+				thread = threading.Thread(target=self._worker, args=(device,), daemon=True)
+				thread.start()
+				threads.append(thread)
+		logging.info(
+			f"Batch: {len(self.jobs)} jobs on {len(self._queues)} destination devices, "
+			f"{self.per_device} at a time per device"
+		)
+		for thread in threads:
+			thread.join()
+
+		for job in self.jobs:
+			if job.status == "queued":
+				self._set_status(job, "canceled", "Not started")
+		return self.jobs
+
+class BatchRunner:
+	"""
+	Moves RelocationJobs through a JobScheduler, linking each source on its scheduler thread
+	as soon as its own move finished. Shared by the GUI's batch queue and the command line.
+
+	move_options go to every MoveEngine (use_robocopy, preview_mode, clone, precopy,
+	thread_count, ...). on_update(index, job) follows status changes; on_job_progress,
+	on_job_summary and on_job_telemetry get (index, value) from the running moves. A source
+	is only linked when every file moved, and never for a preview or pre-copy.
+	"""
+	def __init__(self, jobs, per_device=1, log_dir=None, scan=scan_directory, resume=True, link=True,
+				 progress_interval=0.1, on_update=None, on_job_progress=None, on_job_summary=None,
+				 on_job_telemetry=None, **move_options):
+		self.jobs = jobs
+		self.per_device = per_device
+		self.log_dir = log_dir or os.path.abspath(".")
+		self.scan = scan
+		self.resume = resume
+		self.link = link
+		self.progress_interval = progress_interval
+		self.on_update = on_update
+		self.on_job_progress = on_job_progress
+		self.on_job_summary = on_job_summary
+		self.on_job_telemetry = on_job_telemetry
+		self.move_options = move_options
+		self.preview_mode = move_options.get('preview_mode', False)
+		self.precopy = move_options.get('precopy', False)
+		self._index = {id(job): i for i, job in enumerate(jobs)}
+		self._lock = threading.Lock()
+		self._running = {}			# job index -> MoveEngine
+		self._job_progress = {}		# job index -> percent
+		self._reserved = {}			# destination device -> bytes its running jobs still need
+		self._stop_event = threading.Event()
+
+	def overall_progress(self):
+		"""(percent, finished jobs, running jobs) over the whole batch"""
+		with self._lock:
+			finished = sum(1 for job in self.jobs if job.status not in ("queued", "running"))
+			running = len(self._running)
+			percent = finished * 100 + sum(self._job_progress.values())
+		return min(int(percent / max(len(self.jobs), 1)), 100), finished, running
+
+	def _job_updated(self, job):
+		index = self._index[id(job)]
+		if job.status != "running":
+			with self._lock:
+				self._job_progress.pop(index, None)
+		if self.on_update is not None:
+			self.on_update(index, job)
+
+	def _job_progress_changed(self, index, value):
+		with self._lock:
+			if index in self._running:
+				self._job_progress[index] = value
+		if self.on_job_progress is not None:
+			self.on_job_progress(index, value)
+
+	def reserve_space(self, job, total_bytes):
+		"""Claim room on the destination device, counting what its other running jobs still write"""
+		with self._lock:
+			free = shutil.disk_usage(nearest_existing(job.destination)).free
+			reserved = self._reserved.get(job.device, 0)
+			if free - reserved < total_bytes:
+				raise NotEnoughSpace(
+					f"Not enough free space for {total_bytes / (1024 ** 3):.2f} GB "
+					f"({max(free - reserved, 0) / (1024 ** 3):.2f} GB free)"
+				)
+			self._reserved[job.device] = reserved + total_bytes
+
+	def run_job(self, job):
+		"""Move one job, then link its source. Returns (status, message) for JobScheduler"""
+		index = self._index[id(job)]
+		if os.path.islink(job.source) or not os.path.isdir(job.source):
+			return "failed", "Source folder is missing or already a symlink"
+
+		logging.info(f"Batch job {index + 1}: {job.source} -> {job.destination}")
+		manifest = self.scan(job.source)
+		if manifest.total_files == 0:
+			return "failed", "No files found in source directory"
+
+		# A rename needs no room, and a dry run writes nothing
+		reserved = 0
+		if not self.preview_mode and os.stat(job.source).st_dev != job.device:
+			self.reserve_space(job, manifest.total_bytes)
+			reserved = manifest.total_bytes
+
+		# Unattended, so an interrupted move is always resumed
+		resume_journal = None
+		if self.resume and not self.preview_mode and not self.precopy and not self.move_options.get('use_robocopy'):
+			resume_journal = find_resumable_journal(self.log_dir, job.source, job.destination)
+			if resume_journal:
+				logging.info(f"Batch job {index + 1}: resuming from {resume_journal}")
+
+		try:
+			if not self.preview_mode:
+				os.makedirs(job.destination, exist_ok=True)
+
+			mover = MoveEngine(
+				job.source,
+				job.destination,
+				total_files=manifest.total_files,
+				total_bytes=manifest.total_bytes,
+				manifest=manifest,
+				resume_journal=resume_journal,
+				precopy_journal=find_resumable_journal(self.log_dir, job.source, job.destination, kind="precopy"),
+				log_tag=f"_job{index + 1:03d}",
+				log_dir=self.log_dir,
+				progress_interval=self.progress_interval,
+				on_progress=lambda value: self._job_progress_changed(index, value),
+				on_summary=(lambda text: self.on_job_summary(index, text)) if self.on_job_summary else None,
+				on_telemetry=(lambda stats: self.on_job_telemetry(index, stats)) if self.on_job_telemetry else None,
+				**self.move_options
+			)
+
+			with self._lock:
+				self._running[index] = mover
+			try:
+				if self._stop_event.is_set():
+					return "canceled", "Not started"
+				message = mover.run()
+			finally:
+				with self._lock:
+					del self._running[index]
+		finally:
+			if reserved:
+				with self._lock:
+					self._reserved[job.device] -= reserved
+
+		# A stop that arrives after every file moved still links, or the data would be left
+		# at the destination with nothing pointing to it
+		if mover.is_canceled() and (self.preview_mode or not mover.completed):
+			return "canceled", "Canceled, source not linked"
+		if self.preview_mode:
+			return "done", f"Would move {manifest.total_files:,} files ({manifest.total_bytes / (1024 ** 3):.2f} GB)"
+		if not mover.completed:
+			return "failed", message.splitlines()[0] if message else "Move did not finish"
+		if self.precopy:
+			return "done", "Pre-copied, source kept"
+		if not self.link:
+			return "done", "Moved, not linked"
+
+		try:
+			replace_with_symlink(job.source, job.destination)
+		except OSError as e:
+			logging.error(f"Batch job {index + 1}: could not link {job.source}: {e}")
+			raise SymlinkFailed(f"Moved, but the symlink failed: {e}") from e
+		logging.info(f"Symlink successfully created: {job.source} -> {job.destination}")
+		return "done", "Moved and linked"
+
+	def run(self):
+		"""Block until every job finished or was canceled; returns the jobs"""
+		scheduler = JobScheduler(self.jobs, self.run_job, self.per_device,
+								 stop_event=self._stop_event, on_update=self._job_updated)
+		return scheduler.run()
+
+	def stop(self):
+		self._stop_event.set()
+		with self._lock:
+			movers = list(self._running.values())
+		for mover in movers:
+			mover.stop()
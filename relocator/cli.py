@@ -0,0 +1,281 @@
+"""
+	GameVault-Relocator - command line interface
+	Copyright (C) 2026 ScriptedBits
+
+	Headless moves for scripts, scheduled tasks and SSH sessions, using the same scan, move
+	and symlink code as the GUI without importing PyQt6:
+
+		python -m relocator move D:/Games/Emulation E:/ --preserve-structure
+		python -m relocator move "D:/Emulation/*" E:/Emulation --per-device 2 --dry-run
+		python -m relocator count D:/Games/Emulation
+		python -m relocator symlinks D:/ --broken
+		python -m relocator symlinks C:/ --target E:/Games
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import threading
+
+from relocator.batch import BatchRunner, NotEnoughSpace, expand_sources, plan_jobs
+from relocator.mover import get_native_thread_count
+from relocator.scanner import COUNT_SKIP_DIRS, scan_tree
+from relocator.symlinker import SymlinkFailed, SymlinkScan, build_exclusions
+from relocator.symlink_index import SymlinkIndex, resolve_target
+from relocator.telemetry import ProgressThrottle, format_rate
+
+EXIT_OK = 0
+EXIT_FAILED = 1			# a move failed or did not finish
+EXIT_USAGE = 2			# bad arguments, the same code argparse uses
+EXIT_NO_SPACE = 3
+EXIT_LINK_FAILED = 4	# files moved, symlink not created
+EXIT_CANCELED = 130		# Ctrl+C, as shells report SIGINT
+
+LOG_FILE = "GameVault-Relocator.log"
+SCAN_CACHE_FILE = "GameVault-Relocator.cache"
+SYMLINK_INDEX_FILE = "GameVault-Relocator.symlinks"
+EXCLUSIONS_FILE = "GameVault-Relocator.exclusions.txt"
+
+class TerminalProgress:
+	"""
+	Progress on stderr: one line rewritten in place on a terminal, or a new line every
+	interval seconds when redirected to a log, so cron mails stay short.
+	"""
+	def __init__(self, stream=sys.stderr, interval=None):
+		self.stream = stream
+		self.tty = stream.isatty()
+		self.jobs = {}		# job index -> [percent, summary, rate]
+		self.throttle = ProgressThrottle(self.render, interval or (0.2 if self.tty else 5.0))
+		self._width = 0
+		self._lock = threading.RLock()	# jobs report from several scheduler threads
+
+	def update(self, index, percent=None, summary=None, rate=None):
+		with self._lock:
+			state = self.jobs.setdefault(index, [0, "", ""])
+			for slot, value in enumerate((percent, summary, rate)):
+				if value is not None:
+					state[slot] = value
+		self.throttle.update()
+
+	def finish(self, index):
+		with self._lock:
+			self.jobs.pop(index, None)
+
+	def render(self):
+		with self._lock:
+			parts = []
+			for index, (percent, summary, rate) in sorted(self.jobs.items()):
+				parts.append(" | ".join(part for part in (f"[{index + 1}] {percent:3d}%", summary, rate) if part))
+			line = "   ".join(parts)
+			if self.tty:
+				self.stream.write("\r" + line.ljust(self._width))
+				self._width = len(line)
+			elif line:
+				self.stream.write(line + "\n")
+			self.stream.flush()
+
+	def clear(self):
+		with self._lock:
+			if self.tty and self._width:
+				self.stream.write("\r" + " " * self._width + "\r")
+				self.stream.flush()
+				self._width = 0
+
+	def message(self, text):
+		with self._lock:
+			self.clear()
+			print(text, flush=True)
+
+def build_parser():
+	parser = argparse.ArgumentParser(
+		prog="python -m relocator",
+		description="Move folders to another drive and leave symlinks behind, without the GUI."
+	)
+	parser.add_argument("--log-dir", default=os.path.abspath("."),
+						help="where logs, journals and stats go (default: current directory)")
+	parser.add_argument("-v", "--verbose", action="store_true", help="also print the log to stderr")
+	commands = parser.add_subparsers(dest="command", required=True)
+
+	move = commands.add_parser("move", help="move folders and replace each with a symlink")
+	move.add_argument("sources", nargs="+", metavar="SRC", help="source folders, wildcards allowed")
+	move.add_argument("destination", metavar="DST", help="destination root, or folder with --no-preserve-structure")
+	move.add_argument("--preserve-structure", action=argparse.BooleanOptionalAction, default=True,
+					  help="recreate each source's full path below DST (default), instead of DST/<name>")
+	move.add_argument("--dry-run", action="store_true", help="only report what would be moved")
+	move.add_argument("--jobs", type=int, default=None, metavar="N",
+					  help="copy threads per move (default: picked per drive type)")
+	move.add_argument("--per-device", type=int, default=1, metavar="N",
+					  help="folders moved at once to the same destination drive (default: 1)")
+	move.add_argument("--precopy", action="store_true", help="copy only and keep the sources, for a later delta move")
+	move.add_argument("--clone", action="store_true", help="use reflinks where the filesystem supports them")
+	move.add_argument("--robocopy", action="store_true", help="use Robocopy on Windows")
+	move.add_argument("--verify-hash", action="store_true", help="compare SHA-256 of files an earlier copy left behind")
+	move.add_argument("--no-symlink", action="store_true", help="move without linking the sources")
+	move.add_argument("--no-resume", action="store_true", help="ignore journals of interrupted moves")
+
+	count = commands.add_parser("count", help="count the files and bytes in folders")
+	count.add_argument("sources", nargs="+", metavar="SRC")
+	count.add_argument("--cache", action="store_true",
+					   help="reuse listings of unchanged folders; faster, but misses files rewritten in place")
+
+	symlinks = commands.add_parser("symlinks", help="list the symlinks and junctions below a folder or drive")
+	symlinks.add_argument("path", metavar="PATH")
+	symlinks.add_argument("--broken", action="store_true", help="only list links whose target is missing")
+	symlinks.add_argument("--target", metavar="DIR", help="only list links that point to DIR or anything below it")
+	symlinks.add_argument("--no-index", action="store_true", help="rescan without the symlink index")
+	return parser
+
+def setup_logging(log_dir, verbose):
+	os.makedirs(log_dir, exist_ok=True)
+	handlers = [logging.FileHandler(os.path.join(log_dir, LOG_FILE), encoding="utf-8")]
+	if verbose:
+		handlers.append(logging.StreamHandler(sys.stderr))
+	logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s", handlers=handlers)
+
+def exit_code(jobs, interrupted):
+	if interrupted:
+		return EXIT_CANCELED
+	failed = [job for job in jobs if job.status != "done"]
+	if not failed:
+		return EXIT_OK
+	if any(isinstance(job.error, NotEnoughSpace) for job in failed):
+		return EXIT_NO_SPACE
+	if any(isinstance(job.error, SymlinkFailed) for job in failed):
+		return EXIT_LINK_FAILED
+	return EXIT_FAILED
+
+def command_count(args):
+	cache_file = os.path.join(args.log_dir, SCAN_CACHE_FILE) if args.cache else None
+	status = EXIT_OK
+	for source in expand_sources(args.sources):
+		if not os.path.isdir(source):
+			print(f"{source}: not a folder", file=sys.stderr)
+			status = EXIT_FAILED
+			continue
+		manifest = scan_tree(source, cache_file=cache_file, skip_dirs=COUNT_SKIP_DIRS)
+		print(f"{source}: {manifest.total_files:,} files, {manifest.total_bytes / (1024 ** 3):.2f} GB")
+	return status
+
+def command_symlinks(args):
+	if not os.path.isdir(args.path):
+		print(f"No such folder: {args.path}", file=sys.stderr)
+		return EXIT_USAGE
+	exclusions = build_exclusions(os.path.join(args.log_dir, EXCLUSIONS_FILE))
+	index_file = None if args.no_index else os.path.join(args.log_dir, SYMLINK_INDEX_FILE)
+	target = os.path.abspath(args.target) if args.target else None
+	scan = SymlinkScan(args.path, exclusions, index_file=index_file, workers=get_native_thread_count())
+
+	def wanted(link):
+		return link.broken or not args.broken
+
+	try:
+		for link in scan:
+			if target is None:
+				if wanted(link):
+					print(link, flush=True)
+			elif index_file is None and link.target is not None and wanted(link):
+				resolved = resolve_target(link.path, link.target)
+				norm_target = resolve_target(target, target)
+				if resolved == norm_target or resolved.startswith(norm_target + '/'):
+					print(link, flush=True)
+	except KeyboardInterrupt:
+		scan.stop()
+		print(scan.summary(), file=sys.stderr)
+		return EXIT_CANCELED
+
+	if target is not None and index_file is not None:
+		# The scan just brought the index up to date; ask it instead of resolving every link here
+		with SymlinkIndex(index_file, exclusions) as index:
+			below_path = {link.path for link in index.links_under(args.path)}
+			for link in index.links_to(target):
+				if link.path in below_path and wanted(link):
+					print(link)
+	print(scan.summary(), file=sys.stderr)
+	return EXIT_OK
+
+def command_move(args):
+	sources = expand_sources(args.sources)
+	missing = [source for source in sources if not os.path.isdir(source)]
+	if missing or not sources:
+		for source in missing or args.sources:
+			print(f"No such folder: {source}", file=sys.stderr)
+		return EXIT_USAGE
+	if args.jobs is not None and args.jobs < 1:
+		print("--jobs must be at least 1", file=sys.stderr)
+		return EXIT_USAGE
+
+	jobs = plan_jobs(
+		[os.path.abspath(source) for source in sources], os.path.abspath(args.destination), args.preserve_structure
+	)
+	progress = TerminalProgress()
+
+	def on_update(index, job):
+		if job.status == "running":
+			progress.update(index)
+			return
+		progress.finish(index)
+		progress.message(f"[{index + 1}/{len(jobs)}] {job.status.upper():<8} {job.source} -> {job.destination}"
+						 + (f": {job.message}" if job.message else ""))
+
+	runner = BatchRunner(
+		jobs, args.per_device,
+		log_dir=args.log_dir,
+		scan=scan_tree,
+		resume=not args.no_resume,
+		link=not args.no_symlink,
+		on_update=on_update,
+		on_job_progress=lambda index, percent: progress.update(index, percent=percent),
+		on_job_summary=lambda index, text: progress.update(index, summary=text),
+		on_job_telemetry=lambda index, stats: progress.update(index, rate=format_rate(stats)),
+		use_robocopy=args.robocopy and sys.platform == "win32",
+		preview_mode=args.dry_run,
+		clone=args.clone,
+		precopy=args.precopy,
+		verify_hash=args.verify_hash,
+		thread_count=args.jobs
+	)
+
+	# The runner works on its own thread, so Ctrl+C reaches this one and can stop it cleanly.
+	# Waiting on an Event, since a join() interrupted by Ctrl+C can report the thread dead early
+	start_time = time.time()
+	finished = threading.Event()
+
+	def run():
+		try:
+			runner.run()
+		finally:
+			finished.set()
+
+	threading.Thread(target=run, daemon=True).start()
+	interrupted = False
+	while not finished.is_set():
+		try:
+			finished.wait(0.2)
+		except KeyboardInterrupt:
+			if not interrupted:
+				interrupted = True
+				progress.message("Stopping, partial copies are cleaned up... (Ctrl+C again to force)")
+				runner.stop()
+			else:
+				raise
+	progress.clear()
+
+	done = sum(1 for job in jobs if job.status == "done")
+	print(f"{done} of {len(jobs)} folders done in {time.time() - start_time:.1f} s")
+	code = exit_code(jobs, interrupted)
+	logging.info(f"Command line move finished with exit code {code}")
+	return code
+
+def main(argv=None):
+	args = build_parser().parse_args(argv)
+	args.log_dir = os.path.abspath(args.log_dir)
+	setup_logging(args.log_dir, args.verbose)
+	if args.command == "count":
+		return command_count(args)
+	if args.command == "symlinks":
+		return command_symlinks(args)
+	return command_move(args)
@@ -0,0 +1,231 @@
+"""
+	GameVault-Relocator - storage device classification and I/O policy
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import os
+import sys
+import struct
+import logging
+
+IS_WINDOWS = sys.platform == "win32"
+IS_LINUX = sys.platform.startswith("linux")
+
+DEVICE_SSD = "ssd"
+DEVICE_HDD = "hdd"
+DEVICE_NETWORK = "network"
+DEVICE_UNKNOWN = "unknown"
+
+NETWORK_FS_TYPES = {'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'fuse.sshfs', '9p', 'afpfs', 'webdav'}
+# FAT keeps mtimes in 2 second steps, and exFAT copies are often rounded the same way
+COARSE_MTIME_FS_TYPES = {'vfat', 'msdos', 'fat', 'fat12', 'fat16', 'fat32', 'exfat'}
+
+HDD_THREADS = 2			# one file being read while the previous one is written, no more seeking than that
+NETWORK_THREADS = 16	# latency bound, so overlap many round trips
+
+# virtio and Xen disks report rotational=1 whatever the host stores them on
+VIRTUAL_DISK_PREFIXES = ("vd", "xvd")
+
+IOCTL_STORAGE_QUERY_PROPERTY = 0x2D1400
+STORAGE_DEVICE_SEEK_PENALTY_PROPERTY = 7
+
+def is_network_path(path):
+	"""True if path lives on a network share (mapped drive, UNC path or NFS/SMB mount)"""
+	try:
+		if IS_WINDOWS:
+			if path.startswith(("\\\\", "//")):
+				return True
+			import win32file
+			drive = os.path.splitdrive(os.path.abspath(path))[0]
+			return bool(drive) and win32file.GetDriveType(drive + "/") == win32file.DRIVE_REMOTE
+
+		return _mount_fstype(path) in NETWORK_FS_TYPES
+	except Exception as e:
+		logging.warning(f"Could not determine drive type for {path}: {e}")
+		return False
+
+def _mount_fstype(path):
+	"""Filesystem type of the longest mount point above path, from psutil"""
+	import psutil
+	path = os.path.realpath(path)
+	best_mount, best_fstype = "", ""
+	for p in psutil.disk_partitions(all=True):
+		mount = p.mountpoint.rstrip("/") + "/"
+		if (path + "/").startswith(mount) and len(mount) > len(best_mount):
+			best_mount, best_fstype = mount, p.fstype.lower()
+	return best_fstype
+
+def filesystem_type(path):
+	"""Lower case filesystem name of the volume path is on ("ntfs", "ext4", "exfat"...), "" if unknown"""
+	try:
+		if IS_WINDOWS:
+			import win32api
+			drive = os.path.splitdrive(os.path.abspath(path))[0]
+			return win32api.GetVolumeInformation(drive + "\\")[4].lower() if drive else ""
+		return _mount_fstype(path)
+	except Exception as e:
+		logging.warning(f"Could not determine the filesystem of {path}: {e}")
+		return ""
+
+def list_drives():
+	"""
+	Drives and mount points a move can go to, as combo box labels: "E:/" or "Z:/ (Network)"
+	on Windows, mount points elsewhere. Can block for seconds on sleeping disks, empty
+	card readers or dead network mappings, so call it off the UI thread.
+	"""
+	drives = []
+	if IS_WINDOWS:
+		import win32file
+		for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+			drive = f"{letter}:/"
+			try:
+				drive_type = win32file.GetDriveType(drive)
+				if os.path.exists(drive):
+					if drive_type == win32file.DRIVE_REMOTE:
+						drives.append(f"{drive} (Network)")
+					else:
+						drives.append(drive)
+			except Exception as e:
+				logging.warning(f"Skipping drive {drive}: {e}")
+		return drives
+
+	try:
+		import psutil
+		for p in psutil.disk_partitions(all=False):
+			if os.path.ismount(p.mountpoint) and p.fstype:
+				drives.append(p.mountpoint)
+	except Exception as e:
+		logging.warning(f"Fallback: Could not list drives with psutil: {e}")
+		for base in ["/mnt", "/media", "/Volumes"]:
+			if os.path.exists(base):
+				for item in os.listdir(base):
+					full_path = os.path.join(base, item)
+					if os.path.ismount(full_path):
+						drives.append(full_path)
+	return drives
+
+def nearest_existing(path):
+	"""path itself, or its closest parent that exists yet"""
+	path = os.path.abspath(path)
+	while not os.path.exists(path):
+		parent = os.path.dirname(path)
+		if parent == path:
+			break
+		path = parent
+	return path
+
+def _sysfs_rotational(block_dir, depth=0):
+	"""True/False from queue/rotational of a /sys/class/block entry, or None if it has none"""
+	# Partitions keep their queue on the parent disk
+	for candidate in (block_dir, os.path.dirname(block_dir)):
+		if os.path.basename(candidate).startswith(VIRTUAL_DISK_PREFIXES):
+			return None
+		try:
+			with open(os.path.join(candidate, "queue", "rotational")) as f:
+				rotational = f.read().strip() == "1"
+		except OSError:
+			continue
+		# LVM, RAID and dm-crypt: rotational if any disk underneath is
+		slaves_dir = os.path.join(candidate, "slaves")
+		slaves = os.listdir(slaves_dir) if os.path.isdir(slaves_dir) else []
+		if slaves and depth < 4:
+			found = [_sysfs_rotational(os.path.realpath(os.path.join(slaves_dir, s)), depth + 1) for s in slaves]
+			found = [r for r in found if r is not None]
+			if found:
+				return any(found)
+		return rotational
+	return None
+
+def _linux_rotational(path):
+	st_dev = os.stat(path).st_dev
+	block_dir = os.path.realpath(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}")
+	if not os.path.isdir(block_dir):
+		return None		# tmpfs, overlayfs, btrfs subvolumes and other devices without a block queue
+	return _sysfs_rotational(block_dir)
+
+def _windows_seek_penalty(path):
+	drive = os.path.splitdrive(os.path.abspath(path))[0]
+	if not drive:
+		return None
+	import win32file
+	handle = win32file.CreateFile(
+		f"\\\\.\\{drive}", 0, win32file.FILE_SHARE_READ | win32file.FILE_SHARE_WRITE,
+		None, win32file.OPEN_EXISTING, 0, None
+	)
+	try:
+		# STORAGE_PROPERTY_QUERY in, DEVICE_SEEK_PENALTY_DESCRIPTOR (version, size, BOOLEAN) out
+		query = struct.pack("<III", STORAGE_DEVICE_SEEK_PENALTY_PROPERTY, 0, 0)
+		result = win32file.DeviceIoControl(handle, IOCTL_STORAGE_QUERY_PROPERTY, query, 12)
+		return bool(result[8])
+	finally:
+		handle.Close()
+
+def classify_device(path):
+	"""DEVICE_HDD, DEVICE_SSD, DEVICE_NETWORK or DEVICE_UNKNOWN for the drive path is on"""
+	if is_network_path(path):
+		return DEVICE_NETWORK
+	try:
+		if IS_LINUX:
+			rotational = _linux_rotational(path)
+		elif IS_WINDOWS:
+			rotational = _windows_seek_penalty(path)
+		else:
+			rotational = None
+	except Exception as e:
+		logging.warning(f"Could not classify the drive of {path}: {e}")
+		rotational = None
+	if rotational is None:
+		return DEVICE_UNKNOWN
+	return DEVICE_HDD if rotational else DEVICE_SSD
+
+class IOPolicy:
+	"""How hard to push a move between two devices, picked by choose_policy()"""
+	__slots__ = ('source_kind', 'destination_kind', 'threads', 'order_by_inode')
+
+	def __init__(self, source_kind, destination_kind, threads, order_by_inode):
+		self.source_kind = source_kind
+		self.destination_kind = destination_kind
+		self.threads = threads
+		self.order_by_inode = order_by_inode
+
+	def __str__(self):
+		order = ", reads in inode order" if self.order_by_inode else ""
+		return f"source {self.source_kind}, destination {self.destination_kind}: {self.threads} threads{order}"
+
+	def as_dict(self):
+		return {slot: getattr(self, slot) for slot in self.__slots__}
+
+def choose_policy(source, destination, default_threads):
+	"""
+	Concurrency for moving source to destination. A spinning disk on either side caps the
+	move at HDD_THREADS, since more streams only make its heads seek between them, and an
+	HDD source is read in inode order, which on most filesystems follows the on-disk layout.
+	A network share gets at least NETWORK_THREADS; SSDs and unknown devices the default.
+	"""
+	kinds = (classify_device(source), classify_device(nearest_existing(destination)))
+
+	if DEVICE_HDD in kinds:
+		threads = min(HDD_THREADS, default_threads)
+	elif DEVICE_NETWORK in kinds:
+		threads = max(NETWORK_THREADS, default_threads)
+	else:
+		threads = default_threads
+	return IOPolicy(kinds[0], kinds[1], threads, kinds[0] == DEVICE_HDD)
+
+def order_by_inode(manifest):
+	"""
+	The manifest's files sorted by the inode numbers the scan recorded for them. Files the
+	listing gave no inode for (on Windows) are stat'ed here; ones that vanished sort last.
+	"""
+	keyed = []
+	for entry, inode in zip(manifest.files, manifest.inodes):
+		if not inode:
+			try:
+				inode = os.stat(os.path.join(manifest.root, entry[0]), follow_symlinks=False).st_ino
+			except OSError:
+				inode = float('inf')
+		keyed.append((inode, entry))
+	keyed.sort(key=lambda item: item[0])
+	return [entry for _, entry in keyed]
@@ -0,0 +1,119 @@
+"""
+	GameVault-Relocator - resumable HTTP downloads
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import os
+import hashlib
+import logging
+
+import requests
+
+CHUNK_SIZE = 1024 * 1024
+RETRIES = 3				# reconnects after a dropped connection, each resuming with a Range request
+TIMEOUT = (10, 30)		# connect, read, in seconds
+
+class ChecksumMismatch(OSError):
+	"""The downloaded file does not match the SHA-256 the release published"""
+
+def make_session(user_agent="GameVault-Relocator"):
+	"""One Session for the update check and the download, so they share pooled keep-alive connections"""
+	session = requests.Session()
+	session.headers["User-Agent"] = user_agent
+	return session
+
+def parse_digest(digest):
+	"""Hex SHA-256 from a GitHub asset digest like "sha256:ab12...", or None for anything else"""
+	if digest and digest.lower().startswith("sha256:"):
+		return digest[7:].lower()
+	return None
+
+def _hash_existing(path, sha):
+	"""Feed the bytes already on disk into sha, returning how many there were"""
+	size = 0
+	with open(path, "rb") as f:
+		for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+			sha.update(chunk)
+			size += len(chunk)
+	return size
+
+def download_file(url, path, session=None, expected_sha256=None, progress_callback=None, stop_event=None):
+	"""
+	Download url to path and return its SHA-256 as hex, or None if stop_event was set.
+
+	Data goes to path + ".part" first. An existing .part, from a canceled or crashed earlier
+	attempt or a connection that dropped mid-way, is continued with a Range request; a server
+	that ignores the range gets a fresh download. The hash is computed while streaming, so the
+	file is never read back. progress_callback(downloaded, total) runs per chunk with total 0
+	when the server sends no length. Raises ChecksumMismatch, deleting the file, if the hash
+	differs from expected_sha256, and requests.RequestException once the retries run out.
+	"""
+	session = session or make_session()
+	part_path = path + ".part"
+	attempt = 0
+
+	while True:
+		sha = hashlib.sha256()
+		downloaded = _hash_existing(part_path, sha) if os.path.exists(part_path) else 0
+		# Byte offsets only line up with the file if the body isn't compressed in transit
+		headers = {"Accept-Encoding": "identity"}
+		if downloaded:
+			headers["Range"] = f"bytes={downloaded}-"
+
+		try:
+			with session.get(url, headers=headers, stream=True, timeout=TIMEOUT) as response:
+				if response.status_code == 416:
+					# Nothing left past our offset: the .part is complete or stale, start over
+					logging.info(f"Server refused resuming at {downloaded:,} bytes, downloading again")
+					os.remove(part_path)
+					continue
+				response.raise_for_status()
+
+				if downloaded and response.status_code == 206:
+					# "Content-Range: bytes 1048576-5242879/5242880" must start where the .part ends
+					resumed_at = response.headers.get("content-range", "").partition(" ")[2].partition("-")[0]
+					if resumed_at != str(downloaded):
+						logging.info(f"Server resumed at {resumed_at or '?'} instead of {downloaded:,}, downloading again")
+						os.remove(part_path)
+						continue
+				if downloaded and response.status_code != 206:
+					logging.info("Server ignored the Range request, downloading from the start")
+					sha = hashlib.sha256()
+					downloaded = 0
+				elif downloaded:
+					logging.info(f"Resuming download at {downloaded:,} bytes")
+
+				length = int(response.headers.get("content-length") or 0)
+				total = downloaded + length if length else 0
+
+				with open(part_path, "ab" if downloaded else "wb") as f:
+					for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+						if stop_event is not None and stop_event.is_set():
+							logging.info(f"Download stopped at {downloaded:,} bytes, kept for resuming: {part_path}")
+							return None
+						f.write(chunk)
+						sha.update(chunk)
+						downloaded += len(chunk)
+						if progress_callback:
+							progress_callback(downloaded, total)
+
+			if total and downloaded < total:
+				raise requests.ConnectionError(f"Connection closed at {downloaded:,} of {total:,} bytes")
+			break
+
+		except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+			attempt += 1
+			if attempt > RETRIES:
+				raise
+			logging.warning(f"Download interrupted ({e}), resuming (attempt {attempt} of {RETRIES})")
+
+	digest = sha.hexdigest()
+	if expected_sha256 and digest != expected_sha256.lower():
+		os.remove(part_path)
+		raise ChecksumMismatch(f"SHA-256 mismatch for {url}: expected {expected_sha256}, got {digest}")
+	os.replace(part_path, path)
+	logging.info(f"Downloaded {downloaded:,} bytes to {path}, SHA-256 {digest}"
+				 + (" (verified)" if expected_sha256 else " (no published checksum to verify)"))
+	return digest
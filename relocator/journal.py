@@ -0,0 +1,104 @@
+"""
+	GameVault-Relocator - transfer journal
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import os
+import json
+import glob
+import time
+import logging
+
+class TransferJournal:
+	"""
+	Append-only record of the files a move has completed, so an interrupted move can be resumed.
+
+	The first line is a JSON header with the source and destination. Each completed file
+	follows as one JSON string (its path relative to the source), and a finished move ends
+	with a {"done": true} line. Records are buffered and written + fsync'd in batches, so
+	journaling costs one sync per batch_size files or batch_seconds, whichever comes first.
+	"""
+	def __init__(self, path, source, destination, batch_size=1000, batch_seconds=2.0):
+		self.path = path
+		self.source = source
+		self.destination = destination
+		self.batch_size = batch_size
+		self.batch_seconds = batch_seconds
+		self.completed = set()
+		self._buffer = []
+		self._last_flush = time.monotonic()
+
+		if os.path.exists(path):
+			header, self.completed, _ = self.load(path)
+			if header.get("source") != source or header.get("destination") != destination:
+				raise ValueError(f"Journal {path} belongs to a different move")
+			self._file = open(path, "a", encoding="utf-8")
+		else:
+			self._file = open(path, "a", encoding="utf-8")
+			self._file.write(json.dumps({
+				"source": source, "destination": destination, "started": time.time()
+			}) + "\n")
+			self._sync()
+
+	@staticmethod
+	def load(path):
+		"""Read a journal. Returns (header, completed relative paths, done flag)"""
+		header = {}
+		completed = set()
+		done = False
+		with open(path, "r", encoding="utf-8") as f:
+			for line_no, line in enumerate(f):
+				try:
+					record = json.loads(line)
+				except ValueError:
+					# A crash can leave the last line half written
+					continue
+				if line_no == 0 and isinstance(record, dict):
+					header = record
+				elif isinstance(record, str):
+					completed.add(record)
+				elif isinstance(record, dict) and record.get("done"):
+					done = True
+		return header, completed, done
+
+	def record(self, rel_path):
+		self.completed.add(rel_path)
+		self._buffer.append(json.dumps(rel_path))
+		if len(self._buffer) >= self.batch_size or time.monotonic() - self._last_flush >= self.batch_seconds:
+			self.flush()
+
+	def flush(self):
+		if self._buffer:
+			self._file.write("\n".join(self._buffer) + "\n")
+			self._buffer = []
+			self._sync()
+		self._last_flush = time.monotonic()
+
+	def _sync(self):
+		self._file.flush()
+		os.fsync(self._file.fileno())
+
+	def close(self, done=False):
+		try:
+			self.flush()
+			if done:
+				self._file.write(json.dumps({"done": True, "finished": time.time()}) + "\n")
+				self._sync()
+		except OSError as e:
+			logging.error(f"Could not write journal {self.path}: {e}")
+		finally:
+			self._file.close()
+
+def find_resumable_journal(log_dir, source, destination, kind="move"):
+	"""Newest unfinished kind ("move" or "precopy") journal in log_dir for this source/destination, or None"""
+	journals = sorted(glob.glob(os.path.join(log_dir, f"{kind}_*.journal")), key=os.path.getmtime, reverse=True)
+	for path in journals:
+		try:
+			header, completed, done = TransferJournal.load(path)
+		except OSError:
+			continue
+		if not done and header.get("source") == source and header.get("destination") == destination:
+			return path
+	return None
@@ -0,0 +1,834 @@
+"""
+	GameVault-Relocator - move engine
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import os
+import sys
+import time
+import hashlib
+import logging
+import subprocess
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from relocator.scanner import scan_directory
+from relocator.symlinker import remaining_files
+from relocator.fastcopy import move_file, copy_file, TransferCanceled
+from relocator.journal import TransferJournal
+from relocator.robocopy_log import RobocopyLogTail
+from relocator.devices import COARSE_MTIME_FS_TYPES, choose_policy, filesystem_type, nearest_existing, order_by_inode
+from relocator.telemetry import TransferTelemetry, FileProgress, ProgressThrottle
+
+IS_WINDOWS = sys.platform == "win32"
+
+def get_robocopy_thread_count():
+	try:
+		return min(os.cpu_count() or 4, 32)
+	except:
+		return 4
+
+def get_native_thread_count():
+	# Native moves are I/O bound, so allow more workers than CPU cores
+	try:
+		return min((os.cpu_count() or 4) * 2, 32)
+	except:
+		return 4
+
+def file_sha256(path):
+	digest = hashlib.sha256()
+	with open(path, 'rb') as f:
+		for block in iter(lambda: f.read(1024 * 1024), b''):
+			digest.update(block)
+	return digest.hexdigest()
+
+def _ignore(*args):
+	pass
+
+class MoveEngine:
+	"""
+	Moves (or pre-copies) one folder to its destination, picking a rename, Robocopy or the
+	native parallel copy. run() blocks and returns the message to show the user.
+
+	Progress goes to plain callbacks, coalesced to progress_interval seconds:
+	on_progress(percent), on_summary(text) and, every TELEMETRY_INTERVAL seconds,
+	on_telemetry(TransferTelemetry.snapshot()). stop() may be called from any thread.
+	"""
+	TELEMETRY_INTERVAL = 0.5
+	LARGE_FILE_BYTES = 16 * 1024 * 1024	# default for files that report progress while copying
+	SMALL_FILE_BYTES = 256 * 1024		# files below this are handed to workers in batches
+	BATCH_FILES = 256
+	BATCH_BYTES = 16 * 1024 * 1024
+	COARSE_MTIME_TOLERANCE_NS = 2 * 10 ** 9	# FAT and exFAT destinations round mtimes to 2 s
+
+	def __init__(self, source, destination, use_robocopy=False, preview_mode=False,
+				 total_files=0, total_bytes=0, thread_count=None, manifest=None, clone=False,
+				 resume_journal=None, precopy=False, precopy_journal=None, verify_hash=False,
+				 large_file_threshold=None, log_tag="", log_dir=None, progress_interval=0.1,
+				 on_progress=None, on_summary=None, on_telemetry=None):
+		self.source = source
+		self.destination = destination
+		self.use_robocopy = use_robocopy
+		self.preview_mode = preview_mode
+		self.total_files = total_files
+		self.total_bytes = total_bytes
+		self.thread_count = thread_count or get_native_thread_count()
+		self.fixed_thread_count = thread_count is not None	# the caller's choice beats the I/O policy
+		self.manifest = manifest
+		self.clone = clone
+		self.method_bytes = {}	# bytes moved per move_file() method, e.g. 'reflink'
+		self.resume_journal = resume_journal
+		self.journal = None
+		self.precopy = precopy					# copy only, keep the source for a later delta pass
+		self.precopy_journal = precopy_journal	# journal of an earlier pre-copy to sync against
+		self.verify_hash = verify_hash
+		self.large_file_threshold = large_file_threshold or self.LARGE_FILE_BYTES
+		self.transfer_stats = None
+		self.log_tag = log_tag		# appended to log/journal names, keeps concurrent batch jobs apart
+		self.completed = False		# every file reached the destination (and, for a move, left the source)
+		self.io_policy = None		# devices.IOPolicy picked for a cross-device move
+		self.log_dir = log_dir or os.path.abspath(".")
+		self.on_progress = on_progress or _ignore
+		self.on_summary = on_summary or _ignore
+		self.on_telemetry = on_telemetry or _ignore
+		self.progress_throttle = ProgressThrottle(self.send_progress, progress_interval)
+		self.telemetry_throttle = ProgressThrottle(self.send_telemetry, self.TELEMETRY_INTERVAL)
+		self._stop_requested = False
+		self._mtime_tolerance_ns = None
+		self.robocopy_process = None
+		self.rsync_process = None
+
+	def count_total_files(self, path):
+		"""Fallback if total_files was not provided"""
+		if hasattr(self, 'total_files') and self.total_files > 0:
+			return self.total_files
+		if self.manifest is None:
+			self.manifest = scan_directory(path)
+			self.total_bytes = self.manifest.total_bytes
+		return self.manifest.total_files
+
+	def move_with_retries(self, src, dest, retries=5, delay=2, progress_callback=None, quiet=False):
+		"""Returns the move_file() method used, or False if the file could not be moved. quiet logs success at debug level"""
+		log_success = logging.debug if quiet else logging.info
+		for attempt in range(1, retries + 1):
+			if self._stop_requested:
+				return False
+			try:
+				method = move_file(src, dest, clone=self.clone, progress_callback=progress_callback,
+								   should_cancel=self.is_canceled)
+				log_success(f"Moved ({method}): {src} -> {dest}")
+				return method
+			except TransferCanceled:
+				logging.info(f"Canceled mid-file, partial copy removed: {src}")
+				return False
+			except PermissionError:
+				logging.warning(f"Attempt {attempt}: File in use - {src}")
+				time.sleep(delay)
+			except Exception as e:
+				logging.error(f"Error moving file {src}: {e}")
+				return False
+		return False
+
+	def mtime_tolerance_ns(self):
+		"""How far a copy's mtime may be off its source's: 0, or 2 s on a FAT/exFAT destination"""
+		if self._mtime_tolerance_ns is None:
+			fs_type = filesystem_type(nearest_existing(self.destination))
+			coarse = fs_type in COARSE_MTIME_FS_TYPES
+			self._mtime_tolerance_ns = self.COARSE_MTIME_TOLERANCE_NS if coarse else 0
+		return self._mtime_tolerance_ns
+
+	def files_match(self, src, dest):
+		"""
+		True if dest already holds src's data: same size and mtime to the nanosecond, plus same
+		SHA-256 if verify_hash. Both files are stat'ed now rather than trusting the scan, since a
+		match means the source gets deleted and a file may have been rewritten since it was scanned.
+		"""
+		try:
+			dest_st = os.stat(dest)
+			src_st = os.stat(src)
+		except FileNotFoundError:
+			return False
+		except OSError as e:
+			logging.warning(f"Could not check earlier copy of {src}: {e}")
+			return False
+
+		if dest_st.st_size != src_st.st_size:
+			return False
+		if abs(dest_st.st_mtime_ns - src_st.st_mtime_ns) > self.mtime_tolerance_ns():
+			return False
+		if self.verify_hash:
+			return file_sha256(src) == file_sha256(dest)
+		return True
+
+	def move_unless_copied(self, src, dest, progress_callback=None, quiet=False):
+		"""Like move_with_retries, but a file a pre-copy or interrupted run already copied only loses its source"""
+		if self.files_match(src, dest):
+			try:
+				os.unlink(src)
+				(logging.debug if quiet else logging.info)(f"Already copied, removed source: {src}")
+				return 'unchanged'
+			except OSError as e:
+				logging.warning(f"Could not remove already copied source {src}: {e}")
+		return self.move_with_retries(src, dest, progress_callback=progress_callback, quiet=quiet)
+
+	def copy_with_retries(self, src, dest, retries=5, delay=2, progress_callback=None, quiet=False):
+		"""Pre-copy worker: copy src unless dest is already current. Returns the method used or False"""
+		log_success = logging.debug if quiet else logging.info
+		if self.files_match(src, dest):
+			return 'unchanged'
+		for attempt in range(1, retries + 1):
+			if self._stop_requested:
+				return False
+			try:
+				method = copy_file(src, dest, clone=self.clone, progress_callback=progress_callback,
+								   should_cancel=self.is_canceled)
+				log_success(f"Copied ({method}): {src} -> {dest}")
+				return method
+			except TransferCanceled:
+				logging.info(f"Canceled mid-file, partial copy removed: {src}")
+				return False
+			except PermissionError:
+				logging.warning(f"Attempt {attempt}: File in use - {src}")
+				time.sleep(delay)
+			except Exception as e:
+				logging.error(f"Error copying file {src}: {e}")
+				return False
+		return False
+
+	def transfer_file(self, rel_path, check_existing, progress_callback=None, quiet=False):
+		"""Move (or for a pre-copy, copy) one file from the manifest. Returns the method used or False"""
+		src = os.path.join(self.source, rel_path)
+		dest = os.path.join(self.destination, rel_path)
+		if self.precopy:
+			return self.copy_with_retries(src, dest, progress_callback=progress_callback, quiet=quiet)
+		if check_existing:
+			return self.move_unless_copied(src, dest, progress_callback=progress_callback, quiet=quiet)
+		return self.move_with_retries(src, dest, progress_callback=progress_callback, quiet=quiet)
+
+	def transfer_batch(self, batch, check_existing):
+		"""
+		Worker for a batch of small files. Returns [(rel_path, file_size, method)] for the files moved.
+
+		One log line covers the whole batch; failures are still logged per file.
+		"""
+		results = []
+		for rel_path, file_size, _ in batch:
+			if self._stop_requested:
+				break
+			method = self.transfer_file(rel_path, check_existing, quiet=True)
+			if method:
+				results.append((rel_path, file_size, method))
+
+		if results:
+			verb = "Copied" if self.precopy else "Moved"
+			logging.info(f"{verb} {len(results)} small files: {results[0][0]} ... {results[-1][0]}")
+		return results
+
+	def is_canceled(self):
+		"""Checked by the copy routines between chunks, so cancel doesn't wait for a huge file"""
+		return self._stop_requested
+
+	def count_delta(self):
+		"""Files/bytes that differ from the destination, i.e. what a delta pass would still move"""
+		changed_files = 0
+		changed_bytes = 0
+		for rel_path, file_size, _ in self.manifest.files:
+			if not self.files_match(os.path.join(self.source, rel_path), os.path.join(self.destination, rel_path)):
+				changed_files += 1
+				changed_bytes += file_size
+		return changed_files, changed_bytes
+
+	def finish_precopy(self):
+		"""After the final delta pass: drop pre-copied files deleted from the source since, and close the pre-copy journal"""
+		try:
+			journal = TransferJournal(self.precopy_journal, self.source, self.destination)
+		except (OSError, ValueError) as e:
+			logging.warning(f"Could not close pre-copy journal {self.precopy_journal}: {e}")
+			return
+
+		current = {rel_path for rel_path, _, _ in self.manifest.files}
+		for rel_path in journal.completed - current:
+			stale = os.path.join(self.destination, rel_path)
+			try:
+				os.remove(stale)
+				logging.info(f"Removed file deleted from source since pre-copy: {stale}")
+			except FileNotFoundError:
+				pass
+			except OSError as e:
+				logging.warning(f"Could not remove stale pre-copied file {stale}: {e}")
+		journal.close(done=True)
+
+	def emit_progress(self, moved_files, moved_bytes, total_files, force=False):
+		"""Throttled to progress_interval, so tiny files don't flood the UI thread with updates"""
+		self.progress_throttle.update(moved_files, moved_bytes, total_files, force=force)
+		self.telemetry_throttle.update(force=force)
+
+	def send_progress(self, moved_files, moved_bytes, total_files):
+		# Byte based, including the copied part of files still in flight
+		if self.transfer_stats is not None and self.total_bytes > 0:
+			moved_bytes = self.transfer_stats.current_bytes()
+			progress = int((moved_bytes / self.total_bytes) * 100)
+		else:
+			progress = int((moved_files / total_files) * 100)
+		remaining_gb = max(self.total_bytes - moved_bytes, 0) / (1024**3)
+
+		self.on_summary(f"Remaining: {max(total_files - moved_files, 0):,} files | {remaining_gb:.2f} GB")
+		self.on_progress(min(progress, 100))
+
+	def send_telemetry(self):
+		if self.transfer_stats is not None:
+			self.on_telemetry(self.transfer_stats.snapshot())
+
+	def is_same_device(self):
+		"""True if source and destination are on the same filesystem, so a rename can move them"""
+		try:
+			dest = self.destination
+			while not os.path.exists(dest):
+				dest = os.path.dirname(dest)
+			return os.stat(self.source).st_dev == os.stat(dest).st_dev
+		except OSError as e:
+			logging.warning(f"Could not compare devices for {self.source} and {self.destination}: {e}")
+			return False
+
+	def move_same_device(self, total_files):
+		"""
+		Move by renaming whole subtrees. Returns (moved_files, moved_bytes, canceled).
+
+		An empty destination is replaced by a single rename of the source. Otherwise each
+		entry is renamed into place, descending only into directories that already exist on
+		both sides (or that can't be renamed, e.g. because a file inside is in use).
+		"""
+		if self.manifest is None:
+			self.manifest = scan_directory(self.source)
+
+		# File/byte totals per subtree, so a single rename can be reported in full
+		subtree_totals = {}
+		sep = os.sep
+		for rel_path, file_size, _ in self.manifest.files:
+			parent = os.path.dirname(rel_path)
+			while True:
+				files, size = subtree_totals.get(parent, (0, 0))
+				subtree_totals[parent] = (files + 1, size + file_size)
+				if not parent:
+					break
+				parent = os.path.dirname(parent)
+
+		try:
+			if os.path.isdir(self.destination) and not os.listdir(self.destination):
+				os.rmdir(self.destination)
+			if not os.path.exists(self.destination):
+				os.rename(self.source, self.destination)
+				logging.info(f"Renamed whole tree: {self.source} -> {self.destination}")
+				moved_files, moved_bytes = subtree_totals.get("", (0, 0))
+				self.transfer_stats.set_totals(moved_files, moved_bytes)
+				self.emit_progress(moved_files, moved_bytes, total_files, force=True)
+				return moved_files, moved_bytes, False
+		except OSError as e:
+			logging.warning(f"Whole-tree rename failed, merging per directory: {e}")
+			os.makedirs(self.destination, exist_ok=True)
+
+		moved_files = 0
+		moved_bytes = 0
+		stack = [""]
+		manifest_sizes = None
+
+		while stack:
+			if self._stop_requested:
+				return moved_files, moved_bytes, True
+
+			rel_dir = stack.pop()
+			src_dir = os.path.join(self.source, rel_dir) if rel_dir else self.source
+			try:
+				with os.scandir(src_dir) as it:
+					entries = list(it)
+			except OSError as e:
+				logging.error(f"Could not list {src_dir}: {e}")
+				continue
+
+			for entry in entries:
+				rel_path = rel_dir + sep + entry.name if rel_dir else entry.name
+				dest_path = os.path.join(self.destination, rel_path)
+				is_dir = entry.is_dir(follow_symlinks=False)
+
+				if is_dir:
+					if not os.path.exists(dest_path):
+						try:
+							os.rename(entry.path, dest_path)
+							logging.info(f"Renamed directory: {entry.path} -> {dest_path}")
+							files, size = subtree_totals.get(rel_path, (0, 0))
+							moved_files += files
+							moved_bytes += size
+							continue
+						except OSError as e:
+							logging.warning(f"Could not rename {entry.path}, moving its contents: {e}")
+							os.makedirs(dest_path, exist_ok=True)
+					stack.append(rel_path)
+				else:
+					if manifest_sizes is None:
+						manifest_sizes = {p: size for p, size, _ in self.manifest.files}
+					if self.move_with_retries(entry.path, dest_path):
+						moved_files += 1
+						moved_bytes += manifest_sizes.get(rel_path, 0)
+
+			self.transfer_stats.set_totals(moved_files, moved_bytes)
+			self.emit_progress(moved_files, moved_bytes, total_files)
+
+		self.emit_progress(moved_files, moved_bytes, total_files, force=True)
+		return moved_files, moved_bytes, False
+
+	def move_native(self, total_files):
+		"""
+		Move files with a bounded pool of workers. Returns (moved_files, moved_bytes, canceled).
+
+		Files of SMALL_FILE_BYTES and up get one task each. Smaller ones are grouped, in
+		manifest order, into batches of up to BATCH_FILES files or BATCH_BYTES, so ROM sets
+		with hundreds of thousands of tiny files don't pay for a future per file.
+		"""
+		moved_files = 0
+		moved_bytes = 0
+		max_pending = self.thread_count * 4
+		pending = set()
+
+		logging.info(f"Using native move with {self.thread_count} threads")
+
+		def file_moved(rel_path, file_size, method, reported=0):
+			nonlocal moved_files, moved_bytes
+			moved_files += 1
+			moved_bytes += file_size
+			self.method_bytes[method] = self.method_bytes.get(method, 0) + file_size
+			self.transfer_stats.file_done(file_size, reported)
+			if self.journal:
+				self.journal.record(rel_path)
+
+		def collect(done):
+			for future in done:
+				if future.cancelled():
+					continue
+				if future.batch:
+					try:
+						for rel_path, file_size, method in future.result():
+							file_moved(rel_path, file_size, method)
+					except Exception as e:
+						logging.error(f"Error in move worker: {e}")
+					continue
+
+				reported = future.file_progress.reported if future.file_progress else 0
+				try:
+					method = future.result()
+					if method:
+						file_moved(future.rel_path, future.file_size, method, reported)
+					else:
+						self.transfer_stats.file_failed(reported)
+				except Exception as e:
+					logging.error(f"Error in move worker: {e}")
+					self.transfer_stats.file_failed(reported)
+
+			self.emit_progress(moved_files, moved_bytes, total_files)
+
+		def submit(fn, *args, **kwargs):
+			nonlocal pending
+			# Keep the queue bounded so huge trees don't pile up futures
+			while len(pending) >= max_pending:
+				done, pending = wait(pending, timeout=self.TELEMETRY_INTERVAL, return_when=FIRST_COMPLETED)
+				collect(done)
+			future = pool.submit(fn, *args, **kwargs)
+			pending.add(future)
+			return future
+
+		if self.manifest is None:
+			self.manifest = scan_directory(self.source)
+
+		# Create the whole destination tree up front instead of once per file
+		os.makedirs(self.destination, exist_ok=True)
+		for rel_dir in self.manifest.dirs:
+			os.makedirs(os.path.join(self.destination, rel_dir), exist_ok=True)
+
+		# Only a resumed move may skip journaled files; a repeated pre-copy re-checks them
+		completed = self.journal.completed if self.journal and self.resume_journal else ()
+		check_existing = bool(self.resume_journal or self.precopy_journal)
+
+		files = self.manifest.files
+		if self.io_policy is not None and self.io_policy.order_by_inode:
+			# A spinning source reads close to sequentially instead of seeking per directory
+			files = order_by_inode(self.manifest)
+
+		with ThreadPoolExecutor(max_workers=self.thread_count) as pool:
+			batch = []
+			batch_bytes = 0
+
+			for entry in files:
+				if self._stop_requested:
+					break
+				rel_path, file_size, _ = entry
+				if rel_path in completed:
+					continue
+
+				if file_size < self.SMALL_FILE_BYTES:
+					batch.append(entry)
+					batch_bytes += file_size
+					if len(batch) >= self.BATCH_FILES or batch_bytes >= self.BATCH_BYTES:
+						submit(self.transfer_batch, batch, check_existing).batch = True
+						batch = []
+						batch_bytes = 0
+					continue
+
+				file_progress = FileProgress(self.transfer_stats) if file_size >= self.large_file_threshold else None
+				future = submit(self.transfer_file, rel_path, check_existing, progress_callback=file_progress)
+				future.batch = False
+				future.rel_path = rel_path
+				future.file_size = file_size
+				future.file_progress = file_progress
+
+			if batch and not self._stop_requested:
+				submit(self.transfer_batch, batch, check_existing).batch = True
+
+			# Queued files are dropped on cancel; files in flight stop at their next chunk
+			# and remove their partial copy. The timeout keeps progress flowing while
+			# a single huge file copies.
+			if self._stop_requested:
+				for future in pending:
+					future.cancel()
+			while pending:
+				done, pending = wait(pending, timeout=self.TELEMETRY_INTERVAL, return_when=FIRST_COMPLETED)
+				collect(done)
+
+		self.emit_progress(moved_files, moved_bytes, total_files, force=True)
+		return moved_files, moved_bytes, self._stop_requested
+
+	def files_left_in_source(self):
+		"""True if the move left anything but empty folders in the source, e.g. a folder the scan missed"""
+		try:
+			left = remaining_files(self.source)
+		except FileNotFoundError:
+			return False
+		except OSError as e:
+			logging.error(f"Could not check {self.source} for files left behind: {e}")
+			return True
+		if left:
+			logging.error(f"Files are still in {self.source} after the move, e.g. {left[0]}")
+		return bool(left)
+
+	def remove_empty_dirs(self, path, retries=3, delay=2):
+		if self.manifest is not None and self.manifest.root == path:
+			# The manifest lists parents before children, so go backwards
+			for rel_dir in reversed(self.manifest.dirs):
+				dir_path = os.path.join(path, rel_dir)
+				try:
+					os.rmdir(dir_path)
+					logging.info(f"Removed empty dir: {dir_path}")
+				except OSError:
+					pass
+			return True
+
+		for attempt in range(1, retries + 1):
+			try:
+				for root, dirs, _ in os.walk(path, topdown=False):
+					for dir in dirs:
+						dir_path = os.path.join(root, dir)
+						if not os.listdir(dir_path):
+							os.rmdir(dir_path)
+							logging.info(f"Removed empty dir: {dir_path}")
+				return True
+			except Exception as e:
+				logging.warning(f"Attempt {attempt}: Failed to remove empty dirs in {path}: {e}")
+				time.sleep(delay)
+		logging.error(f"Final attempt failed: Could not remove {path}")
+		return False
+
+	def run(self):
+		try:
+			# Use pre-counted value if available
+			if self.total_files > 0:
+				total_files = self.total_files
+			else:
+				total_files = self.count_total_files(self.source)
+
+			if total_files == 0:
+				self.on_progress(100)
+				return "No files found in source directory."
+
+			moved_files = 0
+			moved_bytes = 0
+			start_time = time.time()
+			log_file = None
+
+			log_dir = self.log_dir
+			os.makedirs(log_dir, exist_ok=True)
+			timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + self.log_tag
+
+			if self.preview_mode:
+				total_files = self.total_files if self.total_files > 0 else 0
+				total_size_gb = self.total_bytes / (1024 ** 3) if getattr(self, 'total_bytes', 0) > 0 else 0
+				
+				logging.info(f"Preview mode - Using total_bytes = {self.total_bytes:,} → {total_size_gb:.2f} GB")
+
+				delta_msg = ""
+				if self.precopy_journal and self.manifest is not None:
+					changed_files, changed_bytes = self.count_delta()
+					delta_msg = (
+						f"\n\nChanged since pre-copy: {changed_files:,} files "
+						f"({changed_bytes / (1024 ** 3):.2f} GB)"
+					)
+
+				return (
+					f"[PREVIEW MODE - No files were moved]\n\n"
+					f"Would move {total_files:,} files from:\n"
+					f"{self.source}\n"
+					f"to\n"
+					f"{self.destination}\n\n"
+					f"Total size: {total_size_gb:.2f} GB"
+					f"{delta_msg}"
+				)
+
+			same_device = self.is_same_device()
+			use_robocopy = IS_WINDOWS and self.use_robocopy and not same_device
+
+			if self.precopy and same_device:
+				return (
+					"Source and destination are on the same drive, so the move is a quick rename.\n\n"
+					"No pre-copy is needed. Start the move without Pre-copy."
+				)
+
+			self.transfer_stats = TransferTelemetry(total_files, self.total_bytes)
+
+			# Concurrency per device type, e.g. 2 threads instead of 32 against a spinning disk
+			if not same_device:
+				default_threads = get_robocopy_thread_count() if use_robocopy else self.thread_count
+				self.io_policy = choose_policy(self.source, self.destination, default_threads)
+				if self.fixed_thread_count:
+					self.io_policy.threads = self.thread_count
+				self.thread_count = self.io_policy.threads
+				logging.info(f"I/O policy: {self.io_policy}")
+
+			# ====================== SAME DRIVE (Rename) ======================
+			if same_device:
+				log_file = os.path.join(log_dir, f"move_{timestamp}.log")
+				logging.info("Source and destination share a drive, moving by rename")
+				moved_files, moved_bytes, canceled = self.move_same_device(total_files)
+
+				if canceled:
+					return "Transfer canceled by user."
+				all_transferred = moved_files >= total_files
+
+				if os.path.exists(self.source) and not self.remove_empty_dirs(self.source):
+					logging.error(f"Could not remove empty directories in {self.source}")
+
+			# ====================== ROBOCOPY (Primary Path) ======================
+			elif use_robocopy:
+				log_file = os.path.join(log_dir, f"robocopy_{timestamp}.log")
+				thread_count = self.thread_count
+				logging.info(f"Using Robocopy with {thread_count} threads")
+
+				# A pre-copy leaves the source in place; the later /MOVE pass skips unchanged files
+				robocopy_command = [
+					"robocopy", self.source, self.destination,
+					"/E", "/NP", "/BYTES", "/R:3", "/W:2",
+					f"/MT:{thread_count}",
+					f"/LOG:{log_file}"
+				]
+				if not self.precopy:
+					robocopy_command.insert(4, "/MOVE")
+
+				si = subprocess.STARTUPINFO()
+				si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+				si.wShowWindow = subprocess.SW_HIDE
+
+				self.robocopy_process = subprocess.Popen(
+					robocopy_command,
+					stdout=subprocess.DEVNULL,
+					stderr=subprocess.DEVNULL,
+					startupinfo=si
+				)
+
+				time.sleep(1.0)
+
+				# Only the newly appended part of the log is parsed on each poll
+				log_tail = RobocopyLogTail(log_file, byte_sizes=True)
+
+				while self.robocopy_process.poll() is None:
+					if self._stop_requested:
+						self.robocopy_process.terminate()
+						return "Transfer canceled by user."
+
+					try:
+						log_tail.poll()
+					except Exception as e:
+						logging.warning(f"Could not read Robocopy log: {e}")
+
+					moved_files = log_tail.copied_files
+					self.transfer_stats.set_totals(moved_files, log_tail.copied_bytes)
+					self.emit_progress(moved_files, log_tail.copied_bytes, total_files)
+
+					time.sleep(0.7)
+
+				self.robocopy_process.wait()
+				time.sleep(0.5)	 # Give Robocopy time to finish writing the log
+
+				if self._stop_requested:
+					return "Transfer canceled by user."
+
+				try:
+					log_tail.finish()
+				except Exception as e:
+					logging.warning(f"Could not read Robocopy log: {e}")
+				moved_files = log_tail.copied_files
+				moved_bytes = log_tail.copied_bytes
+				self.transfer_stats.set_totals(moved_files, moved_bytes)
+				if log_tail.error_count:
+					logging.warning(f"Robocopy reported {log_tail.error_count} errors, last: {log_tail.errors[-1]}")
+
+				# The log only lists files Robocopy copied, so files a pre-copy already brought
+				# over are missing from moved_files. Exit codes below 8 mean nothing failed.
+				returncode = self.robocopy_process.returncode
+				all_transferred = returncode < 8
+				if not all_transferred:
+					logging.error(f"Robocopy exited with code {returncode}, some files were not copied")
+
+				if self.precopy:
+					# Mark the pre-copy so the final pass knows to sync against it
+					try:
+						TransferJournal(
+							self.precopy_journal or os.path.join(log_dir, f"precopy_{timestamp}.journal"),
+							self.source, self.destination
+						).close()
+					except (OSError, ValueError) as e:
+						logging.warning(f"Could not write pre-copy journal: {e}")
+
+				# Clean up source if empty (Robocopy specific)
+				elif os.path.exists(self.source):
+					try:
+						remaining = any(os.path.isfile(os.path.join(r, f)) 
+										for r, _, fs in os.walk(self.source) for f in fs)
+						if not remaining:
+							os.system(f'rmdir /S /Q "{self.source}"')
+							logging.info(f"Source directory removed: {self.source}")
+					except Exception as e:
+						logging.warning(f"Could not remove source: {e}")
+
+				if self.precopy_journal and not self.precopy and self.manifest is not None:
+					self.finish_precopy()
+
+			# ====================== NATIVE PYTHON MOVE (Fallback) ======================
+			else:
+				log_file = os.path.join(log_dir, f"move_{timestamp}.log")
+
+				# One record per completed file, so a crash or cancel can be resumed
+				if self.precopy:
+					journal_file = self.precopy_journal or os.path.join(log_dir, f"precopy_{timestamp}.journal")
+				elif self.resume_journal:
+					journal_file = self.resume_journal
+				else:
+					journal_file = os.path.join(log_dir, f"move_{timestamp}.journal")
+				try:
+					self.journal = TransferJournal(journal_file, self.source, self.destination)
+					if self.journal.completed:
+						logging.info(f"Resuming from {journal_file}: {len(self.journal.completed):,} files already moved")
+				except (OSError, ValueError) as e:
+					logging.warning(f"Could not open transfer journal, move won't be resumable: {e}")
+					self.journal = None
+
+				finished_all = False
+				try:
+					moved_files, moved_bytes, canceled = self.move_native(total_files)
+					finished_all = not canceled and moved_files >= total_files
+				finally:
+					if self.journal:
+						# A pre-copy journal stays open until the final delta pass
+						self.journal.close(done=finished_all and not self.precopy)
+
+				if canceled:
+					return (
+						"Transfer canceled by user.\n\n"
+						"Start the same move again to resume where it stopped."
+					)
+
+				if self.precopy_journal and not self.precopy and finished_all:
+					self.finish_precopy()
+				all_transferred = finished_all
+
+				if not self.precopy and not self.remove_empty_dirs(self.source):
+					logging.error(f"Could not remove empty directories in {self.source}")
+
+			# ====================== FINAL SUMMARY ======================
+			elapsed_time = time.time() - start_time
+
+			moved_gb = moved_bytes / (1024 ** 3)
+
+			self.emit_progress(moved_files, moved_bytes, total_files, force=True)
+			self.on_progress(100)
+
+			engine = "rename" if same_device else "robocopy" if use_robocopy else "native"
+			avg_mb_per_sec = self.transfer_stats.average_mb_per_sec()
+			stats_file = os.path.join(log_dir, f"move_{timestamp}.stats.json")
+			try:
+				self.transfer_stats.write_stats(
+					stats_file,
+					source=self.source,
+					destination=self.destination,
+					engine=engine,
+					precopy=self.precopy,
+					threads=self.thread_count,
+					io_policy=self.io_policy.as_dict() if self.io_policy else None,
+					bytes_by_method=self.method_bytes,
+					canceled=False
+				)
+			except OSError as e:
+				logging.warning(f"Could not write transfer stats: {e}")
+			policy_msg = f", {self.io_policy}" if self.io_policy else ""
+			logging.info(f"Transfer finished ({engine}{policy_msg}): {moved_gb:.2f} GB at {avg_mb_per_sec:.1f} MB/s average")
+
+			# A pre-copy keeps its source on purpose; a move must not leave anything behind
+			self.completed = all_transferred and (self.precopy or not self.files_left_in_source())
+
+			if self.precopy:
+				unchanged = self.method_bytes.get('unchanged', 0)
+				copied_gb = (moved_bytes - unchanged) / (1024 ** 3)
+				return (
+					f"Pre-copy completed to:\n{self.destination}\n\n"
+					f"Files copied: {moved_files:,} / {total_files:,}\n"
+					f"Copied      : {copied_gb:.2f} GB ({unchanged / (1024 ** 3):.2f} GB already up to date)\n"
+					f"Time taken  : {elapsed_time:.2f} seconds\n"
+					f"Throughput  : {avg_mb_per_sec:.1f} MB/s\n\n"
+					"The source was left in place and is still usable.\n"
+					"Run the move again without Pre-copy to sync only the files changed since now "
+					"and create the symlink."
+				)
+
+			# Nice final message
+			if self.completed:
+				status_msg = "All files successfully transferred ✅"
+			else:
+				status_msg = f"Files moved: {moved_files} / {total_files}"
+
+			clone_msg = ""
+			if self.clone and not same_device and not use_robocopy:
+				cloned_gb = self.method_bytes.get('reflink', 0) / (1024 ** 3)
+				copied_gb = sum(
+					b for m, b in self.method_bytes.items() if m not in ('reflink', 'rename', 'unchanged')
+				) / (1024 ** 3)
+				clone_msg = f"Cloned      : {cloned_gb:.2f} GB | Copied: {copied_gb:.2f} GB\n"
+				logging.info(f"Reflink summary - cloned {cloned_gb:.2f} GB, copied {copied_gb:.2f} GB")
+
+			return (
+				f"{'Move completed successfully' if self.completed else 'Move incomplete, source kept'} to:\n{self.destination}\n\n"
+				f"{status_msg}\n"
+				f"Total size  : {moved_gb:.2f} GB\n"
+				f"{clone_msg}"
+				f"Time taken  : {elapsed_time:.2f} seconds\n"
+				f"Throughput  : {avg_mb_per_sec:.1f} MB/s\n"
+				f"Log file	  : {log_file}\n"
+				f"Stats file  : {stats_file}"
+			)
+
+		except Exception as e:
+			logging.exception("Error in MoveEngine.run()")
+			return f"Unexpected error during transfer:\n{str(e)}"
+			
+	def stop(self):
+		self._stop_requested = True
+		if self.robocopy_process and self.robocopy_process.poll() is None:
+			self.robocopy_process.terminate()
+		if self.rsync_process and self.rsync_process.poll() is None:
+			self.rsync_process.terminate()
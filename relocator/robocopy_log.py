@@ -0,0 +1,153 @@
+"""
+	GameVault-Relocator - incremental Robocopy log reader
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import re
+import codecs
+
+# File classes Robocopy logs when it actually copies (or, with /MOVE, moves) a file
+COPIED_CLASSES = ("New File", "Newer", "Older", "Changed", "Tweaked")
+
+# Columns are tab separated: "\t    New File  \t\t    2048\tgame.zip". Without /BYTES the
+# size carries a unit after a space ("1.2 m"); the tab before the name is required so
+# a name starting with "g " is never read as a unit
+_FILE_LINE = re.compile(
+	r"^\s*(New File|Newer|Older|Changed|Tweaked|Same|\*EXTRA File|Modified|Lonely)\s+"
+	r"(\d+(?:\.\d+)?)(?: ([kmgt]))?\t(.*?)\s*$",
+	re.IGNORECASE
+)
+_BYTES_FILE_LINE = re.compile(
+	r"^\s*(New File|Newer|Older|Changed|Tweaked|Same|\*EXTRA File|Modified|Lonely)\s+"
+	r"(\d+)()\t(.*?)\s*$",		# the empty group keeps the (class, size, unit, path) shape
+	re.IGNORECASE
+)
+# "\t                   3\tD:\Games\" or "\t  New Dir          3\tD:\Games\": file lines
+# that follow only carry the name, unless /MT is on and they carry the full path
+_DIR_LINE = re.compile(r"^\s*(?:New Dir\s+)?\d+\t(.*[\\/])\s*$", re.IGNORECASE)
+_ERROR_LINE = re.compile(r"\bERROR (\d+) \(0x[0-9A-Fa-f]+\) (.*?)\s*$")
+_COPY_ERROR = "Copying File "
+_UNITS = {"k": 1024, "m": 1024 ** 2, "g": 1024 ** 3, "t": 1024 ** 4}
+
+def _default_encoding():
+	# Robocopy's /LOG is written in the ANSI code page
+	try:
+		codecs.lookup("mbcs")
+		return "mbcs"
+	except LookupError:
+		return "utf-8"
+
+def _is_absolute(path):
+	return path.startswith("\\\\") or path.startswith("/") or path[1:3] in (":\\", ":/")
+
+def parse_line(line, byte_sizes=False):
+	"""
+	Classify one log line. Returns ("file", class, size, path), ("dir", path),
+	("error", code, message) or None for anything else. Sizes are exact with /BYTES and
+	approximate otherwise ("1.2 m"); pass byte_sizes=True for a /BYTES log so no unit is accepted.
+	"""
+	match = (_BYTES_FILE_LINE if byte_sizes else _FILE_LINE).match(line)
+	if match:
+		file_class, number, unit, path = match.groups()
+		size = float(number) * _UNITS[unit.lower()] if unit else float(number)
+		return ("file", file_class, int(size), path)
+
+	match = _DIR_LINE.match(line)
+	if match:
+		return ("dir", match.group(1))
+
+	match = _ERROR_LINE.search(line)
+	if match:
+		return ("error", int(match.group(1)), match.group(2))
+	return None
+
+class RobocopyLogTail:
+	"""
+	Follows a growing Robocopy log, parsing only the bytes appended since the last poll().
+
+	Keeps running totals of files/bytes copied and errors, so polling a log that grows to
+	hundreds of MB stays proportional to what was added instead of to the whole file.
+	Robocopy logs a file line before every attempt and an ERROR line after every failed one,
+	so an attempt that errors is taken back off the copied totals and error_count counts each
+	failing file once, however often /R: retried it. A file that succeeds on a retry is not
+	counted as an error.
+	"""
+	def __init__(self, path, encoding=None, max_errors=50, byte_sizes=False):
+		self.path = path
+		self.encoding = encoding or _default_encoding()
+		self.max_errors = max_errors
+		self.byte_sizes = byte_sizes
+		self.copied_files = 0
+		self.copied_bytes = 0
+		self.errors = []		# last max_errors (code, message) pairs, one per failing file
+		self._offset = 0
+		self._partial = b""
+		self._directory = ""
+		self._attempts = {}		# full path -> size of the copy attempt counted last
+		self._failing = set()	# messages of errors not followed by a successful retry
+		self._reported = set()
+
+	@property
+	def error_count(self):
+		return len(self._failing)
+
+	def poll(self):
+		"""Parse whatever was appended since the last call. Returns the number of new lines"""
+		try:
+			with open(self.path, "rb") as f:
+				f.seek(self._offset)
+				data = f.read()
+		except FileNotFoundError:
+			return 0
+
+		if not data:
+			return 0
+		self._offset += len(data)
+
+		lines = (self._partial + data).split(b"\n")
+		# The last piece may be a line Robocopy is still writing
+		self._partial = lines.pop()
+
+		for raw in lines:
+			self.feed(raw.decode(self.encoding, errors="replace"))
+		return len(lines)
+
+	def feed(self, line):
+		parsed = parse_line(line, self.byte_sizes)
+		if parsed is None:
+			return
+		if parsed[0] == "dir":
+			self._directory = parsed[1]
+		elif parsed[0] == "file":
+			_, file_class, size, name = parsed
+			if file_class in COPIED_CLASSES:
+				path = name if _is_absolute(name) else self._directory + name
+				self._failing.discard(_COPY_ERROR + path)		# retrying; an ERROR line follows if it fails again
+				self._attempts[path] = size
+				if len(self._attempts) > 4096:
+					# Only the last few attempts per copy thread can still fail
+					del self._attempts[next(iter(self._attempts))]
+				self.copied_files += 1
+				self.copied_bytes += size
+		else:
+			_, code, message = parsed
+			if message.startswith(_COPY_ERROR):
+				size = self._attempts.pop(message[len(_COPY_ERROR):], None)
+				if size is not None:
+					self.copied_files -= 1
+					self.copied_bytes -= size
+			self._failing.add(message)
+			if message not in self._reported:
+				self._reported.add(message)
+				self.errors.append((code, message))
+				if len(self.errors) > self.max_errors:
+					del self.errors[0]
+
+	def finish(self):
+		"""Parse the rest of the log, including a last line without a newline"""
+		self.poll()
+		if self._partial:
+			self.feed(self._partial.decode(self.encoding, errors="replace"))
+			self._partial = b""
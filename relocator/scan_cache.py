@@ -0,0 +1,105 @@
+"""
+	GameVault-Relocator - persistent scan cache
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import time
+import marshal
+import sqlite3
+import logging
+import threading
+
+LISTING_FORMAT = 3		# bumped whenever the cached listings change shape or content
+
+class ScanCache:
+	"""
+	On-disk cache of directory listings, keyed by the directory's mtime and inode.
+
+	A directory's mtime changes whenever an entry is added, removed or renamed in it, so an
+	unchanged mtime/inode means its file list can be reused without listing or stat'ing
+	the files again. A file rewritten in place does not touch its directory, though, so its
+	cached size and mtime go stale: use the cache for counting only (python -m relocator
+	count --cache), never for a scan whose sizes and mtimes decide what gets moved, skipped
+	or deleted. The cache keeps at most max_dirs directories and evicts the least recently used.
+	"""
+	def __init__(self, db_path, max_dirs=250_000):
+		self.db_path = db_path
+		self.max_dirs = max_dirs
+		self.hits = 0
+		self.misses = 0
+		self._lock = threading.Lock()
+		self._pending = []
+		self._touched = []
+		self._db = sqlite3.connect(db_path, check_same_thread=False)
+		self._db.execute(
+			"CREATE TABLE IF NOT EXISTS dirs ("
+			"path TEXT PRIMARY KEY, mtime_ns INTEGER, inode INTEGER, "
+			"file_count INTEGER, total_bytes INTEGER, listing BLOB, last_used INTEGER)"
+		)
+		self._db.execute("CREATE INDEX IF NOT EXISTS dirs_last_used ON dirs (last_used)")
+
+	def lookup(self, dir_path, st):
+		"""Return (files, subdirs) cached for dir_path if it is unchanged, else None"""
+		with self._lock:
+			row = self._db.execute(
+				"SELECT mtime_ns, inode, listing FROM dirs WHERE path = ?", (dir_path,)
+			).fetchone()
+			if row is None or row[0] != st.st_mtime_ns or row[1] != st.st_ino:
+				self.misses += 1
+				return None
+			try:
+				listing_format, files, subdirs = marshal.loads(row[2])
+			except Exception:
+				listing_format = None
+			if listing_format != LISTING_FORMAT:
+				self.misses += 1
+				return None
+			self.hits += 1
+			self._touched.append(dir_path)
+			return files, subdirs
+
+	def store(self, dir_path, st, files, subdirs):
+		"""Queue a fresh listing. files is a list of (name, size, mtime, inode), subdirs a list of names"""
+		listing = marshal.dumps((LISTING_FORMAT, files, subdirs))
+		with self._lock:
+			self._pending.append((
+				dir_path, st.st_mtime_ns, st.st_ino,
+				len(files), sum(f[1] for f in files), listing, int(time.time())
+			))
+
+	def flush(self):
+		"""Write queued listings, refresh LRU timestamps and evict the oldest entries"""
+		with self._lock:
+			now = int(time.time())
+			with self._db:
+				self._db.executemany(
+					"INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?, ?, ?)", self._pending
+				)
+				self._db.executemany(
+					"UPDATE dirs SET last_used = ? WHERE path = ?", ((now, p) for p in self._touched)
+				)
+				excess = self._db.execute("SELECT COUNT(*) FROM dirs").fetchone()[0] - self.max_dirs
+				if excess > 0:
+					self._db.execute(
+						"DELETE FROM dirs WHERE path IN "
+						"(SELECT path FROM dirs ORDER BY last_used LIMIT ?)", (excess,)
+					)
+					logging.info(f"Scan cache evicted {excess:,} directories")
+			self._pending = []
+			self._touched = []
+
+	def close(self):
+		try:
+			self.flush()
+		except Exception as e:
+			logging.warning(f"Could not save scan cache {self.db_path}: {e}")
+		finally:
+			self._db.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		self.close()
@@ -0,0 +1,254 @@
+"""
+	GameVault-Relocator - directory scanner
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import os
+import time
+import random
+import logging
+import threading
+from collections import deque
+
+from relocator.devices import IS_WINDOWS, is_network_path, NETWORK_THREADS
+from relocator.scan_cache import ScanCache
+
+# Skipped by count-only scans (python -m relocator count). A scan that feeds a move must
+# list everything, or these folders are left out of the move and then deleted with the source
+COUNT_SKIP_DIRS = {'$recycle.bin', 'system volume information', 'windowsapps', 
+				   'temporary internet files', 'inetcache'}
+
+class ScanManifest:
+	"""Everything one scan learned about a source tree, reused by MoveThread so the tree is only walked once"""
+	def __init__(self, root):
+		self.root = root
+		self.dirs = []		# relative paths, parents before children
+		self.files = []		# (relative path, size, mtime)
+		self.inodes = []	# inode of each entry in files, 0 where the listing did not carry one
+		self.total_bytes = 0
+
+	@property
+	def total_files(self):
+		return len(self.files)
+
+def list_directory(full_dir, skip_dirs=(), cache=None):
+	"""
+	List one directory. Returns (files, subdirs): files as (name, size, mtime, inode), subdirs
+	as names.
+
+	Reuses the DirEntry type/stat results so no file is stat'ed twice (on Windows the stat
+	comes free with the directory listing). The inode comes from the listing on POSIX; on
+	Windows DirEntry.inode() would cost a call per file, so it is left 0 there. With a
+	ScanCache, an unchanged directory costs a single stat. subdirs named in skip_dirs
+	(lowercase) are left out. Raises OSError if the directory can't be read.
+	"""
+	cached = None
+	if cache is not None:
+		dir_st = os.stat(full_dir)
+		cached = cache.lookup(full_dir, dir_st)
+
+	if cached is not None:
+		files, subdirs = cached
+	else:
+		files = []
+		subdirs = []
+		with os.scandir(full_dir) as it:
+			for entry in it:
+				name = entry.name
+				try:
+					if entry.is_dir(follow_symlinks=False):
+						subdirs.append(name)
+						continue
+					st = entry.stat(follow_symlinks=False)
+					files.append((name, st.st_size, st.st_mtime, 0 if IS_WINDOWS else entry.inode()))
+				except OSError:
+					files.append((name, 0, 0, 0))
+		# The cache keeps the full listing, so scans with other skip_dirs can share it
+		if cache is not None:
+			cache.store(full_dir, dir_st, files, subdirs)
+
+	if skip_dirs:
+		subdirs = [name for name in subdirs if name.lower() not in skip_dirs]
+	return files, subdirs
+
+def scan_directory(path, progress_callback=None, skip_dirs=(), cache=None):
+	"""
+	Scan path with os.scandir and return a ScanManifest. progress_callback(files, bytes) is called per file.
+
+	Directories are walked with an explicit stack rather than recursion.
+	"""
+	manifest = ScanManifest(path)
+	dirs = manifest.dirs
+	add_file = manifest.files.append
+	add_inode = manifest.inodes.append
+	file_count = 0
+	total_bytes = 0
+	stack = [""]
+	sep = os.sep
+
+	while stack:
+		rel_dir = stack.pop()
+		prefix = rel_dir + sep if rel_dir else ""
+
+		try:
+			files, subdirs = list_directory(path + sep + rel_dir if rel_dir else path, skip_dirs, cache)
+		except OSError as e:
+			logging.warning(f"Skipping unreadable directory {os.path.join(path, rel_dir)}: {e}")
+			continue
+
+		for name, size, mtime, inode in files:
+			add_file((prefix + name, size, mtime))
+			add_inode(inode)
+			file_count += 1
+			total_bytes += size
+
+			if progress_callback:
+				progress_callback(file_count, total_bytes)
+
+		# Record parents before their children, then descend depth-first
+		subdirs = [prefix + name for name in subdirs]
+		dirs.extend(subdirs)
+		stack.extend(reversed(subdirs))
+
+	manifest.total_bytes = total_bytes
+	return manifest
+
+class _ScanWorker:
+	"""Per-thread scan state. Only the owning thread writes to it, so no lock is needed"""
+	__slots__ = ('queue', 'dirs', 'files', 'inodes', 'total_bytes', 'pushed', 'done')
+
+	def __init__(self):
+		self.queue = deque()
+		self.dirs = []
+		self.files = []
+		self.inodes = []
+		self.total_bytes = 0
+		self.pushed = 0		# directories this worker queued
+		self.done = 0		# directories this worker finished listing
+
+def scan_directory_parallel(path, workers=8, progress_callback=None, skip_dirs=(), cache=None, interval=0.25):
+	"""
+	Like scan_directory, but lists directories on a work-stealing pool of threads.
+
+	Each worker pops from the end of its own deque and steals from the front of the others
+	when it runs dry. File/byte counters live in the worker, are summed for
+	progress_callback(files, bytes) every interval seconds, and are merged once at the end.
+	Pays off on network shares and cold disks, where each listing is a slow round trip.
+	"""
+	if workers <= 1:
+		return scan_directory(path, progress_callback, skip_dirs, cache)
+
+	states = [_ScanWorker() for _ in range(workers)]
+	states[0].pushed = 1
+	states[0].queue.append("")
+	sep = os.sep
+
+	def finished():
+		# Read done before pushed: a directory's children are counted as pushed before
+		# it is counted as done, so the sums can only match once every listing is finished.
+		done = sum(state.done for state in states)
+		return done == sum(state.pushed for state in states)
+
+	def steal(me):
+		start = random.randrange(workers)
+		for i in range(workers):
+			victim = states[(start + i) % workers]
+			if victim is not me:
+				try:
+					return victim.queue.popleft()
+				except IndexError:
+					pass
+		return None
+
+	def work(me):
+		add_file = me.files.append
+		add_inode = me.inodes.append
+		while True:
+			try:
+				rel_dir = me.queue.pop()
+			except IndexError:
+				rel_dir = steal(me)
+				if rel_dir is None:
+					if finished():
+						return
+					time.sleep(0.001)
+					continue
+
+			try:
+				prefix = rel_dir + sep if rel_dir else ""
+				try:
+					files, subdirs = list_directory(path + sep + rel_dir if rel_dir else path, skip_dirs, cache)
+				except OSError as e:
+					logging.warning(f"Skipping unreadable directory {os.path.join(path, rel_dir)}: {e}")
+					continue
+
+				for name, size, mtime, inode in files:
+					add_file((prefix + name, size, mtime))
+					add_inode(inode)
+					me.total_bytes += size
+
+				subdirs = [prefix + name for name in subdirs]
+				me.dirs.extend(subdirs)
+				me.pushed += len(subdirs)
+				me.queue.extend(subdirs)
+			except Exception as e:
+				logging.error(f"Scan worker error in {rel_dir or path}: {e}")
+			finally:
+				me.done += 1
+
+	threads = [threading.Thread(target=work, args=(state,), daemon=True) for state in states]
+	for thread in threads:
+		thread.start()
+
+	for thread in threads:
+		while thread.is_alive():
+			thread.join(interval)
+			if progress_callback:
+				progress_callback(
+					sum(len(state.files) for state in states),
+					sum(state.total_bytes for state in states)
+				)
+
+	manifest = ScanManifest(path)
+	for state in states:
+		manifest.files.extend(state.files)
+		manifest.inodes.extend(state.inodes)
+		manifest.dirs.extend(state.dirs)
+		manifest.total_bytes += state.total_bytes
+
+	# Workers finish out of order; sorting by depth restores parents-before-children
+	manifest.dirs.sort(key=lambda d: d.count(sep))
+
+	if progress_callback:
+		progress_callback(manifest.total_files, manifest.total_bytes)
+	return manifest
+
+def scan_tree(path, workers=None, cache_file=None, progress_callback=None, skip_dirs=()):
+	"""
+	ScanManifest of path, listed on workers threads: by default NETWORK_THREADS on a network
+	share and one thread elsewhere. cache_file reuses a ScanCache, whose sizes and mtimes
+	can be stale, and skip_dirs (e.g. COUNT_SKIP_DIRS) leaves folders out; only pass either
+	for counts, never for a scan that feeds a move.
+	"""
+	if workers is None:
+		workers = NETWORK_THREADS if is_network_path(path) else 1
+	logging.info(f"Starting count on: {path} ({workers} threads)")
+
+	cache = None
+	if cache_file:
+		try:
+			cache = ScanCache(cache_file)
+		except Exception as e:
+			logging.warning(f"Scan cache unavailable, doing a full scan: {e}")
+	try:
+		manifest = scan_directory_parallel(path, workers, progress_callback=progress_callback,
+										   skip_dirs=skip_dirs, cache=cache)
+	finally:
+		if cache is not None:
+			logging.info(f"Scan cache: {cache.hits:,} directories reused, {cache.misses:,} rescanned")
+			cache.close()
+
+	logging.info(f"Counting finished - Files: {manifest.total_files:,} | Size: {manifest.total_bytes / (1024 ** 3):.2f} GB")
+	return manifest
@@ -0,0 +1,179 @@
+"""
+	GameVault-Relocator - persistent symlink index
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import os
+import marshal
+import sqlite3
+import logging
+import threading
+
+from relocator.symlinks import SymlinkInfo, list_links, normalize_path
+
+def resolve_target(link_path, target):
+	"""The normalized absolute path a link points to, as stored for target prefix queries"""
+	if not os.path.isabs(target):
+		target = os.path.join(os.path.dirname(link_path), target)
+	return normalize_path(os.path.normpath(target)).rstrip('/')
+
+def _subtree_range(norm_dir):
+	# Every path below norm_dir sorts between "dir/" and "dir0" ('0' follows '/')
+	return norm_dir + '/', norm_dir + '0'
+
+class SymlinkIndex:
+	"""
+	On-disk index of the symlinks found by iter_symlinks(), with each directory's mtime.
+
+	Adding, removing or re-pointing a link changes its parent directory's mtime, so a
+	rescan only lists directories whose mtime or inode changed. Unchanged ones cost a stat
+	plus an index lookup, and only their links' broken status is checked again. Directories
+	that disappeared are dropped with everything below them. links_to() answers "which links
+	point into D:/Games?" from the index alone.
+
+	An index built with different exclusions is discarded, since it may be missing whole
+	subtrees the new exclusions would visit.
+	"""
+	def __init__(self, db_path, exclusions=None):
+		self.db_path = db_path
+		self.hits = 0
+		self.misses = 0
+		self._lock = threading.Lock()
+		self._pending = []		# (dir, mtime_ns, inode, links, subdir names)
+		self._broken = []		# (broken, link path) for cached links whose status changed
+		self._db = sqlite3.connect(db_path, check_same_thread=False)
+		self._db.executescript(
+			"CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);"
+			"CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, norm TEXT, mtime_ns INTEGER, "
+			"inode INTEGER, subdirs BLOB);"
+			"CREATE TABLE IF NOT EXISTS links (path TEXT PRIMARY KEY, norm TEXT, parent TEXT, "
+			"target TEXT, resolved TEXT, broken INTEGER);"
+			"CREATE INDEX IF NOT EXISTS dirs_norm ON dirs (norm);"
+			"CREATE INDEX IF NOT EXISTS links_parent ON links (parent);"
+			"CREATE INDEX IF NOT EXISTS links_norm ON links (norm);"
+			"CREATE INDEX IF NOT EXISTS links_resolved ON links (resolved);"
+		)
+
+		signature = "\n".join(exclusions.entries) if exclusions is not None else ""
+		row = self._db.execute("SELECT value FROM meta WHERE key = 'exclusions'").fetchone()
+		if row is None or row[0] != signature:
+			if row is not None:
+				logging.info("Symlink exclusions changed, rebuilding the symlink index")
+			with self._db:
+				self._db.execute("DELETE FROM dirs")
+				self._db.execute("DELETE FROM links")
+				self._db.execute("INSERT OR REPLACE INTO meta VALUES ('exclusions', ?)", (signature,))
+
+	def list_links(self, path, exclusions=None):
+		"""Drop-in for symlinks.list_links() that reuses the index for unchanged directories"""
+		st = os.stat(path)
+		with self._lock:
+			row = self._db.execute(
+				"SELECT mtime_ns, inode, subdirs FROM dirs WHERE path = ?", (path,)
+			).fetchone()
+			cached_links = None
+			if row is not None and row[0] == st.st_mtime_ns and row[1] == st.st_ino:
+				try:
+					subdir_names = marshal.loads(row[2])
+					cached_links = self._db.execute(
+						"SELECT path, target, broken FROM links WHERE parent = ?", (path,)
+					).fetchall()
+				except Exception:
+					cached_links = None
+
+			if cached_links is None:
+				self.misses += 1
+			else:
+				self.hits += 1
+
+		if cached_links is None:
+			links, subdirs = list_links(path, exclusions)
+			names = [os.path.basename(subdir) for subdir in subdirs]
+			with self._lock:
+				self._pending.append((path, st.st_mtime_ns, st.st_ino, links, names))
+			return links, subdirs
+
+		links = []
+		changed = []
+		for link_path, target, was_broken in cached_links:
+			broken = target is None or not os.path.exists(link_path)
+			if broken != bool(was_broken):
+				changed.append((int(broken), link_path))
+			links.append(SymlinkInfo(link_path, target, broken))
+		if changed:
+			with self._lock:
+				self._broken.extend(changed)
+		return links, [os.path.join(path, name) for name in subdir_names]
+
+	def _remove_subtree(self, norm_dir):
+		low, high = _subtree_range(norm_dir)
+		self._db.execute("DELETE FROM dirs WHERE norm = ? OR (norm >= ? AND norm < ?)", (norm_dir, low, high))
+		self._db.execute("DELETE FROM links WHERE norm >= ? AND norm < ?", (low, high))
+
+	def flush(self):
+		"""Write fresh listings and status changes, dropping directories that disappeared"""
+		with self._lock:
+			with self._db:
+				for path, mtime_ns, inode, links, names in self._pending:
+					norm = normalize_path(path).rstrip('/')
+					row = self._db.execute("SELECT subdirs FROM dirs WHERE path = ?", (path,)).fetchone()
+					if row is not None:
+						try:
+							for gone in set(marshal.loads(row[0])) - set(names):
+								self._remove_subtree(normalize_path(os.path.join(path, gone)))
+						except Exception:
+							pass
+
+					self._db.execute("DELETE FROM links WHERE parent = ?", (path,))
+					self._db.executemany(
+						"INSERT OR REPLACE INTO links VALUES (?, ?, ?, ?, ?, ?)",
+						((
+							link.path, normalize_path(link.path), path, link.target,
+							resolve_target(link.path, link.target) if link.target is not None else None,
+							int(link.broken)
+						) for link in links)
+					)
+					self._db.execute(
+						"INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?)",
+						(path, norm, mtime_ns, inode, marshal.dumps(names))
+					)
+				self._db.executemany("UPDATE links SET broken = ? WHERE path = ?", self._broken)
+			self._pending = []
+			self._broken = []
+
+	def links_to(self, target_prefix):
+		"""Indexed links whose target is target_prefix or anything below it"""
+		prefix = normalize_path(os.path.normpath(target_prefix)).rstrip('/')
+		low, high = _subtree_range(prefix)
+		with self._lock:
+			rows = self._db.execute(
+				"SELECT path, target, broken FROM links WHERE resolved = ? OR (resolved >= ? AND resolved < ?) "
+				"ORDER BY path", (prefix, low, high)
+			).fetchall()
+		return [SymlinkInfo(path, target, bool(broken)) for path, target, broken in rows]
+
+	def links_under(self, root):
+		"""Indexed links located at or below root, without touching the disk"""
+		norm = normalize_path(os.path.normpath(root)).rstrip('/')
+		low, high = _subtree_range(norm)
+		with self._lock:
+			rows = self._db.execute(
+				"SELECT path, target, broken FROM links WHERE norm >= ? AND norm < ? ORDER BY path", (low, high)
+			).fetchall()
+		return [SymlinkInfo(path, target, bool(broken)) for path, target, broken in rows]
+
+	def close(self):
+		try:
+			self.flush()
+		except Exception as e:
+			logging.warning(f"Could not save symlink index {self.db_path}: {e}")
+		finally:
+			self._db.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		self.close()
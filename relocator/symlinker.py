@@ -0,0 +1,138 @@
+"""
+	GameVault-Relocator - symlink creation and symlink scans
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import os
+import sys
+import shutil
+import logging
+import threading
+import subprocess
+
+from relocator.symlinks import iter_symlinks, ExclusionMatcher, load_exclusions, DEFAULT_EXCLUSIONS
+from relocator.symlink_index import SymlinkIndex
+
+IS_WINDOWS = sys.platform == "win32"
+
+class SymlinkFailed(OSError):
+	"""The files were moved, but the source could not be replaced with a symlink"""
+
+def create_symlink(source, destination):
+	"""Link source to the destination folder with mklink /D or ln -s. Raises SymlinkFailed"""
+	if IS_WINDOWS:
+		command = f'mklink /D "{source}" "{destination}"'
+	else:
+		command = f'ln -s "{destination}" "{source}"'
+	result = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+	if result.returncode != 0:
+		raise SymlinkFailed(f"Symlink creation failed: {result.stderr.strip()}")
+	if os.path.islink(source):
+		logging.info(f"Symlink created and verified: {source} -> {destination}")
+	else:
+		logging.warning(f"Symlink creation reported success but was not verified: {source}")
+
+class SourceNotEmpty(OSError):
+	"""Files are still in the source after the move, so it was not deleted"""
+
+def remaining_files(path, limit=5):
+	"""Up to limit files, links or junctions still below path; empty folders don't count"""
+	found = []
+	stack = [path]
+	while stack and len(found) < limit:
+		with os.scandir(stack.pop()) as it:
+			for entry in it:
+				is_junction = getattr(entry, "is_junction", None)
+				if entry.is_dir(follow_symlinks=False) and not entry.is_symlink() and not (is_junction and is_junction()):
+					stack.append(entry.path)
+				else:
+					found.append(entry.path)
+	return found[:limit]
+
+def remove_source(source):
+	"""
+	Delete the moved source folder, or a link already in its place. Raises SourceNotEmpty,
+	leaving it untouched, if any file is still in it, and OSError if it can't be removed.
+	"""
+	if os.path.islink(source):
+		os.unlink(source)
+	elif os.path.exists(source):
+		left = remaining_files(source)
+		if left:
+			raise SourceNotEmpty(f"Files are still in {source} after the move, not deleting it: {', '.join(left)}")
+		shutil.rmtree(source)
+		logging.info(f"Removed source directory: {source}")
+
+def replace_with_symlink(source, destination):
+	"""
+	Delete the moved source folder and link it to destination. Raises OSError if the source
+	can't be removed, SymlinkFailed if it was removed but the link could not be created.
+	"""
+	remove_source(source)
+	create_symlink(source, destination)
+
+def build_exclusions(exclusions_file=None):
+	"""ExclusionMatcher for DEFAULT_EXCLUSIONS plus the user's additions in exclusions_file"""
+	excluded_dirs = set(DEFAULT_EXCLUSIONS)
+	if exclusions_file:
+		extra = load_exclusions(exclusions_file)
+		if extra:
+			logging.info(f"Loaded {len(extra)} extra symlink scan exclusions from {exclusions_file}")
+			excluded_dirs.update(extra)
+	return ExclusionMatcher(excluded_dirs)
+
+class SymlinkScan:
+	"""
+	Iterating yields each symlink or junction under path once, as a SymlinkInfo, on the
+	calling thread. Unchanged directories come from the SymlinkIndex at index_file when
+	given. found and broken count what was yielded so far; stop() ends the iteration early.
+	"""
+	def __init__(self, path, exclusions=None, index_file=None, workers=8):
+		self.path = path
+		self.exclusions = exclusions if exclusions is not None else build_exclusions()
+		self.index_file = index_file
+		self.workers = workers
+		self.found = 0
+		self.broken = 0
+		self._stop_event = threading.Event()
+
+	def __iter__(self):
+		logging.info(f"Starting symlink scan on path: {self.path}")
+		index = None
+		if self.index_file:
+			try:
+				index = SymlinkIndex(self.index_file, self.exclusions)
+			except Exception as e:
+				logging.warning(f"Symlink index unavailable, doing a full scan: {e}")
+
+		seen = set()
+		try:
+			for link in iter_symlinks(self.path, self.exclusions, workers=self.workers,
+									  stop_event=self._stop_event, index=index):
+				if link.path in seen:
+					continue
+				seen.add(link.path)
+				self.found += 1
+				self.broken += link.broken
+				logging.info(f"Found symlink: {link}")
+				yield link
+		finally:
+			if index is not None:
+				logging.info(f"Symlink index: {index.hits:,} directories reused, {index.misses:,} rescanned")
+				index.close()
+
+	@property
+	def stopped(self):
+		return self._stop_event.is_set()
+
+	def stop(self):
+		self._stop_event.set()
+
+	def summary(self):
+		if self.stopped:
+			return "Scan stopped."
+		if self.found:
+			return f"Found {self.found:,} symlinks and junctions ({self.broken:,} broken)."
+		return "No symlinks or junctions found."
@@ -0,0 +1,244 @@
+"""
+	GameVault-Relocator - symlink scanner
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import os
+import sys
+import queue
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+BATCH_SIZE = 256	# links a worker collects before handing them to the consumer
+IS_WINDOWS = sys.platform == "win32"
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+# Directories the symlink scan skips: OS compatibility junctions and redirects that
+# would flood the results, plus protected system folders
+DEFAULT_EXCLUSIONS = {
+	# Legacy / compatibility junctions
+	'documents and settings', 'all users', 'default user',
+	'application data', 'local settings', 'my documents',
+	'nethood', 'printhood', 'recent', 'sendto', 'start menu', 'templates',
+
+	# AppData legacy redirects
+	'appdata/local/application data',
+	'appdata/local/history',
+	'appdata/local/temporary internet files',
+	'appdata/local/microsoft/windows/inetcache',
+	'appdata/local/microsoft/windows/inetcookies',
+
+	# Shell folder redirects
+	'my music', 'my pictures', 'my videos',
+
+	# ProgramData public folders
+	'programdata/desktop',
+	'programdata/documents',
+
+	# Internet Explorer / legacy
+	'cookies',
+	'content.ie5',
+	'low/content.ie5',
+
+	# Office / ClickToRun
+	'clicktorun',
+	'vfs/programfiles',
+	'vfs/programfilescommonx64',
+	'vfs/programfilesx86',
+	'appvisvsubsystems',
+	'c2r32.dll',
+	'c2r64.dll',
+
+	# NVIDIA
+	'nvcontainer/plugins',
+
+	# System protected
+	'$recycle.bin',
+	'system volume information',
+
+	# WindowsApps
+	'windowsapps',
+
+	# Unix-like
+	'proc', 'sys', 'dev', 'tmp',
+
+	# New additions for remaining noise
+	'nethood',
+	'printhood',
+	
+	'temporary internet files',
+	'inetcache',  # broader catch for INetCache redirects
+}
+
+class SymlinkInfo:
+	"""One symlink found by iter_symlinks()"""
+	__slots__ = ('path', 'target', 'broken')
+
+	def __init__(self, path, target, broken):
+		self.path = path
+		self.target = target
+		self.broken = broken
+
+	def __str__(self):
+		if self.target is None:
+			return f"{self.path} → (unreadable)"
+		if self.broken:
+			return f"{self.path} → {self.target} (broken)"
+		return f"{self.path} → {self.target}"
+
+def normalize_path(path):
+	"""Lowercase with forward slashes, the form all exclusion matching works on"""
+	return path.lower().replace('\\', '/')
+
+class ExclusionMatcher:
+	"""
+	An exclusion list normalized once, checked for every entry the symlink scan is about
+	to descend into. Exclusions without a slash ('proc', '$recycle.bin') match a name
+	anywhere, ones with a slash ('appdata/local/history') the end of its path, so each
+	check is a set lookup plus one endswith() instead of a loop over every exclusion.
+	"""
+	def __init__(self, entries):
+		normalized = {normalize_path(entry).strip('/') for entry in entries}
+		normalized.discard('')
+		self.entries = sorted(normalized)
+		self.names = {entry for entry in normalized if '/' not in entry}
+		self.suffixes = tuple('/' + entry for entry in normalized if '/' in entry)
+
+	def prunes(self, path, name):
+		if name.lower() in self.names:
+			return True
+		return bool(self.suffixes) and normalize_path(path).endswith(self.suffixes)
+
+def load_exclusions(path):
+	"""
+	Read extra exclusions from a text file: one directory name or path fragment per line,
+	lines starting with '#' are comments. A missing file just means no extra exclusions.
+	"""
+	try:
+		with open(path, encoding="utf-8") as f:
+			lines = f.read().splitlines()
+	except FileNotFoundError:
+		return []
+	except OSError as e:
+		logging.warning(f"Could not read exclusions file {path}: {e}")
+		return []
+
+	entries = []
+	for line in lines:
+		line = line.strip()
+		if line and not line.startswith('#'):
+			entries.append(line)
+	return entries
+
+def _link_info(path):
+	try:
+		target = os.readlink(path)
+	except OSError as e:
+		logging.warning(f"Could not read symlink {path}: {e}")
+		return SymlinkInfo(path, None, True)
+	# Junctions and some symlinks come back in NT form, \\?\C:\... or \??\C:\...
+	if target.startswith(("\\\\?\\", "\\??\\")):
+		target = target[4:]
+	# exists() follows the link, so a missing target means a broken link
+	return SymlinkInfo(path, target, not os.path.exists(path))
+
+def _is_link(entry):
+	if entry.is_symlink():
+		return True
+	# Junctions and other reparse points; the stat comes with the listing on Windows
+	return IS_WINDOWS and bool(entry.stat(follow_symlinks=False).st_file_attributes & FILE_ATTRIBUTE_REPARSE_POINT)
+
+def list_links(path, exclusions=None):
+	"""Returns (links, subdirs) directly inside path, leaving out excluded links and subdirs"""
+	links = []
+	subdirs = []
+	with os.scandir(path) as it:
+		for entry in it:
+			try:
+				if exclusions is not None and exclusions.prunes(entry.path, entry.name):
+					continue
+				if _is_link(entry):
+					links.append(_link_info(entry.path))
+				elif entry.is_dir(follow_symlinks=False):
+					subdirs.append(entry.path)
+			except OSError as e:
+				logging.warning(f"Could not check {entry.path}: {e}")
+	return links, subdirs
+
+def iter_symlinks(path, exclusions=None, workers=8, stop_event=None, index=None):
+	"""
+	Yield a SymlinkInfo for every symlink (and, on Windows, junction or other reparse point)
+	under path, without following any of them.
+
+	Directories are listed with os.scandir, and entries an ExclusionMatcher prunes are
+	skipped before descending. With a SymlinkIndex, unchanged directories come from the
+	index instead of being listed again.
+	The first levels are listed up front so there are enough subtrees to go around, then
+	each subtree is walked by one of workers threads. Results arrive in batches, in no
+	particular order, and are all yielded on the calling thread. Setting stop_event, or
+	closing the generator, stops the workers.
+	"""
+	lister = index.list_links if index is not None else list_links
+	stop_event = stop_event or threading.Event()
+	abandoned = threading.Event()	# the consumer stopped iterating early
+	results = queue.Queue()
+
+	# Expand the frontier so e.g. / with a few huge top-level dirs still spreads out
+	subtrees = [path]
+	for _ in range(2):
+		next_level = []
+		for directory in subtrees:
+			if stop_event.is_set():
+				return
+			try:
+				links, subdirs = lister(directory, exclusions)
+			except OSError as e:
+				logging.warning(f"Skipping unreadable directory {directory}: {e}")
+				continue
+			yield from links
+			next_level.extend(subdirs)
+		subtrees = next_level
+		if len(subtrees) >= workers * 2:
+			break
+
+	def walk(top):
+		batch = []
+		stack = [top]
+		try:
+			while stack and not (stop_event.is_set() or abandoned.is_set()):
+				directory = stack.pop()
+				try:
+					links, subdirs = lister(directory, exclusions)
+				except OSError as e:
+					logging.warning(f"Skipping unreadable directory {directory}: {e}")
+					continue
+				batch.extend(links)
+				stack.extend(subdirs)
+				if len(batch) >= BATCH_SIZE:
+					results.put(batch)
+					batch = []
+		except Exception as e:
+			logging.error(f"Symlink scan worker error in {top}: {e}")
+		finally:
+			results.put(batch)
+			results.put(None)	# this subtree is done
+
+	if not subtrees:
+		return
+
+	with ThreadPoolExecutor(max_workers=workers) as pool:
+		try:
+			for top in subtrees:
+				pool.submit(walk, top)
+			remaining = len(subtrees)
+			while remaining:
+				batch = results.get()
+				if batch is None:
+					remaining -= 1
+				else:
+					yield from batch
+		finally:
+			abandoned.set()
@@ -0,0 +1,163 @@
+"""
+	GameVault-Relocator - transfer telemetry
+	Copyright (C) 2026 ScriptedBits
+
+	Licensed under the GNU General Public License v3, see LICENSE.
+"""
+
+import json
+import time
+import threading
+from collections import deque
+
+class TransferTelemetry:
+	"""
+	Byte-accurate transfer progress with moving-average throughput and ETA.
+
+	Engines report finished files with file_done() and, for large files, the bytes copied so
+	far through a FileProgress callback, so a single huge file still moves the numbers.
+	Robocopy, which only exposes running totals, uses set_totals(). Rates are averaged over
+	the last window seconds of snapshot() calls.
+	"""
+	def __init__(self, total_files, total_bytes, window=10.0):
+		self.total_files = total_files
+		self.total_bytes = total_bytes
+		self.window = window
+		self.start_time = time.monotonic()
+		self.files_done = 0
+		self.bytes_done = 0
+		self.peak_bytes_per_sec = 0.0
+		self._partial_bytes = 0
+		self._lock = threading.Lock()
+		self._samples = deque([(self.start_time, 0, 0)])
+
+	def add_partial(self, nbytes):
+		with self._lock:
+			self._partial_bytes += nbytes
+
+	def file_done(self, size, partial_reported=0):
+		with self._lock:
+			self._partial_bytes -= partial_reported
+			self.files_done += 1
+			self.bytes_done += size
+
+	def file_failed(self, partial_reported=0):
+		with self._lock:
+			self._partial_bytes -= partial_reported
+
+	def set_totals(self, files_done, bytes_done):
+		with self._lock:
+			self.files_done = files_done
+			self.bytes_done = bytes_done
+
+	def current_bytes(self):
+		"""Bytes done so far, counting the copied part of files still in flight"""
+		with self._lock:
+			return self.bytes_done + self._partial_bytes
+
+	def snapshot(self):
+		"""Current numbers as a plain dict (safe to send across threads)"""
+		now = time.monotonic()
+		with self._lock:
+			files = self.files_done
+			done = self.bytes_done + self._partial_bytes
+
+		samples = self._samples
+		samples.append((now, done, files))
+		while len(samples) > 2 and now - samples[1][0] >= self.window:
+			samples.popleft()
+
+		first_time, first_bytes, first_files = samples[0]
+		span = now - first_time
+		bytes_per_sec = (done - first_bytes) / span if span > 0 else 0.0
+		files_per_sec = (files - first_files) / span if span > 0 else 0.0
+		self.peak_bytes_per_sec = max(self.peak_bytes_per_sec, bytes_per_sec)
+
+		remaining = max(self.total_bytes - done, 0)
+		eta = remaining / bytes_per_sec if bytes_per_sec > 0 else None
+
+		return {
+			"elapsed": now - self.start_time,
+			"files_done": files,
+			"total_files": self.total_files,
+			"bytes_done": done,
+			"total_bytes": self.total_bytes,
+			"mb_per_sec": bytes_per_sec / (1024 ** 2),
+			"files_per_sec": files_per_sec,
+			"eta_seconds": eta,
+		}
+
+	def average_mb_per_sec(self):
+		elapsed = time.monotonic() - self.start_time
+		return self.bytes_done / (1024 ** 2) / elapsed if elapsed > 0 else 0.0
+
+	def write_stats(self, path, **extra):
+		"""Write the final numbers as JSON for scripts and tuning"""
+		stats = self.snapshot()
+		stats.update({
+			"average_mb_per_sec": self.average_mb_per_sec(),
+			"peak_mb_per_sec": self.peak_bytes_per_sec / (1024 ** 2),
+		})
+		stats.update(extra)
+		with open(path, "w", encoding="utf-8") as f:
+			json.dump(stats, f, indent=2)
+
+class ProgressThrottle:
+	"""
+	Coalesces frequent progress updates into at most one emit(*state) per interval seconds.
+
+	update() forwards the state only if the interval has passed since the last delivery and
+	otherwise keeps it as pending, so intermediate states are dropped. flush() delivers the
+	pending state and update(..., force=True) delivers at once, so the final numbers always
+	reach the UI. Safe to call from several threads; deliveries keep their order.
+	"""
+	def __init__(self, emit, interval=0.1):
+		self.emit = emit
+		self.interval = interval
+		self._last = 0.0
+		self._pending = None
+		self._lock = threading.Lock()
+
+	def update(self, *state, force=False):
+		with self._lock:
+			now = time.monotonic()
+			if not force and now - self._last < self.interval:
+				self._pending = state
+				return
+			self._last = now
+			self._pending = None
+			self.emit(*state)
+
+	def flush(self):
+		with self._lock:
+			if self._pending is not None:
+				state, self._pending = self._pending, None
+				self._last = time.monotonic()
+				self.emit(*state)
+
+class FileProgress:
+	"""Per-file progress callback that forwards copied bytes and remembers how many it sent"""
+	__slots__ = ('telemetry', 'reported')
+
+	def __init__(self, telemetry):
+		self.telemetry = telemetry
+		self.reported = 0
+
+	def __call__(self, nbytes):
+		self.reported += nbytes
+		self.telemetry.add_partial(nbytes)
+
+def format_eta(seconds):
+	if seconds is None:
+		return "--:--"
+	seconds = int(seconds)
+	hours, rest = divmod(seconds, 3600)
+	minutes, seconds = divmod(rest, 60)
+	return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+def format_rate(stats):
+	"""One-line human summary, e.g. '85.2 MB/s | 120 files/s | ETA 5:12'"""
+	return (
+		f"{stats['mb_per_sec']:.1f} MB/s | {stats['files_per_sec']:,.0f} files/s | "
+		f"ETA {format_eta(stats['eta_seconds'])}"
+	)
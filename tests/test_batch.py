@@ -0,0 +1,97 @@
+"""
+	GameVault-Relocator - BatchRunner tests
+
+	Runs batches of small folders between temp dirs. MoveEngine.is_same_device is patched
+	to False so pre-copies and the native copy-then-delete path run on one filesystem.
+
+	Usage: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from relocator.batch import BatchRunner, plan_jobs
+from relocator.mover import MoveEngine
+
+def write(path, data):
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path, "wb") as f:
+		f.write(data)
+
+def read(path):
+	with open(path, "rb") as f:
+		return f.read()
+
+@mock.patch.object(MoveEngine, "is_same_device", lambda self: False)
+class BatchTestCase(unittest.TestCase):
+	def setUp(self):
+		self.temp_dir = tempfile.mkdtemp(prefix="gvr-test-")
+		self.destination = os.path.join(self.temp_dir, "dst")
+		self.log_dir = os.path.join(self.temp_dir, "logs")
+		self.sources = []
+		for name in ("snes", "psx"):
+			source = os.path.join(self.temp_dir, "emu", name)
+			write(os.path.join(source, "game.bin"), name.encode() * 100)
+			write(os.path.join(source, "saves", "slot1.sav"), b"slot1")
+			self.sources.append(source)
+
+	def tearDown(self):
+		shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+	def run_batch(self, **options):
+		jobs = plan_jobs(self.sources, self.destination, False)
+		BatchRunner(jobs, log_dir=self.log_dir, **options).run()
+		return jobs
+
+	def test_move_links_every_source(self):
+		for job in self.run_batch():
+			self.assertEqual((job.status, job.message), ("done", "Moved and linked"))
+			self.assertTrue(os.path.islink(job.source))
+			self.assertEqual(read(os.path.join(job.source, "saves", "slot1.sav")), b"slot1")
+
+	def test_precopy_then_delta_move_then_link(self):
+		for job in self.run_batch(precopy=True):
+			self.assertEqual((job.status, job.message), ("done", "Pre-copied, source kept"))
+			self.assertFalse(os.path.islink(job.source))
+			self.assertEqual(read(os.path.join(job.destination, "game.bin")), read(os.path.join(job.source, "game.bin")))
+
+		# Changes made while the source was still in use are synced by the final pass
+		snes = self.sources[0]
+		write(os.path.join(snes, "saves", "slot1.sav"), b"slot1 after more play")
+		write(os.path.join(snes, "saves", "slot2.sav"), b"slot2")
+		os.remove(os.path.join(snes, "game.bin"))
+
+		jobs = self.run_batch()
+		for job in jobs:
+			self.assertEqual((job.status, job.message), ("done", "Moved and linked"))
+			self.assertTrue(os.path.islink(job.source))
+		self.assertEqual(read(os.path.join(snes, "saves", "slot1.sav")), b"slot1 after more play")
+		self.assertEqual(read(os.path.join(snes, "saves", "slot2.sav")), b"slot2")
+		self.assertFalse(os.path.exists(os.path.join(jobs[0].destination, "game.bin")))
+
+	def test_stop_after_move_finished_still_links(self):
+		jobs = plan_jobs(self.sources, self.destination, False)
+		runner = BatchRunner(jobs, log_dir=self.log_dir)
+		move = MoveEngine.run
+
+		def move_then_stop(engine):
+			message = move(engine)
+			runner.stop()		# Stop pressed just as the first move finished
+			return message
+
+		with mock.patch.object(MoveEngine, "run", move_then_stop):
+			runner.run()
+		self.assertEqual((jobs[0].status, jobs[0].message), ("done", "Moved and linked"))
+		self.assertTrue(os.path.islink(jobs[0].source))
+		self.assertEqual(read(os.path.join(jobs[0].source, "saves", "slot1.sav")), b"slot1")
+		self.assertEqual(jobs[1].status, "canceled")
+		self.assertFalse(os.path.islink(jobs[1].source))
+
+if __name__ == "__main__":
+	unittest.main()
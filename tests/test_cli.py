@@ -0,0 +1,125 @@
+"""
+	GameVault-Relocator - command line tests
+
+	Runs relocator.cli.main() on temp dirs and checks exit codes, output and the files left
+	behind. MoveEngine.is_same_device is patched to False so moves copy instead of renaming.
+
+	Usage: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from relocator import cli
+from relocator.mover import MoveEngine
+
+def write(path, data):
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path, "wb") as f:
+		f.write(data)
+
+def read(path):
+	with open(path, "rb") as f:
+		return f.read()
+
+class CliTestCase(unittest.TestCase):
+	def setUp(self):
+		patcher = mock.patch.object(MoveEngine, "is_same_device", lambda self: False)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+		self.temp_dir = tempfile.mkdtemp(prefix="gvr-test-")
+		self.log_dir = os.path.join(self.temp_dir, "logs")
+		self.source = os.path.join(self.temp_dir, "emu", "snes")
+		self.destination = os.path.join(self.temp_dir, "dst")
+		self.moved = os.path.join(self.destination, "snes")
+		write(os.path.join(self.source, "game.bin"), b"g" * 1000)
+		write(os.path.join(self.source, "saves", "slot1.sav"), b"slot1")
+
+	def tearDown(self):
+		shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+	def main(self, *argv):
+		"""(exit code, stdout, stderr) of one command line run"""
+		stdout, stderr = io.StringIO(), io.StringIO()
+		with redirect_stdout(stdout), redirect_stderr(stderr):
+			code = cli.main(["--log-dir", self.log_dir] + list(argv))
+		return code, stdout.getvalue(), stderr.getvalue()
+
+class MoveCommandTests(CliTestCase):
+	def test_move_links_source(self):
+		code, out, _ = self.main("move", self.source, self.destination, "--no-preserve-structure")
+		self.assertEqual(code, cli.EXIT_OK)
+		self.assertIn("1 of 1 folders done", out)
+		self.assertTrue(os.path.islink(self.source))
+		self.assertEqual(read(os.path.join(self.source, "saves", "slot1.sav")), b"slot1")
+
+	def test_precopy_exits_ok_and_keeps_source(self):
+		code, out, _ = self.main("move", "--precopy", self.source, self.destination, "--no-preserve-structure")
+		self.assertEqual(code, cli.EXIT_OK)
+		self.assertIn("Pre-copied, source kept", out)
+		self.assertFalse(os.path.islink(self.source))
+		self.assertEqual(read(os.path.join(self.moved, "game.bin")), b"g" * 1000)
+
+		write(os.path.join(self.source, "saves", "slot2.sav"), b"slot2")
+		code, _, _ = self.main("move", self.source, self.destination, "--no-preserve-structure")
+		self.assertEqual(code, cli.EXIT_OK)
+		self.assertTrue(os.path.islink(self.source))
+		self.assertEqual(read(os.path.join(self.moved, "saves", "slot2.sav")), b"slot2")
+
+	def test_dry_run_writes_nothing(self):
+		code, out, _ = self.main("move", "--dry-run", self.source, self.destination, "--no-preserve-structure")
+		self.assertEqual(code, cli.EXIT_OK)
+		self.assertIn("Would move 2 files", out)
+		self.assertFalse(os.path.exists(self.moved))
+		self.assertFalse(os.path.islink(self.source))
+
+	def test_missing_source_is_a_usage_error(self):
+		code, _, err = self.main("move", os.path.join(self.temp_dir, "missing"), self.destination)
+		self.assertEqual(code, cli.EXIT_USAGE)
+		self.assertIn("No such folder", err)
+
+class CountCommandTests(CliTestCase):
+	def test_count_skips_cache_folders(self):
+		write(os.path.join(self.source, "InetCache", "junk.dat"), b"junk")
+		code, out, _ = self.main("count", self.source)
+		self.assertEqual(code, cli.EXIT_OK)
+		self.assertIn(f"{self.source}: 2 files", out)
+
+@unittest.skipUnless(hasattr(os, "symlink") and sys.platform != "win32", "needs unprivileged symlinks")
+class SymlinksCommandTests(CliTestCase):
+	def setUp(self):
+		super().setUp()
+		self.scan_root = os.path.join(self.temp_dir, "library")
+		self.target = os.path.join(self.temp_dir, "games")
+		os.makedirs(os.path.join(self.scan_root, "nested"))
+		os.makedirs(os.path.join(self.target, "snes"))
+		self.wanted = os.path.join(self.scan_root, "nested", "snes")
+		self.other = os.path.join(self.scan_root, "emu")
+		os.symlink(os.path.join(self.target, "snes"), self.wanted)
+		os.symlink(os.path.dirname(self.source), self.other)
+
+	def test_target_filters_links(self):
+		for options in ((), ("--no-index",)):
+			with self.subTest(options=options):
+				code, out, err = self.main("symlinks", self.scan_root, "--target", self.target, *options)
+				self.assertEqual(code, cli.EXIT_OK)
+				self.assertIn(self.wanted, out)
+				self.assertNotIn(self.other, out)
+				self.assertIn("Found 2 symlinks", err)
+
+	def test_lists_every_link_without_target(self):
+		code, out, _ = self.main("symlinks", self.scan_root)
+		self.assertEqual(code, cli.EXIT_OK)
+		self.assertIn(self.wanted, out)
+		self.assertIn(self.other, out)
+
+if __name__ == "__main__":
+	unittest.main()
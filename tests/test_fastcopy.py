@@ -0,0 +1,134 @@
+"""
+	GameVault-Relocator - fastcopy tests
+
+	Copies files between temp dirs with each copy method forced to fail the way it does on
+	filesystems and platforms that lack it, so the fallback to the next method is exercised.
+
+	Usage: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import os
+import sys
+import errno
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from relocator import fastcopy
+from relocator.fastcopy import SMALL_COPY_BYTES, TransferCanceled, copy_file
+
+def unsupported(error):
+	"""A copy method that fails as not supported here"""
+	def method(fin, fout, size, progress):
+		progress(size // 2)
+		fout.write(b"partial")
+		raise OSError(error, os.strerror(error))
+	return method
+
+class CopyTestCase(unittest.TestCase):
+	def setUp(self):
+		fastcopy._unsupported.clear()
+		self.temp_dir = tempfile.mkdtemp(prefix="gvr-test-")
+		self.source = os.path.join(self.temp_dir, "game.iso")
+		self.destination = os.path.join(self.temp_dir, "copy.iso")
+		self.data = os.urandom(SMALL_COPY_BYTES) + b"tail"
+		with open(self.source, "wb") as f:
+			f.write(self.data)
+
+	def tearDown(self):
+		fastcopy._unsupported.clear()
+		shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+	def check_copy(self):
+		with open(self.destination, "rb") as f:
+			self.assertEqual(f.read(), self.data)
+
+class FallbackTests(CopyTestCase):
+	def test_each_method_falls_back_to_the_next(self):
+		names = [name for name, _ in fastcopy.COPY_METHODS]
+		for index, name in enumerate(names[:-1]):
+			for error in (errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTSOCK):
+				with self.subTest(method=name, errno=errno.errorcode[error]):
+					fastcopy._unsupported.clear()
+					methods = [(name, unsupported(error))] + fastcopy.COPY_METHODS[index + 1:]
+					progress = []
+					with mock.patch.object(fastcopy, "COPY_METHODS", methods):
+						used = copy_file(self.source, self.destination, progress_callback=progress.append)
+					self.assertEqual(used, names[index + 1])
+					self.assertEqual(sum(progress), len(self.data))
+					self.check_copy()
+
+	@unittest.skipUnless(fastcopy.CLONE_SUPPORTED, "reflinks are Linux only")
+	def test_reflink_falls_back(self):
+		with mock.patch.object(fastcopy.fcntl, "ioctl", side_effect=OSError(errno.EOPNOTSUPP, "Operation not supported")):
+			used = copy_file(self.source, self.destination, clone=True)
+		self.assertEqual(used, fastcopy.COPY_METHODS[0][0])
+		self.check_copy()
+
+	def test_unsupported_method_is_remembered(self):
+		methods = [("broken", unsupported(errno.ENOSYS))] + fastcopy.COPY_METHODS
+		broken = mock.Mock(wraps=methods[0][1])
+		methods[0] = ("broken", broken)
+		with mock.patch.object(fastcopy, "COPY_METHODS", methods):
+			copy_file(self.source, self.destination)
+			copy_file(self.source, self.destination)
+		self.assertEqual(broken.call_count, 1)
+		self.check_copy()
+
+	@unittest.skipUnless(any(name == "sendfile" for name, _ in fastcopy.COPY_METHODS), "sendfile not used here")
+	def test_sendfile_without_socket_support(self):
+		# macOS and the BSDs only send to sockets
+		methods = [(name, method) for name, method in fastcopy.COPY_METHODS if name != "copy_file_range"]
+		with mock.patch.object(fastcopy, "COPY_METHODS", methods), \
+				mock.patch("os.sendfile", side_effect=OSError(errno.ENOTSOCK, "Socket operation on non-socket")):
+			self.assertEqual(copy_file(self.source, self.destination), "readinto")
+		self.check_copy()
+
+	def test_real_error_is_raised_and_partial_copy_removed(self):
+		methods = [("broken", unsupported(errno.EIO))] + fastcopy.COPY_METHODS
+		with mock.patch.object(fastcopy, "COPY_METHODS", methods):
+			with self.assertRaises(OSError) as raised:
+				copy_file(self.source, self.destination)
+		self.assertEqual(raised.exception.errno, errno.EIO)
+		self.assertFalse(os.path.exists(self.destination))
+
+	def test_cancel_removes_partial_copy(self):
+		with self.assertRaises(TransferCanceled):
+			copy_file(self.source, self.destination, should_cancel=lambda: True)
+		self.assertFalse(os.path.exists(self.destination))
+
+class SmallCopyTests(CopyTestCase):
+	def setUp(self):
+		super().setUp()
+		self.data = b"save" * 100
+		with open(self.source, "wb") as f:
+			f.write(self.data)
+
+	def test_small_copy(self):
+		self.assertEqual(copy_file(self.source, self.destination), "small")
+		self.check_copy()
+		self.assertEqual(os.stat(self.destination).st_mtime_ns, os.stat(self.source).st_mtime_ns)
+
+	def test_read_error_closes_and_removes_destination(self):
+		opened = []
+		real_open = os.open
+		def record_open(path, *args, **kwargs):
+			fd = real_open(path, *args, **kwargs)
+			opened.append(fd)
+			return fd
+
+		with mock.patch("os.open", side_effect=record_open), \
+				mock.patch("os.read", side_effect=OSError(errno.EIO, "Input/output error")):
+			with self.assertRaises(OSError):
+				copy_file(self.source, self.destination)
+		self.assertFalse(os.path.exists(self.destination))
+		self.assertEqual(len(opened), 2)
+		for fd in opened:
+			with self.assertRaises(OSError):
+				os.fstat(fd)
+
+if __name__ == "__main__":
+	unittest.main()
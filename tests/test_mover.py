@@ -0,0 +1,157 @@
+"""
+	GameVault-Relocator - MoveEngine tests
+
+	Moves small trees between temp dirs. is_same_device is forced to False so the native
+	copy-then-delete path runs even when both dirs are on one filesystem.
+
+	Usage: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from relocator import mover
+from relocator.journal import find_resumable_journal
+from relocator.mover import MoveEngine
+from relocator.scanner import COUNT_SKIP_DIRS, scan_tree
+from relocator.symlinker import SourceNotEmpty, remove_source
+
+def write(path, data):
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path, "wb") as f:
+		f.write(data)
+
+def read(path):
+	with open(path, "rb") as f:
+		return f.read()
+
+class MoveTestCase(unittest.TestCase):
+	def setUp(self):
+		self.temp_dir = tempfile.mkdtemp(prefix="gvr-test-")
+		self.source = os.path.join(self.temp_dir, "src", "Game")
+		self.destination = os.path.join(self.temp_dir, "dst", "Game")
+		self.log_dir = os.path.join(self.temp_dir, "logs")
+
+	def tearDown(self):
+		shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+	def engine(self, cross_device=True, **options):
+		"""MoveEngine over a fresh scan of the source, as the GUI and CLI build it"""
+		manifest = scan_tree(self.source)
+		engine = MoveEngine(
+			self.source, self.destination, total_files=manifest.total_files,
+			total_bytes=manifest.total_bytes, manifest=manifest, log_dir=self.log_dir, **options
+		)
+		if cross_device:
+			engine.is_same_device = lambda: False
+		return engine
+
+class SkippedFolderTests(MoveTestCase):
+	def setUp(self):
+		super().setUp()
+		write(os.path.join(self.source, "game.bin"), b"g" * 1000)
+		write(os.path.join(self.source, "InetCache", "save.dat"), b"save")
+		write(os.path.join(self.source, "$Recycle.Bin", "old.dat"), b"old")
+
+	def test_count_skips_but_move_scan_does_not(self):
+		self.assertEqual(scan_tree(self.source, skip_dirs=COUNT_SKIP_DIRS).total_files, 1)
+		self.assertEqual(scan_tree(self.source).total_files, 3)
+
+	def test_native_move_includes_count_skipped_folders(self):
+		engine = self.engine()
+		engine.run()
+		self.assertTrue(engine.completed)
+		self.assertEqual(read(os.path.join(self.destination, "InetCache", "save.dat")), b"save")
+		self.assertEqual(read(os.path.join(self.destination, "$Recycle.Bin", "old.dat")), b"old")
+		remove_source(self.source)
+		self.assertFalse(os.path.exists(self.source))
+
+	def test_files_left_behind_block_completion_and_removal(self):
+		# A manifest that missed a folder, like the count-only scan does
+		manifest = scan_tree(self.source, skip_dirs=COUNT_SKIP_DIRS)
+		engine = MoveEngine(self.source, self.destination, total_files=manifest.total_files,
+							total_bytes=manifest.total_bytes, manifest=manifest, log_dir=self.log_dir)
+		engine.is_same_device = lambda: False
+		engine.run()
+		self.assertFalse(engine.completed)
+		with self.assertRaises(SourceNotEmpty):
+			remove_source(self.source)
+		self.assertEqual(read(os.path.join(self.source, "InetCache", "save.dat")), b"save")
+
+class ResumeTests(MoveTestCase):
+	def setUp(self):
+		super().setUp()
+		self.names = [f"disc{i}.bin" for i in range(6)]
+		for name in self.names:
+			write(os.path.join(self.source, name), name.encode() * 100)
+
+	def test_resume_canceled_move_from_journal(self):
+		engine = self.engine(thread_count=1)
+		move = MoveEngine.move_with_retries
+
+		def move_then_stop(self, src, dest, **kwargs):
+			method = move(self, src, dest, **kwargs)
+			if len(os.listdir(os.path.dirname(dest))) == 2:
+				self.stop()
+			return method
+
+		with mock.patch.object(MoveEngine, "move_with_retries", move_then_stop):
+			engine.run()
+		self.assertFalse(engine.completed)
+		self.assertEqual(len(os.listdir(self.source)), 4)
+
+		journal = find_resumable_journal(self.log_dir, self.source, self.destination)
+		self.assertIsNotNone(journal)
+		# A file copied just before the interruption, whose source was not deleted yet
+		left = sorted(os.listdir(self.source))[0]
+		shutil.copy2(os.path.join(self.source, left), os.path.join(self.destination, left))
+
+		engine = self.engine(resume_journal=journal)
+		engine.run()
+		self.assertTrue(engine.completed)
+		self.assertEqual(os.listdir(self.source), [])
+		for name in self.names:
+			self.assertEqual(read(os.path.join(self.destination, name)), name.encode() * 100)
+		self.assertIsNone(find_resumable_journal(self.log_dir, self.source, self.destination))
+
+class DeltaTests(MoveTestCase):
+	SECOND_NS = 1_700_000_000 * 10 ** 9
+
+	def setUp(self):
+		super().setUp()
+		self.save = os.path.join(self.source, "saves", "slot1.sav")
+		self.copy = os.path.join(self.destination, "saves", "slot1.sav")
+		write(self.save, b"before")
+		os.utime(self.save, ns=(self.SECOND_NS, self.SECOND_NS + 100_000_000))
+
+	def rewrite_within_the_second(self):
+		"""Same size, new data, mtime 0.5 s later but in the same whole second"""
+		write(self.save, b"after!")
+		os.utime(self.save, ns=(self.SECOND_NS, self.SECOND_NS + 600_000_000))
+
+	def test_precopy_picks_up_rewrite_in_the_same_second(self):
+		self.engine(precopy=True).run()
+		self.assertEqual(read(self.copy), b"before")
+		self.rewrite_within_the_second()
+		engine = self.engine(precopy=True)
+		self.assertEqual(engine.count_delta(), (1, 6))
+		engine.run()
+		self.assertEqual(read(self.copy), b"after!")
+
+	def test_fat_destination_allows_two_seconds(self):
+		self.engine(precopy=True).run()
+		os.utime(self.copy, ns=(self.SECOND_NS, self.SECOND_NS + 2_000_000_000))
+		engine = self.engine(precopy=True)
+		self.assertEqual(engine.count_delta(), (1, 6))
+		engine = self.engine(precopy=True)
+		with mock.patch.object(mover, "filesystem_type", lambda path: "exfat"):
+			self.assertEqual(engine.count_delta(), (0, 0))
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,98 @@
+"""
+	GameVault-Relocator - Robocopy log reader tests
+
+	The fixtures are /BYTES /MOVE /NP /R:3 /W:2 logs in Robocopy's layout, one single
+	threaded and one with /MT:8, each with a file that fails on every retry, a file that
+	succeeds on its second attempt and a name starting with "g ".
+
+	Usage: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from relocator.robocopy_log import RobocopyLogTail, parse_line
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+COPIED_BYTES = 1048576 + 2048 + 40976 + 512
+
+def tail_fixture(name, chunk_size=None):
+	"""RobocopyLogTail over a fixture, polled as it grows chunk_size bytes at a time when given"""
+	with open(os.path.join(FIXTURES, name), "rb") as f:
+		data = f.read()
+	chunk_size = chunk_size or len(data)
+	with tempfile.TemporaryDirectory(prefix="gvr-robocopy-") as temp_dir:
+		log_path = os.path.join(temp_dir, name)
+		tail = RobocopyLogTail(log_path, encoding="cp1252", byte_sizes=True)
+		with open(log_path, "wb") as log:
+			for start in range(0, len(data), chunk_size):
+				log.write(data[start:start + chunk_size])
+				log.flush()
+				tail.poll()
+		tail.finish()
+	return tail
+
+class ParseLineTests(unittest.TestCase):
+	def test_bytes_file_line(self):
+		self.assertEqual(parse_line("\t    New File  \t\t     1048576\tbios.bin\r", byte_sizes=True),
+						 ("file", "New File", 1048576, "bios.bin"))
+
+	def test_name_starting_with_unit_letter(self):
+		line = "\t New File \t\t 2048\tg game.zip"
+		self.assertEqual(parse_line(line), ("file", "New File", 2048, "g game.zip"))
+		self.assertEqual(parse_line(line, byte_sizes=True), ("file", "New File", 2048, "g game.zip"))
+
+	def test_unit_sizes_without_bytes(self):
+		self.assertEqual(parse_line("\t    New File  \t\t   1.5 m\tgame.iso"),
+						 ("file", "New File", int(1.5 * 1024 ** 2), "game.iso"))
+		self.assertIsNone(parse_line("\t    New File  \t\t   1.5 m\tgame.iso", byte_sizes=True))
+
+	def test_directory_and_error_lines(self):
+		self.assertEqual(parse_line("\t  New Dir          2\tD:\\Games\\roms\\"), ("dir", "D:\\Games\\roms\\"))
+		self.assertEqual(parse_line("2026/10/17 21:14:03 ERROR 32 (0x00000020) Copying File D:\\a.sav"),
+						 ("error", 32, "Copying File D:\\a.sav"))
+		self.assertIsNone(parse_line("ERROR: RETRY LIMIT EXCEEDED."))
+		self.assertIsNone(parse_line("   Files :         6         4         0         0         1         0"))
+
+class RobocopyLogTailTests(unittest.TestCase):
+	def check_totals(self, tail):
+		self.assertEqual(tail.copied_files, 4)
+		self.assertEqual(tail.copied_bytes, COPIED_BYTES)
+
+	def test_single_threaded_log(self):
+		tail = tail_fixture("robocopy_move.log")
+		self.check_totals(tail)
+		# locked.sav failed all four attempts, protected\ could not be read; retry.sav recovered
+		self.assertEqual(tail.error_count, 2)
+		self.assertEqual(tail.errors, [
+			(32, "Copying File D:\\Games\\Emulation\\saves\\retry.sav"),
+			(32, "Copying File D:\\Games\\Emulation\\saves\\locked.sav"),
+			(5, "Accessing Source Directory D:\\Games\\Emulation\\protected\\"),
+		])
+
+	def test_multithreaded_log(self):
+		tail = tail_fixture("robocopy_move_mt.log")
+		self.check_totals(tail)
+		self.assertEqual(tail.error_count, 1)
+		self.assertEqual(len(tail.errors), 2)
+
+	def test_polling_a_growing_log(self):
+		# Lines split across polls must come out the same as reading the log in one go
+		for name in ("robocopy_move.log", "robocopy_move_mt.log"):
+			whole = tail_fixture(name)
+			grown = tail_fixture(name, chunk_size=37)
+			self.assertEqual((grown.copied_files, grown.copied_bytes, grown.error_count, grown.errors),
+							 (whole.copied_files, whole.copied_bytes, whole.error_count, whole.errors))
+
+	def test_missing_log(self):
+		tail = RobocopyLogTail(os.path.join(FIXTURES, "missing.log"))
+		self.assertEqual(tail.poll(), 0)
+		tail.finish()
+		self.assertEqual((tail.copied_files, tail.error_count), (0, 0))
+
+if __name__ == "__main__":
+	unittest.main()